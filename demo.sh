@@ -2,6 +2,8 @@
 ###############################################################################
 # MotiBeam Weekend Demos - Master Launcher
 # Usage: ./demo.sh [vertical] [duration]
+#        ./demo.sh kiosk [playlist.json]
+#        ./demo.sh kiosk-dry-run [playlist.json]
 # Example: ./demo.sh clinical 60
 ###############################################################################
 
@@ -48,6 +50,14 @@ case "$VERTICAL" in
     education|6)
         run_demo "Education/Learning" "education_demo.py"
         ;;
+    kiosk)
+        # Scheduled playlist with preloaded handoffs (~/.motibeam/playlist.json)
+        python3 motibeam_app.py --kiosk $2
+        ;;
+    kiosk-dry-run)
+        # Simulate a full day's schedule without a display
+        python3 motibeam_app.py --kiosk $2 --dry-run
+        ;;
     all|*)
         echo "🎬 Running ALL 6 Vertical Demos ($DURATION seconds each)"
         echo "========================================="
@@ -7,30 +7,135 @@ Professional boot sequence + menu system + 6 vertical demos
 import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
-import pygame
+from startup_profile import timeline
 
-# Import all scenes
-from boot_screen import BootScreen
-from clinical_demo_enhanced import ClinicalWellnessEnhanced
-from automotive_demo import AutomotiveDemo
-from emergency_demo import EmergencyDemo
-from industrial_demo import IndustrialDemo
-from security_demo import SecurityDemo
-from education_demo import EducationDemo
+import importlib
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+with timeline.phase("import pygame"):
+    import pygame
+
+with timeline.phase("import core modules"):
+    from latency import LatencyTracker
+    from alloc_diag import AllocationTracker
+    from input_map import KeyMap, apply_event_filter
+    from metrics import metrics, start_server
+    from scene_base import MotiBeamScene, load_font
+    from font_stack import fallback_paths
+    from transitions import SceneTransition
+    from playlist import IDLE_SECONDS, Playlist, Preloader, print_schedule
+    from boot_screen import BootScreen
+    from frame_cache import FrameCache, content_hash
+    from effects import EffectsCache, blit_centered
+    from quality import QUALITY_LEVELS, QualityGovernor, enabled as quality_enabled
+
+# Everything the cached boot and menu frames are drawn with (plus the
+# fallback fonts found); editing any of them invalidates the frame cache
+CACHED_FRAME_SOURCES = ["boot_screen.py", "scene_base.py", "font_stack.py",
+                        "text_layout.py", "effects.py", "quality.py"]
+
+# Vertical scenes are imported in the background while the boot screen runs
+VERTICALS = {
+    "clinical": ("clinical_demo_enhanced", "ClinicalWellnessEnhanced"),
+    "education": ("education_demo", "EducationDemo"),
+    "automotive": ("automotive_demo", "AutomotiveDemo"),
+    "emergency": ("emergency_demo", "EmergencyDemo"),
+    "industrial": ("industrial_demo", "IndustrialDemo"),
+    "security": ("security_demo", "SecurityDemo"),
+}
 
 class MotiBeamApp:
     """Main MotiBeam OS Application"""
     
+    # Menu key bindings; override per deployment in ~/.motibeam/keymap.json
+    menu_bindings = {
+        "exit": ["escape"],
+        "clinical": ["1"],
+        "education": ["2"],
+        "automotive": ["3"],
+        "emergency": ["4"],
+        "industrial": ["5"],
+        "security": ["6"],
+        "all": ["a"],
+        "up": ["up"],
+        "down": ["down"],
+        "enter": ["return"],
+    }
+    
     def __init__(self):
-        pygame.init()
+        # Only what the first frame needs; pygame.init() for the remaining
+        # modules runs after the boot screen is up
+        with timeline.phase("pygame display init"):
+            pygame.display.init()
+            pygame.font.init()
         self.width = 1280
         self.height = 720
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
-        pygame.display.set_caption("MotiBeam OS")
-        pygame.mouse.set_visible(False)
+        with timeline.phase("display.set_mode"):
+            self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+            pygame.display.set_caption("MotiBeam OS")
+            pygame.mouse.set_visible(False)
+        
+        # Frames pre-rendered on a previous run go up before fonts load
+        scenes_dir = os.path.dirname(sys.modules[BootScreen.__module__].__file__)
+        self.frame_cache = FrameCache(self.screen.get_size(), content_hash(
+            __file__, *(os.path.join(scenes_dir, name) for name in CACHED_FRAME_SOURCES),
+            extra=":".join(fallback_paths())))
+        if self.frame_cache.open():
+            boot_frame = self.frame_cache.get("boot")
+            if boot_frame is not None:
+                self.screen.blit(boot_frame, (0, 0))
+                pygame.display.flip()
+                timeline.mark("cached boot frame")
         
         self.running = True
         
+        self.menu_keymap = KeyMap.load("MotiBeamApp", self.menu_bindings)
+        
+        # Filled in by the background init thread
+        self.demo_classes = {}
+        self.metrics_server = None
+        self.alert_scene = None
+        self.background = None
+        self.background_error = None
+        
+        # Input-to-photon latency tracking (MOTIBEAM_LATENCY=1)
+        self.latency = LatencyTracker() if os.environ.get('MOTIBEAM_LATENCY') else None
+        
+        # Per-frame allocation and GC accounting (MOTIBEAM_ALLOC=1)
+        self.allocations = None
+        if os.environ.get('MOTIBEAM_ALLOC'):
+            self.allocations = AllocationTracker(sample_every=30)
+            self.allocations.start()
+        
+        # Pre-rendered translucent menu effects
+        self.effects = EffectsCache()
+        
+        # Thermal/load render quality governor (MOTIBEAM_QUALITY=0 disables)
+        self.quality = QualityGovernor() if quality_enabled() else None
+        
+        # Presence-driven low power (MOTIBEAM_POWER=<camera/frame source>),
+        # set up by the background init thread
+        self.power = None
+        
+        # Camera nods and waves for scenes with on_gesture (MOTIBEAM_GESTURES=
+        # <camera/frame source>, camera 0 by default, "off" to disable), set
+        # up by the background init thread. Use a different camera from
+        # MOTIBEAM_POWER: a capture can't be read from two threads
+        self.gestures = None
+        
+        # Motion-sensor inactivity monitoring (MOTIBEAM_GUARDIAN=udp:host:port
+        # or unix:/path), started by the background init thread
+        self.guardian = None
+        
+        # Priority alerts that preempt any scene: app.alerts.send(message),
+        # or datagrams to MOTIBEAM_ALERTS=udp:host:port / unix:/path. Set up
+        # by the background init thread, ready once the boot screen is done
+        self.alerts = None
+        
         # Colors
         self.colors = {
             'black': (0, 0, 0),
@@ -46,16 +151,118 @@ class MotiBeamApp:
         }
         
         # Fonts
-        self.font_huge = pygame.font.Font(None, 140)
-        self.font_large = pygame.font.Font(None, 100)
-        self.font_medium = pygame.font.Font(None, 60)
-        self.font_small = pygame.font.Font(None, 40)
+        with timeline.phase("fonts"):
+            self.font_huge = load_font(140)
+            self.font_large = load_font(100)
+            self.font_medium = load_font(60)
+            self.font_small = load_font(40)
+        
+        # Cross-fade into verticals instead of hard cuts
+        self.clock = pygame.time.Clock()
+        self.transition = SceneTransition(self.screen, self.clock)
         
+    def start_background_init(self):
+        """Import verticals and start services off the main thread"""
+        self.background = threading.Thread(target=self._background_init,
+                                           name="background-init", daemon=True)
+        self.background.start()
+    
+    def _background_init(self):
+        try:
+            self._init_services()
+        except Exception as e:
+            # Re-raised on the main thread by wait_ready()
+            self.background_error = e
+    
+    def _init_services(self):
+        with timeline.phase("import verticals"):
+            for name, (module_name, class_name) in VERTICALS.items():
+                module = importlib.import_module(module_name)
+                self.demo_classes[name] = getattr(module, class_name)
+        # Prometheus metrics (MOTIBEAM_METRICS=9108 or unix:/path)
+        with timeline.phase("metrics server"):
+            self.metrics_server = start_server()
+        power_source = os.environ.get('MOTIBEAM_POWER')
+        if power_source:
+            with timeline.phase("power governor"):
+                from frame_sources import open_source
+                from power import PowerGovernor
+                capture = open_source(power_source, (320, 240))
+                if capture.isOpened():
+                    self.power = PowerGovernor(capture).start()
+                else:
+                    print(f"Power governor disabled: cannot open {power_source}")
+        gesture_source = os.environ.get('MOTIBEAM_GESTURES') or 'device:0'
+        if gesture_source != 'off':
+            with timeline.phase("gesture camera"):
+                self.gestures = self._open_gestures(gesture_source)
+        guardian_address = os.environ.get('MOTIBEAM_GUARDIAN')
+        if guardian_address:
+            with timeline.phase("guardian"):
+                from guardian import HOME_RESIDENTS, HOME_ROOMS, Guardian
+                self.guardian = Guardian(HOME_ROOMS, HOME_RESIDENTS, address=guardian_address).start()
+        with timeline.phase("alert channel"):
+            from alerts import AlertChannel
+            self.alerts = AlertChannel(os.environ.get('MOTIBEAM_ALERTS')).start()
+            self.alert_scene = self.demo_classes["emergency"](standalone=False)
+    
+    def _open_gestures(self, source):
+        try:
+            from frame_sources import open_source
+            from gestures import GestureInput
+        except ImportError:
+            print("Gesture input not available (OpenCV missing)")
+            return None
+        capture = open_source(source, (640, 480))
+        if not capture.isOpened():
+            print(f"⚠️  Camera not available ({source}), gestures disabled")
+            return None
+        return GestureInput(capture)
+    
+    def attach_services(self, demo):
+        """Hand a scene the app's trackers, governors, alerts and camera"""
+        demo.latency = self.latency
+        demo.allocations = self.allocations
+        demo.power = self.power
+        demo.quality = self.quality
+        demo.guardian = self.guardian
+        demo.alerts = self.alerts
+        # One camera shared by every scene that responds to gestures
+        if self.gestures and type(demo).on_gesture is not MotiBeamScene.on_gesture:
+            demo.input_sources.append(self.gestures)
+    
+    def wait_ready(self):
+        """Block until background init is done (starting it if needed)"""
+        if self.background is None:
+            self.start_background_init()
+        self.background.join()
+        if self.background_error:
+            raise RuntimeError("MotiBeam background init failed") from self.background_error
+    
     def show_boot_screen(self):
         """Display boot sequence"""
         boot = BootScreen(standalone=False)
         boot.screen = self.screen
+        
+        # First frame goes up before anything slow happens
+        boot.render()
+        pygame.display.flip()
+        timeline.mark("first frame")
+        if not self.frame_cache.has("boot"):
+            self.frame_cache.put("boot", self.screen)
+            self.frame_cache.save_async()
+        
+        self.start_background_init()
+        with timeline.phase("pygame.init"):
+            pygame.init()
+        boot.start_time = pygame.time.get_ticks()
         boot.run(duration=5)
+        self.wait_ready()
+        if self.alerts and self.alert_scene:
+            self.alerts.prepare(self.alert_scene, self.screen)
+        timeline.mark("boot complete")
+        if os.environ.get('MOTIBEAM_STARTUP'):
+            timeline.report()
         
     def show_main_menu(self):
         """Display main menu and return selection"""
@@ -74,148 +281,274 @@ class MotiBeamApp:
         selected = None
         menu_running = True
         hover_index = 0
+        moves = {"up": -1, "down": 1}
+        apply_event_filter(self.menu_keymap)
+        
+        if not self.frame_cache.has("menu"):
+            menu_frame = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self.render_menu(menu_frame, menu_items, 0, 0.0)
+            self.frame_cache.put("menu", menu_frame)
+            self.frame_cache.save_async()
+        cached = self.frame_cache.get("menu")
+        low_res = None
         
         while menu_running and self.running:
+            if self.alerts and self.alerts.pending():
+                self.alerts.preempt(self.screen, "MainMenu")
+                apply_event_filter(self.menu_keymap)
+            frame_start = time.perf_counter()
+            # Before the events are taken: the governor peeks at them
+            if self.power:
+                self.power.poll()
+            
             # Handle events
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            if self.latency:
+                self.latency.ingest(events)
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                     menu_running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-                        menu_running = False
-                    elif event.key == pygame.K_1:
-                        selected = menu_items[0]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_2:
-                        selected = menu_items[1]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_3:
-                        selected = menu_items[2]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_4:
-                        selected = menu_items[3]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_5:
-                        selected = menu_items[4]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_6:
-                        selected = menu_items[5]["demo"]
-                        menu_running = False
-                    elif event.key == pygame.K_a:
-                        selected = "all"
-                        menu_running = False
-                    elif event.key == pygame.K_UP:
-                        hover_index = (hover_index - 1) % len(menu_items)
-                    elif event.key == pygame.K_DOWN:
-                        hover_index = (hover_index + 1) % len(menu_items)
-                    elif event.key == pygame.K_RETURN:
-                        selected = menu_items[hover_index]["demo"]
-                        menu_running = False
+                    continue
+                action = self.menu_keymap.lookup(event)
+                if action == "exit":
+                    self.running = False
+                    menu_running = False
+                elif action in moves:
+                    hover_index = (hover_index + moves[action]) % len(menu_items)
+                elif action == "enter":
+                    selected = menu_items[hover_index]["demo"]
+                    menu_running = False
+                elif action:
+                    # Vertical name or "all"
+                    selected = action
+                    menu_running = False
             
-            # Render menu
-            self.screen.fill(self.colors['black'])
+            if self.latency:
+                self.latency.mark_update()
             
-            # Animated background elements
-            import math
+            level = self.quality.poll() if self.quality else QUALITY_LEVELS[0]
+            fps = level.fps
+            if self.power:
+                fps = self.power.cap(fps)
+            
+            # Render menu, the first frame straight from the frame cache
             t = pygame.time.get_ticks() / 2000.0
+            if cached is not None and hover_index == 0:
+                self.screen.blit(cached, (0, 0))
+            elif level.scale < 1.0:
+                # Draw small, then stretch to the screen
+                size = (int(self.width * level.scale), int(self.height * level.scale))
+                if low_res is None or low_res.get_size() != size:
+                    low_res = pygame.Surface(size).convert(self.screen)
+                self.render_menu(low_res, menu_items, hover_index, t, level)
+                pygame.transform.scale(low_res, self.screen.get_size(), self.screen)
+            else:
+                self.render_menu(self.screen, menu_items, hover_index, t, level)
+            cached = None
+            
+            if self.latency:
+                self.latency.mark_render()
+            if self.power:
+                self.power.apply(self.screen)
+            pygame.display.flip()
+            if self.latency:
+                self.latency.frame_presented("MainMenu")
+            metrics.frame("MainMenu", time.perf_counter() - frame_start)
+            clock.tick(fps)
+        
+        return selected
+    
+    def render_menu(self, surface, menu_items, hover_index, t, level=None):
+        """Draw one menu frame; t drives the background animation
+        
+        level (a quality.QualityLevel) trims the effects; the layout is
+        scaled to fit surfaces smaller than the screen (render scale).
+        """
+        level = level or QUALITY_LEVELS[0]
+        scale = surface.get_width() / self.width
+        width, height = surface.get_size()
+        
+        def px(value):
+            return int(value * scale)
+        
+        if scale == 1.0:
+            font_huge, font_medium, font_small = self.font_huge, self.font_medium, self.font_small
+        else:
+            font_huge, font_medium, font_small = (load_font(px(size)) for size in (140, 60, 40))
+        
+        surface.fill(self.colors['black'])
+        
+        # Animated translucent background rings (held still at reduced detail)
+        if level.detail > 0:
+            phase = t if level.detail > 1 else 0.0
+            ring = self.effects.ring(px(150), self.colors['cyan'], 20)
             for i in range(4):
                 x = 200 + i * 300
-                y = 360 + int(30 * math.sin(t + i * 0.5))
-                radius = 150
-                pygame.draw.circle(self.screen, (*self.colors['cyan'][:3], 20), (x, y), radius, 2)
-            
-            # Logo with glow effect
-            glow_pulse = 0.8 + 0.2 * abs(math.sin(t * 2))
-            glow_color = tuple(int(c * glow_pulse) for c in self.colors['cyan'])
-            
-            logo = self.font_huge.render("MotiBeam OS", True, glow_color)
-            logo_rect = logo.get_rect(center=(self.width//2, 100))  # Moved up from 120
-            self.screen.blit(logo, logo_rect)
-            
-            # Tagline
-            tagline = self.font_small.render("Multi-Vertical Ambient Computing Platform", True, self.colors['white'])
-            tagline_rect = tagline.get_rect(center=(self.width//2, 180))  # Moved up from 200
-            self.screen.blit(tagline, tagline_rect)
-            
-            # Menu title
-            menu_title = self.font_medium.render("SELECT VERTICAL:", True, self.colors['cyan'])
-            menu_title_rect = menu_title.get_rect(centerx=self.width//2, top=230)  # Moved up from 270
-            self.screen.blit(menu_title, menu_title_rect)
-            
-            # Menu items with symbols - TIGHTER SPACING to fit all 6
-            y_pos = 310  # Starting position moved up from 360
-            y_spacing = 60  # Reduced from 75 to fit all 6 items
-            
-            for i, item in enumerate(menu_items):
-                is_hovered = (i == hover_index)
-                
-                # Highlight box for hovered item
-                if is_hovered:
-                    highlight_rect = pygame.Rect(150, y_pos - 8, self.width - 300, 55)
-                    pygame.draw.rect(self.screen, item['color'], highlight_rect, 3, border_radius=10)
-                
-                # Menu item text with ASCII symbol
-                text = f"{item['key']}. {item['symbol']} {item['name']}"
-                color = item['color'] if is_hovered else self.colors['white']
-                text_surf = self.font_medium.render(text, True, color)
-                text_rect = text_surf.get_rect(centerx=self.width//2, top=y_pos)
-                self.screen.blit(text_surf, text_rect)
-                
-                y_pos += y_spacing
-            
-            # "Run All" option - positioned below all 6 items
-            all_y = y_pos + 10
-            all_text = "A. [ALL] Run All Demos"
-            all_surf = self.font_small.render(all_text, True, self.colors['white'])
-            all_rect = all_surf.get_rect(center=(self.width//2, all_y))
-            self.screen.blit(all_surf, all_rect)
+                y = 360 + int(30 * math.sin(phase + i * 0.5))
+                blit_centered(surface, ring, (px(x), px(y)))
+        
+        # Logo with glow effect
+        glow_pulse = 0.8 + 0.2 * abs(math.sin(t * 2)) if level.detail > 1 else 1.0
+        glow_color = tuple(int(c * glow_pulse) for c in self.colors['cyan'])
+        
+        logo = font_huge.render("MotiBeam OS", True, glow_color)
+        logo_rect = logo.get_rect(center=(width//2, px(100)))  # Moved up from 120
+        if level.detail > 0:
+            glow = self.effects.glow(logo.get_size(), self.colors['cyan'], spread=px(24))
+            blit_centered(surface, glow, logo_rect.center, alpha=int(255 * glow_pulse))
+        surface.blit(logo, logo_rect)
+        
+        # Tagline
+        tagline = font_small.render("Multi-Vertical Ambient Computing Platform", True, self.colors['white'])
+        tagline_rect = tagline.get_rect(center=(width//2, px(180)))  # Moved up from 200
+        surface.blit(tagline, tagline_rect)
+        
+        # Menu title
+        menu_title = font_medium.render("SELECT VERTICAL:", True, self.colors['cyan'])
+        menu_title_rect = menu_title.get_rect(centerx=width//2, top=px(230))  # Moved up from 270
+        surface.blit(menu_title, menu_title_rect)
+        
+        # Menu items with symbols - TIGHTER SPACING to fit all 6
+        y_pos = 310  # Starting position moved up from 360
+        y_spacing = 60  # Reduced from 75 to fit all 6 items
+        
+        for i, item in enumerate(menu_items):
+            is_hovered = (i == hover_index)
             
-            # Footer
-            footer_text = "Press 1-6 or UP/DOWN + ENTER | A for all | ESC to exit"
-            footer_surf = self.font_small.render(footer_text, True, self.colors['gray'])
-            footer_rect = footer_surf.get_rect(center=(self.width//2, self.height - 30))
-            self.screen.blit(footer_surf, footer_rect)
+            # Highlight box for hovered item
+            if is_hovered:
+                highlight_rect = pygame.Rect(px(150), px(y_pos - 8), px(self.width - 300), px(55))
+                pygame.draw.rect(surface, item['color'], highlight_rect, 3, border_radius=px(10))
             
-            # Corner markers
-            corner_size = 30
-            pygame.draw.circle(self.screen, self.colors['cyan'], (corner_size, corner_size), 15)
-            pygame.draw.circle(self.screen, self.colors['cyan'], (self.width - corner_size, corner_size), 15)
-            pygame.draw.circle(self.screen, self.colors['cyan'], (corner_size, self.height - corner_size), 15)
-            pygame.draw.circle(self.screen, self.colors['cyan'], (self.width - corner_size, self.height - corner_size), 15)
+            # Menu item text with ASCII symbol
+            text = f"{item['key']}. {item['symbol']} {item['name']}"
+            color = item['color'] if is_hovered else self.colors['white']
+            text_surf = font_medium.render(text, True, color)
+            text_rect = text_surf.get_rect(centerx=width//2, top=px(y_pos))
+            surface.blit(text_surf, text_rect)
             
-            pygame.display.flip()
-            clock.tick(30)
+            y_pos += y_spacing
+        
+        # "Run All" option - positioned below all 6 items
+        all_y = y_pos + 10
+        all_text = "A. [ALL] Run All Demos"
+        all_surf = font_small.render(all_text, True, self.colors['white'])
+        all_rect = all_surf.get_rect(center=(width//2, px(all_y)))
+        surface.blit(all_surf, all_rect)
+        
+        # Footer
+        footer_text = "Press 1-6 or UP/DOWN + ENTER | A for all | ESC to exit"
+        footer_surf = font_small.render(footer_text, True, self.colors['gray'])
+        footer_rect = footer_surf.get_rect(center=(width//2, height - px(30)))
+        surface.blit(footer_surf, footer_rect)
+        
+        # Corner markers
+        corner_size = px(30)
+        marker_radius = px(15)
+        pygame.draw.circle(surface, self.colors['cyan'], (corner_size, corner_size), marker_radius)
+        pygame.draw.circle(surface, self.colors['cyan'], (width - corner_size, corner_size), marker_radius)
+        pygame.draw.circle(surface, self.colors['cyan'], (corner_size, height - corner_size), marker_radius)
+        pygame.draw.circle(surface, self.colors['cyan'], (width - corner_size, height - corner_size), marker_radius)
         
-        return selected
-    
     def run_demo(self, demo_name):
         """Run selected demo"""
-        demo_map = {
-            "clinical": ClinicalWellnessEnhanced,
-            "education": EducationDemo,
-            "automotive": AutomotiveDemo,
-            "emergency": EmergencyDemo,
-            "industrial": IndustrialDemo,
-            "security": SecurityDemo,
-        }
-        
-        if demo_name in demo_map:
+        self.wait_ready()
+        if demo_name in self.demo_classes:
             print(f"Launching {demo_name} demo...")
-            demo = demo_map[demo_name](standalone=False)
-            demo.screen = self.screen
+            metrics.inc("motibeam_scene_launches_total", scene=demo_name)
+            demo = self.transition.run(lambda: self.demo_classes[demo_name](standalone=False))
+            self.attach_services(demo)
             demo.run(duration=300)  # 5 minutes max
             print(f"{demo_name} demo completed.")
     
     def run_all_demos(self):
         """Run all 6 demos in preferred order"""
-        demos = ["clinical", "education", "automotive", "emergency", "industrial", "security"]
-        for i, demo_name in enumerate(demos):
-            if not self.running:
+        self.run_playlist(Playlist.default(duration=300), loop=False)
+    
+    def run_playlist(self, playlist, loop=True):
+        """Play a kiosk playlist, preloading each next item
+        
+        Items run for an exact number of frames (including the cross-fade)
+        and the next scene is built and pre-rendered while the current one
+        plays. ESC skips ahead when loop is False and ends the playlist
+        otherwise. When looping and nothing is scheduled (a gap between
+        time-of-day windows) the kiosk idles on a blank screen until an
+        item is active again, as Playlist.simulate does.
+        """
+        self.wait_ready()
+        fade_frames = self.transition.frames()
+        item = playlist.next_item(datetime.now())
+        plays = 0
+        demo = None
+        first_frame = None
+        preloader = None
+        
+        while self.running:
+            if item is None:
+                if not loop or not self.idle(IDLE_SECONDS):
+                    break
+                demo = None
+                item = playlist.next_item(datetime.now())
+                continue
+            plays += 1
+            print(f"Playlist {plays}: {item.demo} ({item.duration}s)")
+            metrics.inc("motibeam_scene_launches_total", scene=item.demo)
+            if demo is None:
+                demo = self.transition.run(lambda cls=self.demo_classes[item.demo]: cls(standalone=False))
+            else:
+                demo = self.transition.crossfade(demo, first_frame)
+            self.attach_services(demo)
+            
+            # Safety-critical scenes keep their own paced rate
+            if not demo.safety_critical:
+                demo.fps = playlist.fps
+            
+            # Pick and start building the next item before this one plays.
+            # Frames give exact handoffs; the seconds bound the item when
+            # the quality or power governor caps the frame rate
+            frames = max(1, item.frames(demo.fps) - fade_frames)
+            seconds = frames / demo.fps
+            next_item = None
+            if loop or plays < len(playlist.items):
+                ends_at = datetime.now() + timedelta(seconds=item.duration)
+                next_item = playlist.next_item(ends_at)
+            preloader = None
+            if next_item:
+                factory = lambda cls=self.demo_classes[next_item.demo]: cls(standalone=False)
+                preloader = Preloader(factory, self.screen, frames, seconds)
+                demo.background_tasks.append(preloader)
+            
+            demo.run(duration=seconds, frames=frames)
+            if loop and demo.frames_presented < frames and not demo.timed_out:
                 break
-            print(f"Running demo {i+1}/6: {demo_name}")
-            self.run_demo(demo_name)
+            
+            item = next_item
+            if preloader:
+                demo, first_frame = preloader.take()
+                preloader = None
+        
+        if preloader:
+            # Ended early: the next scene was built but will never run
+            preloader.take()[0].close()
+    
+    def idle(self, seconds, fps=2):
+        """Blank, low-rate screen for up to seconds; False if ESC or quit"""
+        print(f"Playlist idle: nothing scheduled, checking again in {seconds}s")
+        clock = pygame.time.Clock()
+        apply_event_filter(self.menu_keymap)
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            if self.alerts and self.alerts.pending():
+                self.alerts.preempt(self.screen, "PlaylistIdle")
+                apply_event_filter(self.menu_keymap)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or self.menu_keymap.lookup(event) == "exit":
+                    return False
+            self.screen.fill(self.colors['black'])
+            pygame.display.flip()
+            clock.tick(fps)
+        return True
     
     def run(self):
         """Main application loop"""
@@ -239,7 +572,24 @@ class MotiBeamApp:
             else:
                 continue
         
-        # Cleanup
+        self.shutdown()
+    
+    def shutdown(self):
+        """Stop services, print reports and close the display"""
+        if self.latency:
+            self.latency.report()
+        if self.allocations:
+            self.allocations.report()
+        if self.power:
+            self.power.stop()
+            self.power.report()
+        if self.guardian:
+            self.guardian.stop()
+        if self.gestures:
+            self.gestures.capture.release()
+        if self.alerts:
+            self.alerts.report()
+            self.alerts.stop()
         pygame.quit()
         print("MotiBeam OS shutdown complete.")
 
@@ -248,5 +598,21 @@ if __name__ == "__main__":
     print("Starting MotiBeam OS v3.0")
     print("Multi-Vertical Ambient Computing Platform")
     print("=" * 60)
-    app = MotiBeamApp()
-    app.run()
+    
+    # Kiosk mode: motibeam_app.py --kiosk [playlist.json] [--dry-run]
+    if "--kiosk" in sys.argv:
+        args = [a for a in sys.argv[1:] if not a.startswith("--")]
+        playlist = Playlist.load(*args[:1])
+        if "--dry-run" in sys.argv:
+            midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            print_schedule(playlist.simulate(midnight, hours=24))
+            sys.exit(0)
+        app = MotiBeamApp()
+        app.show_boot_screen()
+        try:
+            app.run_playlist(playlist)
+        finally:
+            app.shutdown()
+    else:
+        app = MotiBeamApp()
+        app.run()
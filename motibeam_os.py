@@ -5,34 +5,82 @@ Hostname: motibeamOS | User: motibeam
 Six Vertical Ambient Computing Platform
 """
 
-import pygame
-import cv2
-import numpy as np
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+from startup_profile import timeline
+
+with timeline.phase("import pygame"):
+    import pygame
+    from pygame.locals import *
 import time
 import os
-from pygame.locals import *
+import threading
+
+from metrics import metrics, start_server
+import text_layout
 
 # Initialize Pygame for projection
-pygame.init()
-screen = pygame.display.set_mode((1280, 720))  # Remove FULLSCREEN for testing
-pygame.display.set_caption("MotiBeam OS - Ambient Computing")
-pygame.mouse.set_visible(False)
-
-# Try to initialize camera (may not work on Mac, but will on Pi)
-try:
-    camera = cv2.VideoCapture(0)
-    camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-    CAMERA_AVAILABLE = True
-    print("✅ Camera initialized")
-except:
-    CAMERA_AVAILABLE = False
-    print("⚠️  Camera not available (will work on Pi)")
+with timeline.phase("pygame.init"):
+    pygame.init()
+with timeline.phase("display.set_mode"):
+    screen = pygame.display.set_mode((1280, 720))  # Remove FULLSCREEN for testing
+    pygame.display.set_caption("MotiBeam OS - Ambient Computing")
+    pygame.mouse.set_visible(False)
 
 # Font setup
-font_large = pygame.font.Font(None, 74)
-font_medium = pygame.font.Font(None, 48)
-font_small = pygame.font.Font(None, 36)
+with timeline.phase("fonts"):
+    font_large = pygame.font.Font(None, 74)
+    font_medium = pygame.font.Font(None, 48)
+    font_small = pygame.font.Font(None, 36)
+
+# Put something on the projector before the slow OpenCV/camera startup
+screen.fill((0, 0, 30))
+boot_surf = font_large.render("MotiBeam OS - Starting...", True, (255, 255, 255))
+screen.blit(boot_surf, boot_surf.get_rect(center=screen.get_rect().center))
+pygame.display.flip()
+timeline.mark("first frame")
+
+# Prometheus metrics if MOTIBEAM_METRICS is set (port or unix:/path)
+start_server()
+
+# Camera, OpenCV and calibration come up in the background
+camera = None
+CAMERA_AVAILABLE = False
+calibration = None
+
+def init_camera():
+    """Import OpenCV, open the camera and load the cached calibration"""
+    global cv2, np, camera, calibration, CAMERA_AVAILABLE, env_activity, to_gray
+    with timeline.phase("import cv2/numpy"):
+        import cv2
+        import numpy as np
+        from frame_sources import env_activity, to_gray
+    
+    # Try to initialize camera (may not work on Mac, but will on Pi)
+    with timeline.phase("camera open"):
+        try:
+            camera = cv2.VideoCapture(0)
+            camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            print("✅ Camera initialized")
+        except:
+            camera = None
+            print("⚠️  Camera not available (will work on Pi)")
+            return
+    
+    # Load cached camera-to-projector calibration (press C to recalibrate)
+    from calibration import load_calibration
+    calibration = load_calibration(screen.get_size(), (640, 480))
+    if calibration:
+        print(f"✅ Calibration loaded (error {calibration.error:.2f}px)")
+    else:
+        print("⚠️  No calibration cached - press C to calibrate")
+    CAMERA_AVAILABLE = True
+    timeline.mark("camera ready")
+
+camera_thread = threading.Thread(target=init_camera, name="camera-init", daemon=True)
+camera_thread.start()
 
 # Demo States - All Six Verticals
 DEMOS = [
@@ -48,15 +96,31 @@ current_demo_index = 0
 def get_sensor_data():
     """Get camera data for environment sensing"""
     if not CAMERA_AVAILABLE:
+        if camera_thread.is_alive():
+            return "Env: Camera starting..."
         return "Env: Camera Ready on Pi"
     
     ret, frame = camera.read()
     if ret:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        activity = np.std(gray)
+        metrics.camera_frame()
+        activity = env_activity(to_gray(frame))
         return f"Env Activity: {activity:.2f}"
     return "Env: Sensing Ready"
 
+def run_calibration():
+    """Project marker patterns and solve the camera homography"""
+    global calibration
+    if not CAMERA_AVAILABLE:
+        print("⚠️  Calibration needs a camera")
+        return
+    print("🎯 Calibrating projector...")
+    from calibration import CalibrationScene
+    scene = CalibrationScene(camera, standalone=False)
+    scene.screen = screen
+    scene.run(duration=30)
+    if scene.result:
+        calibration = scene.result
+
 def draw_demo_screen(demo_name, instructions, status=""):
     """Draw professional demo interface"""
     screen.fill((0, 0, 30))  # Dark blue background
@@ -70,13 +134,17 @@ def draw_demo_screen(demo_name, instructions, status=""):
     
     # Demo content
     y_offset = 120
+    max_width = screen.get_width() - 80
     for line in instructions:
-        instr_surf = font_medium.render(line, True, (200, 230, 255))
-        screen.blit(instr_surf, (screen.get_width()//2 - instr_surf.get_width()//2, y_offset))
-        y_offset += 50
+        # Long lines wrap onto a second line rather than run off screen
+        for part in text_layout.wrap(font_medium, line, max_width, max_lines=2):
+            instr_surf = font_medium.render(part, True, (200, 230, 255))
+            screen.blit(instr_surf, (screen.get_width()//2 - instr_surf.get_width()//2, y_offset))
+            y_offset += 50
     
     # Status bar
     if status:
+        status = text_layout.ellipsize(font_small, status, screen.get_width() - 40)
         status_surf = font_small.render(status, True, (100, 255, 100))
         screen.blit(status_surf, (20, screen.get_height() - 40))
     
@@ -175,9 +243,12 @@ print("📍 Hostname: motibeamOS | User: motibeam")
 print("📊 Verticals: Clinical, Automotive, Maritime, Enterprise, Security, Education")
 print("="*50)
 print("Press SPACEBAR to cycle through demos")
+print("Press C to calibrate camera")
 print("Press Q to quit")
 print("="*50)
 
+report_startup = bool(os.environ.get('MOTIBEAM_STARTUP'))
+
 running = True
 while running:
     for event in pygame.event.get():
@@ -189,9 +260,17 @@ while running:
             elif event.key == K_SPACE:
                 current_demo_index = (current_demo_index + 1) % len(DEMOS)
                 print(f"🔄 Switching to: {DEMOS[current_demo_index]}")
+                metrics.inc("motibeam_scene_switches_total", scene=DEMOS[current_demo_index])
+            elif event.key == K_c:
+                run_calibration()
     
     # Run current demo
+    frame_start = time.perf_counter()
     DEMO_FUNCTIONS[current_demo_index]()
+    if report_startup and not camera_thread.is_alive():
+        timeline.report()
+        report_startup = False
+    metrics.frame(DEMOS[current_demo_index], time.perf_counter() - frame_start)
     time.sleep(0.05)
 
 # Cleanup
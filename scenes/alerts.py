@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Priority Alerts
+An alert channel that takes the projector away from whatever is running.
+Alerts come from other threads (AlertChannel.send) or as text datagrams
+on a local socket: "ALERT <message>" raises one, "CLEAR" ends it.
+
+Scenes check the channel at the top of every frame, so an alert is on
+screen within one frame of the running scene (1 / fps plus that frame's
+work). The alert scene is built and its first frame rendered before any
+alert arrives, so taking over is a single blit and flip. The alert scene
+then runs until cleared, dismissed (ESC) or timed out, and the preempted
+scene carries on where it left off.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+
+import pygame
+
+from guardian import open_socket, parse_address
+from metrics import metrics
+from transitions import render_offscreen
+
+ALERT_SECONDS = 120  # an alert scene ends after this unless cleared sooner
+
+
+class Alert:
+    __slots__ = ('message', 'source', 'raised', 'clears')
+
+    def __init__(self, message, source, raised, clears):
+        self.message = message
+        self.source = source    # "api" or "socket"
+        self.raised = raised    # perf_counter when received
+        self.clears = clears    # AlertChannel.clears when received
+
+
+class AlertWatcher:
+    """Background task of the alert scene: ends it on CLEAR, swaps in newer alerts"""
+
+    def __init__(self, channel, scene):
+        self.channel = channel
+        self.scene = scene
+
+    def poll(self):
+        alert = self.scene.alert
+        if alert and self.channel.clears > alert.clears:
+            self.scene.running = False
+        elif self.channel.queue:
+            # A newer alert replaces the message and restarts the timeout
+            self.scene.alert = self.channel.queue.popleft()
+            self.scene.start_time = pygame.time.get_ticks()
+            self.channel.shown(self.scene.alert, self.scene.__class__.__name__)
+
+
+class AlertChannel:
+    """Pending alerts plus the pre-rendered scene that shows them"""
+
+    def __init__(self, address=None, seconds=ALERT_SECONDS, history=200):
+        self.address = address
+        self.seconds = seconds
+        self.queue = deque()
+        self.clears = 0
+        self._lock = threading.Lock()
+        self.scene = None
+        self.first_frame = None
+        self.latencies = deque(maxlen=history)
+        self.sock = open_socket(address) if address else None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def send(self, message="", source="api"):
+        """Raise an alert; safe from any thread"""
+        self.queue.append(Alert(message, source, time.perf_counter(), self.clears))
+
+    def clear(self):
+        """End the alert on screen and drop any still queued"""
+        with self._lock:
+            self.clears += 1
+            self.queue.clear()
+
+    def pending(self):
+        return bool(self.queue) and self.scene is not None
+
+    def prepare(self, scene, screen):
+        """Adopt a built alert scene and render its first frame ahead of time
+
+        Scenes with a simulated drill (EmergencyDemo) have it switched off:
+        a real alert must never route around invented hazards.
+        """
+        self.scene = scene
+        scene.alert = None
+        if hasattr(scene, 'drill'):
+            scene.drill = False
+            scene.update()
+        scene.background_tasks.append(AlertWatcher(self, scene))
+        self.first_frame = render_offscreen(scene, screen)
+        return self
+
+    def preempt(self, screen, scene_name):
+        """Show pending alerts on screen until cleared; blocks like a scene run()"""
+        scene = self.scene
+        scene.alert = self.queue.popleft()
+        screen.blit(self.first_frame, (0, 0))
+        pygame.display.flip()
+        self.shown(scene.alert, scene_name)
+
+        scene.screen = screen
+        scene.running = True
+        scene.start_time = pygame.time.get_ticks()
+        scene.run(duration=self.seconds)
+        scene.alert = None
+        self.first_frame = render_offscreen(scene, screen)
+
+    def shown(self, alert, scene_name):
+        latency = time.perf_counter() - alert.raised
+        self.latencies.append(latency)
+        metrics.inc("motibeam_alerts_total", source=alert.source)
+        metrics.set("motibeam_alert_preempt_ms", round(latency * 1000, 2), scene=scene_name)
+        print(f"🚨 Alert over {scene_name} after {latency * 1000:.1f} ms: {alert.message or 'EMERGENCY'}")
+
+    def start(self):
+        """Listen for ALERT / CLEAR datagrams on a daemon thread"""
+        if self.sock is None:
+            return self
+
+        def loop():
+            while not self._stop.is_set():
+                readable, _, _ = select.select([self.sock], [], [], 0.5)
+                while readable:
+                    try:
+                        data = self.sock.recv(4096)
+                    except BlockingIOError:
+                        break
+                    self._handle(data)
+        self._thread = threading.Thread(target=loop, name="alerts", daemon=True)
+        self._thread.start()
+        print(f"Alert channel listening on {self.address}")
+        return self
+
+    def _handle(self, data):
+        command, _, message = data.decode("utf-8", "replace").strip().partition(" ")
+        command = command.upper()
+        if command == "ALERT":
+            self.send(message.strip(), source="socket")
+        elif command == "CLEAR":
+            self.clear()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self.sock is not None:
+            self.sock.close()
+            if self.address.startswith("unix:"):
+                try:
+                    os.unlink(self.address[5:])
+                except OSError:
+                    pass
+
+    def bound_address(self):
+        """The address senders should use (resolves udp port 0)"""
+        if self.sock is not None and self.sock.family == socket.AF_INET:
+            host, port = self.sock.getsockname()
+            return f"udp:{host}:{port}"
+        return self.address
+
+    def report(self):
+        if not self.latencies:
+            return
+        ms = sorted(latency * 1000 for latency in self.latencies)
+        print(f"Alert preemption: {len(ms)} alerts, p50 {ms[len(ms) // 2]:.1f} ms, "
+              f"p95 {ms[min(len(ms) - 1, int(len(ms) * 0.95))]:.1f} ms, max {ms[-1]:.1f} ms")
+
+
+def send_alert(address, message=None):
+    """Send ALERT <message> (or CLEAR when message is None) to a channel"""
+    family, target = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    try:
+        text = "CLEAR" if message is None else f"ALERT {message}"
+        sock.sendto(text.encode("utf-8"), target)
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    # python3 alerts.py udp:host:port "message" | udp:host:port --clear
+    # python3 alerts.py --bench [alerts]: preempt a running scene over loopback
+    if len(sys.argv) > 1 and sys.argv[1] != "--bench":
+        send_alert(sys.argv[1], None if sys.argv[2:] == ["--clear"] else " ".join(sys.argv[2:]))
+        sys.exit(0)
+
+    import random
+
+    from emergency_demo import EmergencyDemo
+    from industrial_demo import IndustrialDemo
+
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    channel = AlertChannel("udp:127.0.0.1:0", seconds=1).start()
+    channel.prepare(EmergencyDemo(standalone=False), screen)
+    address = channel.bound_address()
+
+    def fire():
+        rng = random.Random(2)
+        for i in range(count):
+            time.sleep(rng.uniform(1.5, 2.5))
+            send_alert(address, f"Drill {i + 1}")
+    threading.Thread(target=fire, daemon=True).start()
+
+    demo = IndustrialDemo(standalone=False)
+    demo.screen = screen
+    demo.alerts = channel
+    demo.run(duration=count * 2.2 + 2)
+    channel.report()
+    channel.stop()
+    pygame.quit()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Allocation Diagnostics
+Attributes Python heap allocations and GC pauses to scenes and frames
+using tracemalloc and gc callbacks, with per-scene allocation budgets.
+
+The per-frame figure is peak growth: how far the traced heap rose above
+its size at the start of the frame. It is a high-water mark, not a
+count of bytes allocated. A frame that allocates and frees the same
+buffer ten times shows one buffer. Budgets are in the same units, so a
+budget bounds how much extra memory a frame needs at once.
+
+tracemalloc only sees the Python allocator: Surface and Rect objects are
+counted, but SDL's pixel buffers behind a Surface are not.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import gc
+import heapq
+import time
+import tracemalloc
+from collections import Counter
+
+
+class SceneAllocations:
+    """Per-scene allocation and GC totals"""
+
+    def __init__(self):
+        self.frames = 0
+        self.peak_growth = 0      # sum over frames of peak bytes above frame start
+        self.max_peak_growth = 0
+        self.retained = 0         # net bytes still live at frame end
+        self.gc_count = 0
+        self.gc_time = 0.0
+        self.gc_max = 0.0
+        self.gc_collected = 0
+        self.worst_frames = []    # heap of (bytes, frame number)
+        self.sites = Counter()    # "file:line" -> retained bytes (sampled)
+
+    def mean_peak_growth(self):
+        return self.peak_growth / self.frames if self.frames else 0
+
+
+class AllocationTracker:
+    """Frame-by-frame allocation accounting
+
+    Call begin_frame(scene) at the top of a frame and end_frame() after
+    it is presented. sample_every > 0 also diffs tracemalloc snapshots on
+    every Nth frame to find the lines that retain memory.
+    """
+
+    WORST_FRAMES = 5
+
+    def __init__(self, budgets=None, sample_every=0, nframes=1):
+        self.budgets = dict(budgets or {})  # scene -> mean peak growth bytes per frame
+        self.sample_every = sample_every
+        self.nframes = nframes
+        self.scenes = {}
+        self.scene = None
+        self.frame = 0
+        self.frame_base = 0
+        self.snapshot = None
+        self.gc_start = None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+        gc.callbacks.append(self._gc_callback)
+
+    def stop(self):
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+        tracemalloc.stop()
+
+    def _stats(self, scene):
+        stats = self.scenes.get(scene)
+        if stats is None:
+            stats = self.scenes[scene] = SceneAllocations()
+        return stats
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self.gc_start = time.perf_counter()
+            return
+        if self.gc_start is None or self.scene is None:
+            return
+        pause = time.perf_counter() - self.gc_start
+        self.gc_start = None
+        stats = self._stats(self.scene)
+        stats.gc_count += 1
+        stats.gc_time += pause
+        stats.gc_max = max(stats.gc_max, pause)
+        stats.gc_collected += info.get("collected", 0)
+
+    def begin_frame(self, scene):
+        self.scene = scene
+        self.frame += 1
+        if self.sample_every and self.frame % self.sample_every == 0:
+            self.snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        self.frame_base = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self):
+        current, peak = tracemalloc.get_traced_memory()
+        growth = max(0, peak - self.frame_base)
+        stats = self._stats(self.scene)
+        stats.frames += 1
+        stats.peak_growth += growth
+        stats.max_peak_growth = max(stats.max_peak_growth, growth)
+        stats.retained += current - self.frame_base
+
+        entry = (growth, self.frame)
+        if len(stats.worst_frames) < self.WORST_FRAMES:
+            heapq.heappush(stats.worst_frames, entry)
+        else:
+            heapq.heappushpop(stats.worst_frames, entry)
+
+        if self.snapshot is not None:
+            # Leave out the diagnostics' own bookkeeping
+            ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+                      tracemalloc.Filter(False, __file__)]
+            after = tracemalloc.take_snapshot().filter_traces(ignore)
+            before = self.snapshot.filter_traces(ignore)
+            for diff in after.compare_to(before, "lineno")[:10]:
+                if diff.size_diff > 0:
+                    frame = diff.traceback[0]
+                    stats.sites[f"{frame.filename}:{frame.lineno}"] += diff.size_diff
+            self.snapshot = None
+
+    def over_budget(self):
+        """[(scene, mean peak growth per frame, budget)] for scenes over budget"""
+        violations = []
+        for scene, budget in self.budgets.items():
+            stats = self.scenes.get(scene)
+            if stats and stats.mean_peak_growth() > budget:
+                violations.append((scene, stats.mean_peak_growth(), budget))
+        return violations
+
+    def assert_budgets(self):
+        """Raise AssertionError if any scene exceeded its budget"""
+        violations = self.over_budget()
+        if violations:
+            detail = ", ".join(f"{scene} {mean / 1024:.1f}KB > {budget / 1024:.1f}KB"
+                               for scene, mean, budget in violations)
+            raise AssertionError(f"Peak growth budget exceeded: {detail}")
+
+    def report(self):
+        print("=" * 60)
+        print("Per-frame Python heap peak growth (high-water above frame start)")
+        print(f"{'scene':28} {'frames':>6} {'mean KB':>8} {'max KB':>8} "
+              f"{'gc':>4} {'gc ms':>7} {'gc max':>7}")
+        for scene, stats in sorted(self.scenes.items()):
+            print(f"{scene:28} {stats.frames:6d} {stats.mean_peak_growth() / 1024:8.1f} "
+                  f"{stats.max_peak_growth / 1024:8.1f} {stats.gc_count:4d} "
+                  f"{stats.gc_time * 1000:7.2f} {stats.gc_max * 1000:7.2f}")
+            worst = ", ".join(f"#{n} {size / 1024:.1f}KB"
+                              for size, n in sorted(stats.worst_frames, reverse=True))
+            print(f"{'':28} worst frames: {worst}")
+            if stats.retained > 0:
+                print(f"{'':28} retained: {stats.retained / 1024:.1f}KB")
+            for site, size in stats.sites.most_common(3):
+                print(f"{'':28} {size / 1024:7.1f}KB {site}")
+        for scene, mean, budget in self.over_budget():
+            print(f"⚠️  {scene} over budget: {mean / 1024:.1f}KB/frame peak growth > {budget / 1024:.1f}KB")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Benchmark: SDL_VIDEODRIVER=dummy python3 alloc_diag.py <scene> [frames] [peak growth budget KB]
+    import importlib
+
+    scenes = {
+        "clinical": ("clinical_demo_enhanced", "ClinicalWellnessEnhanced"),
+        "education": ("education_demo", "EducationDemo"),
+        "automotive": ("automotive_demo", "AutomotiveDemo"),
+        "emergency": ("emergency_demo", "EmergencyDemo"),
+        "industrial": ("industrial_demo", "IndustrialDemo"),
+        "security": ("security_demo", "SecurityDemo"),
+    }
+    name = sys.argv[1] if len(sys.argv) > 1 else "industrial"
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    module_name, class_name = scenes[name]
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+
+    budgets = {}
+    if len(sys.argv) > 3:
+        budgets[class_name] = float(sys.argv[3]) * 1024
+    tracker = AllocationTracker(budgets, sample_every=30)
+    demo = scene_class(standalone=True)
+    demo.allocations = tracker
+    demo.fps = 1000  # run flat out; we are measuring allocations, not pacing
+    tracker.start()
+    demo.run(frames=frames)
+    tracker.stop()
+    tracker.report()
+    try:
+        tracker.assert_budgets()
+    except AssertionError as e:
+        sys.exit(str(e))
@@ -10,12 +10,16 @@ from scene_base import MotiBeamScene
 import pygame
 
 class AutomotiveDemo(MotiBeamScene):
+    safety_critical = True
+    
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Automotive Safety", standalone=standalone)
         self.animation_offset = 0
         
     def update(self):
-        self.animation_offset = (self.animation_offset + 5) % 100
+        # Arrows sweep at 150 px/s from the clock, whatever the frame rate
+        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
+        self.animation_offset = int(elapsed * 150) % 100
         
     def render(self):
         self.screen.fill(self.colors['black'])
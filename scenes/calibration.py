@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Camera-to-Projector Calibration
+Projects corner marker patterns, finds them in camera frames and
+solves the camera -> projector homography. Result is cached to disk.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import json
+import os
+
+import cv2
+import numpy as np
+import pygame
+
+from scene_base import MotiBeamScene
+
+CALIBRATION_FILE = os.path.expanduser("~/.motibeam/calibration.json")
+
+# Same geometry as MotiBeamScene.draw_corner_markers
+MARKER_OFFSET = 30
+MARKER_RADIUS = 15
+
+# Each pattern is a quad of markers inset from the corners by a fraction
+# of the screen. Inset 0.0 is exactly the normal corner markers.
+PATTERN_INSETS = [0.0, 0.25]
+
+
+def marker_positions(width, height, inset=0.0):
+    """Projector coordinates of one marker pattern (TL, TR, BL, BR)"""
+    dx = MARKER_OFFSET + int((width / 2 - MARKER_OFFSET) * inset)
+    dy = MARKER_OFFSET + int((height / 2 - MARKER_OFFSET) * inset)
+    return [
+        (dx, dy),
+        (width - dx, dy),
+        (dx, height - dy),
+        (width - dx, height - dy),
+    ]
+
+
+def order_quad(points):
+    """Order four points as TL, TR, BL, BR (draw_corner_markers order)"""
+    pts = sorted(points, key=lambda p: p[0] + p[1])
+    tl, br = pts[0], pts[-1]
+    middle = pts[1:3]
+    # Of the remaining two, top-right has the larger x - y
+    if middle[0][0] - middle[0][1] > middle[1][0] - middle[1][1]:
+        tr, bl = middle
+    else:
+        bl, tr = middle
+    return [tl, tr, bl, br]
+
+
+class MarkerDetector:
+    """Finds bright projected markers in a camera frame"""
+
+    def __init__(self, expected=4, threshold=60, min_area=12, blur=5):
+        self.expected = expected
+        self.threshold = threshold
+        self.min_area = min_area
+        self.blur = blur
+
+    def _gray(self, frame):
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+    def detect(self, frame, background=None):
+        """Return marker centroids ordered TL, TR, BL, BR, or None"""
+        gray = self._gray(frame)
+        if background is not None:
+            # Subtract a frame of the blank projection to remove room light
+            gray = cv2.subtract(gray, self._gray(background))
+        if self.blur:
+            gray = cv2.GaussianBlur(gray, (self.blur, self.blur), 0)
+
+        _, mask = cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY)
+        count, _, stats, centroids = cv2.connectedComponentsWithStats(mask)
+
+        # Label 0 is the background; keep the largest blobs
+        blobs = []
+        for label in range(1, count):
+            area = stats[label, cv2.CC_STAT_AREA]
+            if area >= self.min_area:
+                blobs.append((area, tuple(centroids[label])))
+        if len(blobs) < self.expected:
+            return None
+        blobs.sort(reverse=True)
+        points = [pt for _, pt in blobs[:self.expected]]
+        return order_quad(points)
+
+
+class Calibration:
+    """Camera -> projector homography for one resolution pair"""
+
+    def __init__(self, homography, projector_size, camera_size, error=0.0):
+        self.homography = np.asarray(homography, dtype=np.float64)
+        self.projector_size = tuple(projector_size)
+        self.camera_size = tuple(camera_size)
+        self.error = error
+
+    def camera_to_projector(self, points):
+        """Map camera pixel coordinates onto the projected image"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 1, 2)
+        return cv2.perspectiveTransform(pts, self.homography).reshape(-1, 2)
+
+    def projector_to_camera(self, points):
+        """Map projected image coordinates into the camera frame"""
+        pts = np.asarray(points, dtype=np.float32).reshape(-1, 1, 2)
+        inverse = np.linalg.inv(self.homography)
+        return cv2.perspectiveTransform(pts, inverse).reshape(-1, 2)
+
+    def matches(self, projector_size, camera_size):
+        return (self.projector_size == tuple(projector_size)
+                and self.camera_size == tuple(camera_size))
+
+    def save(self, path=CALIBRATION_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            "homography": self.homography.tolist(),
+            "projector_size": list(self.projector_size),
+            "camera_size": list(self.camera_size),
+            "error": self.error,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=CALIBRATION_FILE):
+        """Load cached calibration, or None if missing/corrupt"""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return cls(data["homography"], data["projector_size"],
+                       data["camera_size"], data.get("error", 0.0))
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def solve_homography(camera_points, projector_points, projector_size, camera_size):
+    """Solve camera -> projector homography from matched marker points"""
+    src = np.asarray(camera_points, dtype=np.float32)
+    dst = np.asarray(projector_points, dtype=np.float32)
+    if len(src) < 4:
+        return None
+    method = cv2.RANSAC if len(src) > 4 else 0
+    homography, _ = cv2.findHomography(src, dst, method, 3.0)
+    if homography is None:
+        return None
+
+    mapped = cv2.perspectiveTransform(src.reshape(-1, 1, 2), homography).reshape(-1, 2)
+    error = float(np.mean(np.linalg.norm(mapped - dst, axis=1)))
+    return Calibration(homography, projector_size, camera_size, error)
+
+
+def calibrate_from_frames(frames, projector_size, camera_size, background=None,
+                          detector=None, insets=PATTERN_INSETS):
+    """Solve calibration from one captured frame per pattern inset
+
+    Works on live captures as well as recorded or synthetic images.
+    """
+    detector = detector or MarkerDetector()
+    width, height = projector_size
+    camera_points = []
+    projector_points = []
+    for frame, inset in zip(frames, insets):
+        found = detector.detect(frame, background)
+        if found is None:
+            print(f"Calibration: markers not found for inset {inset}")
+            continue
+        camera_points.extend(found)
+        projector_points.extend(marker_positions(width, height, inset))
+    return solve_homography(camera_points, projector_points, projector_size, camera_size)
+
+
+def synthetic_frame(homography, projector_size, camera_size, inset=0.0, noise=0):
+    """Render what the camera would see for one pattern (for testing)
+
+    homography maps projector -> camera coordinates.
+    """
+    cam_w, cam_h = camera_size
+    frame = np.zeros((cam_h, cam_w, 3), dtype=np.uint8)
+    if inset is not None:
+        pts = np.asarray(marker_positions(*projector_size, inset=inset),
+                         dtype=np.float32).reshape(-1, 1, 2)
+        warped = cv2.perspectiveTransform(pts, np.asarray(homography)).reshape(-1, 2)
+        scale = cam_w / projector_size[0]
+        radius = max(2, int(MARKER_RADIUS * scale))
+        for x, y in warped:
+            cv2.circle(frame, (int(round(x)), int(round(y))), radius, (255, 255, 255), -1)
+    if noise:
+        jitter = np.random.randint(0, noise, frame.shape, dtype=np.uint8)
+        frame = cv2.add(frame, jitter)
+    return frame
+
+
+def load_calibration(projector_size, camera_size, path=CALIBRATION_FILE):
+    """Return cached calibration if it matches the current resolutions"""
+    calibration = Calibration.load(path)
+    if calibration and calibration.matches(projector_size, camera_size):
+        return calibration
+    return None
+
+
+class CalibrationScene(MotiBeamScene):
+    """Projects each marker pattern and captures it with the camera"""
+
+    SETTLE_FRAMES = 10  # frames to wait for the camera to see a new pattern
+
+    def __init__(self, camera, standalone=True, cache_path=CALIBRATION_FILE):
+        super().__init__(title="MotiBeam - Calibration", standalone=standalone)
+        self.camera = camera
+        self.cache_path = cache_path
+        self.detector = MarkerDetector()
+        self.patterns = [None] + list(PATTERN_INSETS)  # None = blank reference
+        self.pattern_index = 0
+        self.frame_count = 0
+        self.captures = []
+        self.result = None
+
+    def camera_size(self):
+        return (int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    def update(self):
+        if self.pattern_index >= len(self.patterns):
+            return
+        self.frame_count += 1
+        if self.frame_count < self.SETTLE_FRAMES:
+            return
+
+        ret, frame = self.camera.read()
+        if not ret:
+            print("Calibration: camera read failed")
+            self.running = False
+            return
+        self.captures.append(frame)
+        self.pattern_index += 1
+        self.frame_count = 0
+
+        if self.pattern_index == len(self.patterns):
+            self.finish()
+
+    def finish(self):
+        background, frames = self.captures[0], self.captures[1:]
+        self.result = calibrate_from_frames(frames, (self.width, self.height),
+                                            self.camera_size(), background,
+                                            self.detector)
+        if self.result:
+            self.result.save(self.cache_path)
+            print(f"Calibration saved (error {self.result.error:.2f}px)")
+        else:
+            print("Calibration failed - markers not detected")
+        self.running = False
+
+    def render(self):
+        self.screen.fill(self.colors['black'])
+        if self.pattern_index >= len(self.patterns):
+            return
+        inset = self.patterns[self.pattern_index]
+        if inset is None:
+            return
+        for pos in marker_positions(self.width, self.height, inset):
+            pygame.draw.circle(self.screen, self.colors['white'], pos, MARKER_RADIUS)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="MotiBeam projector calibration")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="run detection against generated camera frames")
+    parser.add_argument("--images", nargs="+",
+                        help="background image followed by one image per pattern")
+    parser.add_argument("--size", default="1280x720", help="projector resolution")
+    args = parser.parse_args()
+    projector_size = tuple(int(v) for v in args.size.split("x"))
+
+    if args.synthetic:
+        camera_size = (640, 480)
+        truth = cv2.getPerspectiveTransform(
+            np.float32(marker_positions(*projector_size)),
+            np.float32([(70, 60), (580, 40), (50, 430), (600, 455)]))
+        background = synthetic_frame(truth, projector_size, camera_size, inset=None, noise=20)
+        frames = [synthetic_frame(truth, projector_size, camera_size, inset, noise=20)
+                  for inset in PATTERN_INSETS]
+        result = calibrate_from_frames(frames, projector_size, camera_size, background)
+        if result is None:
+            sys.exit("Synthetic calibration failed")
+        print(f"Synthetic calibration error: {result.error:.2f}px")
+    elif args.images:
+        images = [cv2.imread(path) for path in args.images]
+        camera_size = (images[0].shape[1], images[0].shape[0])
+        result = calibrate_from_frames(images[1:], projector_size, camera_size, images[0])
+        if result is None:
+            sys.exit("Calibration failed")
+        print(f"Calibration error: {result.error:.2f}px")
+        print(result.homography)
+    else:
+        camera = cv2.VideoCapture(0)
+        scene = CalibrationScene(camera, standalone=True)
+        scene.run(duration=30)
+        camera.release()
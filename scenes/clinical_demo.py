@@ -29,6 +29,14 @@ class ClinicalWellnessDemo(MotiBeamScene):
             "😴 Sleep - 7.5 hours last night",
         ]
         
+    def on_gesture(self, gesture):
+        """Nod confirms the medication that is due"""
+        if gesture == "nod":
+            for med in self.medications:
+                if med['status'] == 'due':
+                    med['status'] = 'taken'
+                    break
+        
     def render(self):
         self.screen.fill(self.colors['black'])
         
@@ -84,4 +92,12 @@ class ClinicalWellnessDemo(MotiBeamScene):
 
 if __name__ == "__main__":
     demo = ClinicalWellnessDemo()
+    try:
+        from gestures import attach_camera
+        camera = attach_camera(demo)
+    except ImportError:
+        camera = None
+        print("Gesture input not available (OpenCV missing)")
     demo.run(duration=30)  # Run for 30 seconds
+    if camera:
+        camera.release()
@@ -7,10 +7,37 @@ import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
 from scene_base import MotiBeamScene
+from timeseries import DAY, BLOOD_PRESSURE, HYDRATION, MEDICATION, WALK, ClinicalStore, demo_history
+from virtual_list import VirtualList
+import math
+import time
 import pygame
 from datetime import datetime
 
+HYDRATION_GOAL = 8  # glasses a day
+
 class ClinicalWellnessEnhanced(MotiBeamScene):
+    key_bindings = {
+        "exit": ["escape"],
+        "medication": ["1"],
+        "wellness": ["2"],
+        "sleep": ["3"],
+        "activity": ["4"],
+        "scroll_up": ["up"],
+        "scroll_down": ["down"],
+        "page_up": ["pageup"],
+        "page_down": ["pagedown"],
+    }
+    
+    # Activity log rows: (icon, color name) per event kind
+    EVENT_STYLES = {
+        MEDICATION: ("💊", 'green'),
+        WALK: ("🚶", 'cyan'),
+        BLOOD_PRESSURE: ("❤️", 'white'),
+        HYDRATION: ("💧", 'blue'),
+    }
+    LOG_ROW_HEIGHT = 80
+    
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Clinical & Wellness", standalone=standalone)
         self.current_screen = "menu"
@@ -22,11 +49,12 @@ class ClinicalWellnessEnhanced(MotiBeamScene):
             {"name": "Evening Supplement", "time": "6:00 PM", "status": "upcoming"},
         ]
         
-        self.wellness = [
-            {"metric": "💧 Hydration", "value": "6/8 glasses", "status": "good"},
-            {"metric": "🚶 Steps", "value": "8,452 steps", "status": "excellent"},
-            {"metric": "❤️  Heart Rate", "value": "72 bpm", "status": "normal"},
-        ]
+        # Vitals and events; synthetic history until real readings are saved
+        self.store = ClinicalStore()
+        if not self.store.load():
+            demo_history(self.store)
+        self.activity_log = VirtualList(self.LOG_ROW_HEIGHT)
+        self.sparklines = {}
         
         self.sleep = {
             "last_night": "7.5 hours",
@@ -35,24 +63,31 @@ class ClinicalWellnessEnhanced(MotiBeamScene):
             "rem_sleep": "1.8 hours"
         }
         
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def on_action(self, action):
+        if action == "exit":
+            # ESC backs out of a feature screen before leaving the vertical
+            if self.current_screen == "menu":
                 self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.current_screen == "menu":
-                        self.running = False
-                    else:
-                        self.current_screen = "menu"
-                elif event.key == pygame.K_1:
-                    self.current_screen = "medication"
-                elif event.key == pygame.K_2:
-                    self.current_screen = "wellness"
-                elif event.key == pygame.K_3:
-                    self.current_screen = "sleep"
-                elif event.key == pygame.K_4:
-                    self.current_screen = "activity"
+            else:
+                self.current_screen = "menu"
+        elif action in ("scroll_up", "scroll_down", "page_up", "page_down"):
+            if self.current_screen == "activity":
+                height = self.log_rect().height
+                page = self.activity_log.page_rows(height)
+                rows = {"scroll_up": -1, "scroll_down": 1, "page_up": -page, "page_down": page}[action]
+                self.activity_log.scroll(rows, len(self.store.events), height)
+        else:
+            self.current_screen = action
+                
+    def on_gesture(self, gesture):
+        """Nod confirms the medication that is due"""
+        if gesture == "nod" and self.current_screen == "medication":
+            for med in self.medications:
+                if med['status'] == 'due':
+                    med['status'] = 'taken'
+                    self.store.record_medication(med['name'])
+                    self.store.save_async()
+                    break
         
     def render(self):
         self.screen.fill(self.colors['black'])
@@ -109,33 +144,79 @@ class ClinicalWellnessEnhanced(MotiBeamScene):
             self.screen.blit(text_surf, (200, y_pos))
             y_pos += 70
         
-        self.draw_footer("Voice: 'Medication taken' | ESC for menu")
+        self.draw_footer("Voice: 'Medication taken' | Nod to confirm | ESC for menu")
         self.draw_corner_markers(self.colors['green'])
         
+    def today_metrics(self):
+        """Today's metrics from the store: (metric, value, status, series, how)"""
+        now = time.time()
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        glasses = int(self.store.hydration.total(midnight, now))
+        steps = int(self.store.steps.total(midnight, now))
+        heart_rate = self.store.heart_rate.last(0)
+        return [
+            ("💧 Hydration", f"{glasses}/{HYDRATION_GOAL} glasses",
+             "excellent" if glasses >= HYDRATION_GOAL else "good" if glasses >= HYDRATION_GOAL * 3 // 4 else "low",
+             self.store.hydration, "sum"),
+            ("🚶 Steps", f"{steps:,} steps",
+             "excellent" if steps >= 8000 else "good" if steps >= 5000 else "low",
+             self.store.steps, "sum"),
+            ("❤️  Heart Rate", f"{heart_rate:.0f} bpm",
+             "normal" if 50 <= heart_rate <= 100 else "check",
+             self.store.heart_rate, "mean"),
+        ]
+        
+    def sparkline(self, series, how, size, buckets=48):
+        """Points for the last 24h of a series, redone when data or the minute changes"""
+        now = time.time()
+        key = (id(series), how, size)
+        stamp = (series.version, int(now // 60))
+        cached = self.sparklines.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        values = series.downsample(now - DAY, now, buckets, how).tolist()
+        width, height = size
+        filled = [v for v in values if not math.isnan(v)]
+        low, high = (min(filled), max(filled)) if filled else (0.0, 1.0)
+        span = (high - low) or 1.0
+        points = []
+        for i, value in enumerate(values):
+            value = low if math.isnan(value) else value
+            points.append((i * (width - 1) // (buckets - 1), int(height - 1 - (value - low) / span * (height - 1))))
+        self.sparklines[key] = (stamp, points)
+        return points
+        
     def render_wellness(self):
         self.draw_header("💪 WELLNESS TRACKER", "Today's Metrics")
         
         y_pos = 280
-        for item in self.wellness:
-            name_surf = self.font_medium.render(item['metric'], True, self.colors['cyan'])
+        for metric, value, status, series, how in self.today_metrics():
+            name_surf = self.font_medium.render(metric, True, self.colors['cyan'])
             self.screen.blit(name_surf, (200, y_pos))
             
-            value_surf = self.font_large.render(item['value'], True, self.colors['white'])
+            value_surf = self.font_large.render(value, True, self.colors['white'])
             self.screen.blit(value_surf, (200, y_pos + 50))
             
-            if item['status'] == 'excellent':
+            if status == 'excellent':
                 status_color = self.colors['green']
-            elif item['status'] == 'good':
+            elif status == 'good':
                 status_color = self.colors['cyan']
+            elif status in ('low', 'check'):
+                status_color = self.colors['orange']
             else:
                 status_color = self.colors['white']
             
-            status_surf = self.font_small.render(item['status'].upper(), True, status_color)
+            # Last 24 hours, downsampled
+            chart = pygame.Rect(self.width - 620, y_pos + 50, 280, 60)
+            points = [(chart.left + x, chart.top + y) for x, y in self.sparkline(series, how, chart.size)]
+            pygame.draw.lines(self.screen, self.colors['gray'], False, points, 2)
+            
+            status_surf = self.font_small.render(status.upper(), True, status_color)
             self.screen.blit(status_surf, (self.width - 300, y_pos + 50))
             
             y_pos += 130
         
-        self.draw_footer("ESC for menu")
+        self.draw_footer("Last 24 hours | ESC for menu")
         self.draw_corner_markers(self.colors['cyan'])
         
     def render_sleep(self):
@@ -165,29 +246,62 @@ class ClinicalWellnessEnhanced(MotiBeamScene):
         self.draw_footer("ESC for menu")
         self.draw_corner_markers(self.colors['blue'])
         
-    def render_activity(self):
-        self.draw_header("📋 ACTIVITY LOG", "Recent Events")
+    def log_rect(self):
+        return pygame.Rect(150, 260, self.width - 300, self.height - 360)
         
-        activities = [
-            ("09:15 AM", "💊 Morning medication taken", self.colors['green']),
-            ("10:30 AM", "🚶 15-minute walk completed", self.colors['cyan']),
-            ("12:00 PM", "❤️  Blood pressure: 118/76", self.colors['white']),
-            ("02:45 PM", "💧 Hydration reminder", self.colors['blue']),
-        ]
+    def event_text(self, event):
+        kind = int(event['kind'])
+        if kind == MEDICATION:
+            return f"{self.store.events.labels[event['label']]} taken"
+        if kind == WALK:
+            return f"{event['a']:.0f}-minute walk completed"
+        if kind == BLOOD_PRESSURE:
+            return f"Blood pressure: {event['a']:.0f}/{event['b']:.0f}"
+        return f"Drank {event['a']:.0f} glass" + ("es" if event['a'] != 1 else "")
         
-        y_pos = 280
-        for time, activity, color in activities:
-            time_surf = self.font_small.render(time, True, self.colors['gray'])
-            self.screen.blit(time_surf, (150, y_pos))
-            
-            activity_surf = self.font_medium.render(activity, True, color)
-            self.screen.blit(activity_surf, (350, y_pos))
-            
-            y_pos += 80
+    def render_log_row(self, index):
+        """Lay out and render one activity row (only called for visible rows)"""
+        event = self.store.events.recent(index)
+        when = datetime.fromtimestamp(float(event['t']))
+        icon, color = self.EVENT_STYLES[int(event['kind'])]
         
-        self.draw_footer("ESC for menu")
+        row = pygame.Surface((self.log_rect().width - 10, self.LOG_ROW_HEIGHT))
+        row.fill(self.colors['black'])
+        row.set_colorkey(self.colors['black'])
+        day_surf = self.font_small.render(when.strftime("%a %b %d"), True, self.colors['gray'])
+        row.blit(day_surf, (0, 0))
+        time_surf = self.font_small.render(when.strftime("%I:%M %p"), True, self.colors['gray'])
+        row.blit(time_surf, (0, 34))
+        activity_surf = self.font_medium.render(f"{icon} {self.event_text(event)}", True, self.colors[color])
+        row.blit(activity_surf, (230, 10))
+        return row
+        
+    def render_activity(self):
+        events = self.store.events
+        self.draw_header("📋 ACTIVITY LOG", f"{len(events)} events")
+        
+        # Only the rows in view are laid out; rows are keyed by event so
+        # new events arriving at the top don't invalidate the cache
+        self.activity_log.draw(self.screen, self.log_rect(), len(events),
+                               events.sequence, self.render_log_row, self.colors['gray'])
+        
+        self.draw_footer("Up/Down to scroll | PgUp/PgDn to page | ESC for menu")
         self.draw_corner_markers(self.colors['purple'])
+        
+    def run(self, duration=30, frames=None):
+        try:
+            super().run(duration=duration, frames=frames)
+        finally:
+            self.store.save()
 
 if __name__ == "__main__":
     demo = ClinicalWellnessEnhanced(standalone=True)
+    try:
+        from gestures import attach_camera
+        camera = attach_camera(demo)
+    except ImportError:
+        camera = None
+        print("Gesture input not available (OpenCV missing)")
     demo.run(duration=300)
+    if camera:
+        camera.release()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Multi-Output Compositor
+Drives several projection areas from one process. Each scene renders once
+per frame into its own offscreen surface, which is then placed, scaled or
+perspective-warped onto any number of outputs (the display, regions of a
+display spanning several projectors, or offscreen surfaces for testing).
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import time
+
+import pygame
+
+from metrics import metrics
+
+
+class Output:
+    """A surface the compositor draws onto, with per-output timing"""
+
+    def __init__(self, name, surface, present=None, background=(0, 0, 0)):
+        self.name = name
+        self.surface = surface
+        self.present_fn = present
+        self.background = background
+        self.placements = []
+        self.frames = 0
+        self.compose_time = 0.0
+        self.compose_max = 0.0
+        self.present_time = 0.0
+
+    @classmethod
+    def display(cls, name="display"):
+        """The whole display surface; presenting flips it"""
+        return cls(name, pygame.display.get_surface(), pygame.display.flip)
+
+    @classmethod
+    def region(cls, name, display_output, rect):
+        """Part of another output, e.g. one projector of a spanned desktop
+
+        Regions are presented by the output they belong to.
+        """
+        return cls(name, display_output.surface.subsurface(pygame.Rect(rect)))
+
+    @classmethod
+    def offscreen(cls, name, size):
+        """A plain surface; read .surface after each frame"""
+        return cls(name, pygame.Surface(size))
+
+    def show(self, scene, dest=None, corners=None, smooth=False):
+        """Place a scene on this output
+
+        dest is a rect to scale the scene into (default: whole output);
+        corners are four output points (top-left, top-right, bottom-right,
+        bottom-left) to warp the scene onto instead, e.g. for keystone.
+        """
+        if corners is not None:
+            placement = WarpPlacement(scene, corners)
+        else:
+            placement = Placement(scene, dest or self.surface.get_rect(), smooth)
+        self.placements.append(placement)
+        return placement
+
+    def present(self):
+        start = time.perf_counter()
+        if self.present_fn:
+            self.present_fn()
+        self.present_time += time.perf_counter() - start
+
+    def mean_compose_ms(self):
+        return self.compose_time / self.frames * 1000 if self.frames else 0.0
+
+
+class Placement:
+    """A scene scaled into a rectangle of an output"""
+
+    def __init__(self, scene, dest, smooth=False):
+        self.scene = scene
+        self.dest = pygame.Rect(dest)
+        self.smooth = smooth
+
+    def draw(self, source, target):
+        if source.get_size() == self.dest.size:
+            target.blit(source, self.dest)
+            return
+        # Scale straight into the output, no intermediate surface
+        area = target.subsurface(self.dest.clip(target.get_rect()))
+        if area.get_size() != self.dest.size:
+            target.blit(pygame.transform.scale(source, self.dest.size), self.dest)
+        elif self.smooth:
+            pygame.transform.smoothscale(source, self.dest.size, area)
+        else:
+            pygame.transform.scale(source, self.dest.size, area)
+
+
+class WarpPlacement:
+    """A scene perspective-warped onto a quad of an output
+
+    The inverse mapping is solved once; each frame is a single cv2.remap
+    of the scene into the quad's bounding box (outside the quad is black).
+    """
+
+    def __init__(self, scene, corners):
+        import cv2
+        import numpy as np
+        self.cv2 = cv2
+        self.scene = scene
+        self.corners = [tuple(map(float, c)) for c in corners]
+        xs = [c[0] for c in self.corners]
+        ys = [c[1] for c in self.corners]
+        self.dest = pygame.Rect(int(min(xs)), int(min(ys)),
+                                int(max(xs) - min(xs)) + 1, int(max(ys) - min(ys)) + 1)
+        self.source_size = None
+        self.maps = None
+        self.np = np
+
+    def _build_maps(self, size):
+        cv2, np = self.cv2, self.np
+        width, height = size
+        src = np.float32([[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]])
+        dst = np.float32([(x - self.dest.x, y - self.dest.y) for x, y in self.corners])
+        inverse = cv2.getPerspectiveTransform(dst, src)
+        gx, gy = np.meshgrid(np.arange(self.dest.width, dtype=np.float32),
+                             np.arange(self.dest.height, dtype=np.float32))
+        points = np.stack([gx, gy], axis=-1).reshape(-1, 1, 2)
+        mapped = cv2.perspectiveTransform(points, inverse).reshape(self.dest.height, self.dest.width, 2)
+        # Fixed-point maps make the per-frame remap several times faster
+        self.maps = cv2.convertMaps(mapped[..., 0], mapped[..., 1], cv2.CV_16SC2)
+        self.source_size = size
+
+    def draw(self, source, target):
+        size = source.get_size()
+        if size != self.source_size:
+            self._build_maps(size)
+        pixels = self.np.frombuffer(pygame.image.tobytes(source, "RGB"), self.np.uint8)
+        pixels = pixels.reshape(size[1], size[0], 3)
+        warped = self.cv2.remap(pixels, self.maps[0], self.maps[1], self.cv2.INTER_LINEAR,
+                                borderMode=self.cv2.BORDER_CONSTANT)
+        target.blit(pygame.image.frombuffer(warped.data, self.dest.size, "RGB"), self.dest)
+
+
+class Compositor:
+    """Renders each scene once per frame and composes every output
+
+    Scenes are built with standalone=False; events go to the focus scene
+    (the first one placed unless set).
+    """
+
+    def __init__(self, outputs, fps=30, focus=None):
+        self.outputs = list(outputs)
+        self.fps = fps
+        self.focus = focus
+        self.clock = pygame.time.Clock()
+        self.surfaces = {}  # scene -> offscreen surface it renders into
+        self.render_time = {}
+        self.frames = 0
+
+    def scenes(self):
+        """Distinct scenes shown on any output, in placement order"""
+        seen = []
+        for output in self.outputs:
+            for placement in output.placements:
+                if placement.scene not in seen:
+                    seen.append(placement.scene)
+        return seen
+
+    def _surface(self, scene):
+        surface = self.surfaces.get(scene)
+        if surface is None:
+            surface = pygame.Surface((scene.width, scene.height))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self.surfaces[scene] = surface
+            scene.screen = surface
+        return surface
+
+    def render_frame(self):
+        """Update and render every scene once, then compose all outputs"""
+        for scene in self.scenes():
+            self._surface(scene)
+            start = time.perf_counter()
+            scene.update()
+            scene.render()
+            name = scene.__class__.__name__
+            self.render_time[name] = self.render_time.get(name, 0.0) + time.perf_counter() - start
+
+        for output in self.outputs:
+            start = time.perf_counter()
+            output.surface.fill(output.background)
+            for placement in output.placements:
+                placement.draw(self.surfaces[placement.scene], output.surface)
+            elapsed = time.perf_counter() - start
+            output.frames += 1
+            output.compose_time += elapsed
+            output.compose_max = max(output.compose_max, elapsed)
+            metrics.set("motibeam_output_compose_seconds", round(elapsed, 6), output=output.name)
+
+        for output in self.outputs:
+            output.present()
+        self.frames += 1
+
+    def handle_events(self):
+        scenes = self.scenes()
+        focus = self.focus or (scenes[0] if scenes else None)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if focus:
+                focus.handle_event(event)
+                if not focus.running:
+                    return False
+        return True
+
+    def run(self, duration=None, frames=None):
+        """Run until a duration (seconds) or frame count, or the focus scene exits"""
+        start = time.time()
+        while self.handle_events():
+            if duration is not None and time.time() - start > duration:
+                break
+            frame_start = time.perf_counter()
+            self.render_frame()
+            metrics.frame("compositor", time.perf_counter() - frame_start)
+            if frames is not None and self.frames >= frames:
+                break
+            self.clock.tick(self.fps)
+
+    def report(self):
+        print("=" * 60)
+        print(f"Compositor: {self.frames} frames")
+        for name, total in self.render_time.items():
+            print(f"  render  {name:24} {total / max(1, self.frames) * 1000:7.2f} ms/frame")
+        for output in self.outputs:
+            size = "x".join(map(str, output.surface.get_size()))
+            present = output.present_time / max(1, output.frames) * 1000
+            print(f"  output  {output.name:12} {size:>11} compose {output.mean_compose_ms():6.2f} ms "
+                  f"(max {output.compose_max * 1000:.2f})  present {present:6.2f} ms")
+        print("=" * 60)
+
+
+def warehouse_outputs(scene, floor, wall):
+    """IndustrialDemo warehouse: a keystoned floor zone and a wall panel
+
+    floor and wall are Outputs; the one scene renders once for both.
+    """
+    fw, fh = floor.surface.get_size()
+    # Ceiling projector tilted onto the floor: the far edge is wider
+    floor.show(scene, corners=[(0, 0), (fw - 1, 0),
+                               (fw * 0.85, fh - 1), (fw * 0.15, fh - 1)])
+    wall.show(scene, dest=wall.surface.get_rect(), smooth=True)
+
+
+if __name__ == "__main__":
+    # Offscreen test: SDL_VIDEODRIVER=dummy python3 compositor.py [frames] [outdir]
+    import os
+    from industrial_demo import IndustrialDemo
+
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    outdir = sys.argv[2] if len(sys.argv) > 2 else None
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    scene = IndustrialDemo(standalone=False)
+    floor = Output.offscreen("floor", (1280, 800))
+    wall = Output.offscreen("wall", (640, 360))
+    warehouse_outputs(scene, floor, wall)
+
+    compositor = Compositor([floor, wall], fps=1000)
+    compositor.run(frames=frames)
+    compositor.report()
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+        for output in compositor.outputs:
+            pygame.image.save(output.surface, os.path.join(outdir, f"{output.name}.png"))
+        print(f"Saved output frames to {outdir}")
+    pygame.quit()
@@ -6,20 +6,57 @@ VERTICAL 6: Education / Learning Demo
 import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
-from scene_base import MotiBeamScene
+from scene_base import MotiBeamScene, load_font
+from flashcards import AGAIN, EASY, GOOD, DeckSession, DeckStore, default_deck
+import text_layout
 import pygame
 
+DECK = "vocabulary"
+
 class EducationDemo(MotiBeamScene):
+    key_bindings = {
+        "exit": ["escape"],
+        "again": ["1"],
+        "good": ["2", "space"],
+        "easy": ["3"],
+    }
+    
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Education & Learning", standalone=standalone)
-        self.study_items = [
-            {"word": "Photosynthesis", "definition": "Process by which plants convert light into energy"},
-            {"word": "Theorem", "definition": "A mathematical statement proven using logic"},
-            {"word": "Catalyst", "definition": "Substance that speeds up a chemical reaction"},
-        ]
-        self.current_item = 0
+        store = DeckStore()
+        default_deck(store, DECK)
+        store.close()
+        
+        # Cards are fetched and graded off-thread; rendering happens in poll()
+        self.session = DeckSession(DECK, self.render_card)
+        self.background_tasks.append(self.session)
         self.timer_seconds = 25 * 60
         
+    def render_card(self, card):
+        """Pre-render a card's term and definition (called from session.poll)"""
+        word = text_layout.ellipsize(self.font_large, card.front, self.width - 200)
+        font, lines = text_layout.fit(card.back, (self.width - 200, 80), load_font,
+                                      max_size=40, min_size=24)
+        return {
+            "word": self.font_large.render(word, True, self.colors['white']),
+            "definition": [font.render(line, True, self.colors['white']) for line in lines],
+            "line_height": text_layout.line_height(font),
+        }
+        
+    def on_action(self, action):
+        grades = {"again": AGAIN, "good": GOOD, "easy": EASY}
+        if action in grades:
+            self.session.answer(grades[action])
+        else:
+            super().on_action(action)
+            
+    def on_gesture(self, gesture):
+        """Nod: knew it; wave: show it again soon"""
+        if gesture == "nod":
+            self.session.answer(GOOD)
+        elif gesture == "wave":
+            self.session.answer(AGAIN)
+        
     def update(self):
         elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
         self.timer_seconds = max(0, (25 * 60) - int(elapsed))
@@ -35,31 +72,54 @@ class EducationDemo(MotiBeamScene):
         timer_rect = timer_surf.get_rect(center=(self.width//2, 200))
         self.screen.blit(timer_surf, timer_rect)
         
-        item = self.study_items[self.current_item]
+        if self.session.current is None:
+            # Still loading, or nothing left to review today
+            if self.session.ready and not self.session.due:
+                status = "Deck complete - nothing due"
+            else:
+                status = "Loading deck..."
+            status_surf = self.font_medium.render(status, True, self.colors['green'])
+            self.screen.blit(status_surf, status_surf.get_rect(center=(self.width//2, 420)))
+        else:
+            self.render_current_card()
+        
+        progress_text = f"Reviewed {self.session.reviewed}  |  Due {self.session.due} of {self.session.total}"
+        progress_surf = self.font_small.render(progress_text, True, self.colors['gray'])
+        progress_rect = progress_surf.get_rect(center=(self.width//2, 600))
+        self.screen.blit(progress_surf, progress_rect)
+        
+        self.draw_footer("1 / wave: again   2 / nod: good   3: easy")
+        self.draw_corner_markers(self.colors['purple'])
+        
+    def render_current_card(self):
+        _, card = self.session.current
         
         word_label = self.font_small.render("TERM:", True, self.colors['cyan'])
         word_label_rect = word_label.get_rect(centerx=self.width//2, top=300)
         self.screen.blit(word_label, word_label_rect)
         
-        word_surf = self.font_large.render(item['word'], True, self.colors['white'])
-        word_rect = word_surf.get_rect(center=(self.width//2, 380))
-        self.screen.blit(word_surf, word_rect)
+        word_rect = card['word'].get_rect(center=(self.width//2, 380))
+        self.screen.blit(card['word'], word_rect)
         
         def_label = self.font_small.render("DEFINITION:", True, self.colors['cyan'])
         def_label_rect = def_label.get_rect(centerx=self.width//2, top=460)
         self.screen.blit(def_label, def_label_rect)
         
-        def_surf = self.font_small.render(item['definition'], True, self.colors['white'])
-        def_rect = def_surf.get_rect(center=(self.width//2, 520))
-        self.screen.blit(def_surf, def_rect)
-        
-        progress_text = f"Card {self.current_item + 1} of {len(self.study_items)}"
-        progress_surf = self.font_small.render(progress_text, True, self.colors['gray'])
-        progress_rect = progress_surf.get_rect(center=(self.width//2, 600))
-        self.screen.blit(progress_surf, progress_rect)
-        
-        self.draw_footer("Focus mode: Distraction-free learning environment")
-        self.draw_corner_markers(self.colors['purple'])
+        # Definition lines were wrapped and sized to fit when pre-rendered
+        step = card['line_height']
+        y = 500 + (80 - step * len(card['definition'])) // 2
+        for line in card['definition']:
+            self.screen.blit(line, line.get_rect(centerx=self.width//2, top=y))
+            y += step
+            
+    def run(self, duration=30, frames=None):
+        try:
+            super().run(duration=duration, frames=frames)
+        finally:
+            self.close()
+            
+    def close(self):
+        self.session.close()
 
 if __name__ == "__main__":
     demo = EducationDemo(standalone=True)
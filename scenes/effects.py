@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Effect Layers
+Translucent shapes and glows pre-rendered once into display-format
+surfaces and composited with surface or per-pixel alpha. Sprites are
+cached by geometry, so moving or fading an effect costs one blit and
+only a change of size, colour or shape renders a new one.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+from collections import OrderedDict
+
+import pygame
+
+from metrics import metrics
+
+CACHE_SIZE = 64
+
+
+class EffectsCache:
+    """Geometry-keyed sprites for translucent effects"""
+
+    def __init__(self, max_entries=CACHE_SIZE):
+        self.max_entries = max_entries
+        self.sprites = OrderedDict()
+
+    def _get(self, key, build):
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            metrics.cache_hit("effects")
+            return sprite
+        metrics.cache_miss("effects")
+        sprite = self.sprites[key] = build()
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+        return sprite
+
+    def _uniform(self, size, draw, alpha):
+        # One alpha for the whole shape: colorkey + surface alpha blits
+        # (RLE-accelerated) are cheaper than per-pixel alpha
+        surface = pygame.Surface(size)
+        surface.fill((0, 0, 0))
+        draw(surface)
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        surface.set_alpha(alpha, pygame.RLEACCEL)
+        return surface.convert() if pygame.display.get_surface() else surface
+
+    def ring(self, radius, color, alpha, width=2):
+        """Circle outline; blit centred with blit_centered()"""
+        color = tuple(color[:3])
+        size = (2 * radius + 1, 2 * radius + 1)
+
+        def build():
+            return self._uniform(size, lambda s: pygame.draw.circle(s, color, (radius, radius), radius, width), alpha)
+        return self._get(("ring", radius, color, alpha, width), build)
+
+    def disc(self, radius, color, alpha):
+        color = tuple(color[:3])
+        size = (2 * radius + 1, 2 * radius + 1)
+
+        def build():
+            return self._uniform(size, lambda s: pygame.draw.circle(s, color, (radius, radius), radius), alpha)
+        return self._get(("disc", radius, color, alpha), build)
+
+    def glow(self, size, color, spread=24, strength=90):
+        """Soft rounded-rect halo around an element of the given size (per-pixel alpha)
+
+        Fade it with surface.set_alpha(); pygame 2 multiplies that with
+        the per-pixel alpha.
+        """
+        color = tuple(color[:3])
+        width, height = size
+
+        def build():
+            surface = pygame.Surface((width + 2 * spread, height + 2 * spread), pygame.SRCALPHA)
+            steps = max(1, spread // 3)
+            for i in range(steps):
+                # Outer rings faint, inner rings strong
+                inset = i * spread // steps
+                alpha = strength * (i + 1) // (steps * steps)
+                rect = surface.get_rect().inflate(-2 * inset, -2 * inset)
+                layer = pygame.Surface(rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(layer, (*color, alpha), layer.get_rect(), border_radius=rect.height // 2)
+                surface.blit(layer, rect)
+            return surface.convert_alpha() if pygame.display.get_surface() else surface
+        return self._get(("glow", width, height, color, spread, strength), build)
+
+    def clear(self):
+        self.sprites.clear()
+
+
+def blit_centered(target, sprite, center, alpha=None):
+    """Blit a sprite centred on a point, optionally faded"""
+    if alpha is not None:
+        sprite.set_alpha(alpha)
+    rect = sprite.get_rect(center=center)
+    target.blit(sprite, rect)
+    return rect
+
+
+if __name__ == "__main__":
+    # Benchmark: SDL_VIDEODRIVER=dummy python3 effects.py [frames]
+    import math
+    import time
+
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    cyan = (0, 255, 180)
+    cache = EffectsCache()
+
+    def rings(t):
+        return [(200 + i * 300, 360 + int(30 * math.sin(t + i * 0.5))) for i in range(4)]
+
+    def opaque(t):
+        # What the menu did: the alpha in (*cyan, 20) is ignored
+        for center in rings(t):
+            pygame.draw.circle(screen, (*cyan, 20), center, 150, 2)
+
+    def per_frame_alpha(t):
+        # Correct but naive: a fresh full-screen alpha surface every frame
+        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        for center in rings(t):
+            pygame.draw.circle(overlay, (*cyan, 20), center, 150, 2)
+        screen.blit(overlay, (0, 0))
+
+    def cached(t):
+        ring = cache.ring(150, cyan, 20)
+        for center in rings(t):
+            blit_centered(screen, ring, center)
+
+    def cached_with_glow(t):
+        cached(t)
+        glow = cache.glow((600, 120), cyan)
+        blit_centered(screen, glow, (640, 100), alpha=int(255 * (0.8 + 0.2 * abs(math.sin(t * 2)))))
+
+    print("=" * 50)
+    for name, draw in [("opaque (no alpha)", opaque), ("per-frame alpha", per_frame_alpha),
+                       ("cached sprites", cached), ("cached + logo glow", cached_with_glow)]:
+        start = time.perf_counter()
+        for i in range(frames):
+            screen.fill((0, 0, 0))
+            draw(i / 15.0)
+        ms = (time.perf_counter() - start) / frames * 1000
+        print(f"{name:20} {ms:7.3f} ms/frame")
+    print("=" * 50)
+    pygame.quit()
@@ -7,15 +7,110 @@ import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
 from scene_base import MotiBeamScene
+from evacuation import DistanceField, blob, building_plan
+import math
+import numpy as np
 import pygame
 
+PLAN_SIZE = (60, 30)    # cells, 2 ft each
+SIGN_CELL = (30, 15)    # where this projector's sign is
+HAZARD_SECONDS = 8      # a new blocked area this often
+MAX_HAZARDS = 4         # then the drill starts over
+MAP_CELL = 5            # minimap pixels per cell
+
 class EmergencyDemo(MotiBeamScene):
+    safety_critical = True
+    
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Emergency Systems", standalone=standalone)
         self.flash_state = 0
+        self.walkable, self.exits, names = building_plan(*PLAN_SIZE)
+        self.field = DistanceField(self.walkable, self.exits)
+        self.exit_names = {self.field.index(x, y): name for (x, y), name in zip(self.exits, names)}
+        self.hazards = []
+        self.next_hazard = pygame.time.get_ticks() + HAZARD_SECONDS * 1000
+        self.route = None
+        self.minimap = None
+        # alerts.Alert while shown by an AlertChannel
+        self.alert = None
+        # Simulated spreading fire; AlertChannel.prepare turns it off so a
+        # real alert routes over the actual plan
+        self.drill = True
         
     def update(self):
-        self.flash_state = (self.flash_state + 1) % 30
+        now = pygame.time.get_ticks()
+        # One flash per second from the clock, whatever the frame rate
+        self.flash_state = (now - self.start_time) * 30 // 1000 % 30
+        
+        if not self.drill:
+            if self.hazards:
+                self.clear_hazards()
+        elif now >= self.next_hazard:
+            self.next_hazard = now + HAZARD_SECONDS * 1000
+            self.spread_hazard()
+        
+    def clear_hazards(self):
+        """Back to the unobstructed plan"""
+        self.hazards = []
+        self.field = DistanceField(self.walkable, self.exits)
+        
+    def spread_hazard(self):
+        """Block a doorway on the current route; the field repairs incrementally"""
+        path = self.current_route()['path']
+        if len(self.hazards) >= MAX_HAZARDS or len(path) <= 3:
+            self.clear_hazards()
+            return
+        # Fire in a doorway forces a new route; open floor would just be walked around
+        height, width = self.walkable.shape
+        for x, y in path[3:-1]:
+            if not self.walkable[max(0, y - 2):y + 3, max(0, x - 2):x + 3].all():
+                break
+        else:
+            # No doorway before the exit: never block the exit itself
+            self.clear_hazards()
+            return
+        cells = [(cx, cy) for cx, cy in blob(x, y, 2)
+                 if (cx, cy) != SIGN_CELL and 0 <= cx < width and 0 <= cy < height]
+        self.field.block(cells)
+        self.hazards.append(cells)
+        
+    def current_route(self):
+        """Path, heading, distance and exit name from the sign, per field version"""
+        if self.route is None or self.route['version'] != self.field.version:
+            path = self.field.path(*SIGN_CELL)
+            self.route = {
+                'version': self.field.version,
+                'path': path,
+                'heading': self.field.direction(*SIGN_CELL),
+                'feet': self.field.feet(*SIGN_CELL),
+                'exit': self.exit_names.get(self.field.index(*path[-1])) if path else None,
+            }
+            self.minimap = None
+        return self.route
+        
+    def draw_minimap(self, topleft):
+        if self.minimap is None:
+            colors = np.zeros(PLAN_SIZE[::-1] + (3,), dtype=np.uint8)
+            colors[~self.walkable] = (60, 60, 60)
+            for cells in self.hazards:
+                for x, y in cells:
+                    if self.walkable[y, x]:
+                        colors[y, x] = self.colors['red']
+            for index in self.field.exits:
+                x, y = self.field.cell(index)
+                colors[y, x] = self.colors['green']
+            image = pygame.surfarray.make_surface(colors.transpose(1, 0, 2))
+            size = (PLAN_SIZE[0] * MAP_CELL, PLAN_SIZE[1] * MAP_CELL)
+            self.minimap = pygame.transform.scale(image, size)
+        self.screen.blit(self.minimap, topleft)
+        
+        path = self.current_route()['path']
+        half = MAP_CELL // 2
+        points = [(topleft[0] + x * MAP_CELL + half, topleft[1] + y * MAP_CELL + half) for x, y in path]
+        if len(points) > 1:
+            pygame.draw.lines(self.screen, self.colors['yellow'], False, points, 2)
+        if points:
+            pygame.draw.circle(self.screen, self.colors['white'], points[0], 4)
         
     def render(self):
         if self.flash_state < 15:
@@ -23,33 +118,44 @@ class EmergencyDemo(MotiBeamScene):
         else:
             self.screen.fill(self.colors['black'])
         
-        self.draw_header("🚨 EMERGENCY ALERT", "Evacuation System Active")
+        if self.alert and self.alert.message:
+            subtitle = self.alert.message
+        else:
+            subtitle = "Evacuation Drill" if self.drill else "Evacuation System Active"
+        self.draw_header("🚨 EMERGENCY ALERT", subtitle)
         
         alert_surf = self.font_huge.render("EMERGENCY EXIT", True, self.colors['red'])
         alert_rect = alert_surf.get_rect(center=(self.width//2, 280))
         self.screen.blit(alert_surf, alert_rect)
         
+        route = self.current_route()
+        self.draw_minimap((80, 330))
+        
         arrow_x = self.width - 300
-        arrow_y = 400
-        arrow_size = 80
-        
-        points = [
-            (arrow_x + arrow_size, arrow_y),
-            (arrow_x, arrow_y - arrow_size),
-            (arrow_x, arrow_y + arrow_size)
-        ]
-        pygame.draw.polygon(self.screen, self.colors['red'], points)
-        pygame.draw.rect(self.screen, self.colors['red'],
-                        (arrow_x - 200, arrow_y - 30, 200, 60))
-        
-        route_text = "EVACUATION ROUTE B"
+        arrow_y = 405
+        arrow_size = 50
+        
+        if route['heading'] is not None:
+            # Arrow pointing along +x, rotated about its middle to the route heading
+            shape = [(arrow_size, 0), (0, -arrow_size), (0, -18), (-110, -18),
+                     (-110, 18), (0, 18), (0, arrow_size)]
+            cos, sin = math.cos(route['heading']), math.sin(route['heading'])
+            points = [(arrow_x + (x + 30) * cos - y * sin, arrow_y + (x + 30) * sin + y * cos)
+                      for x, y in shape]
+            pygame.draw.polygon(self.screen, self.colors['red'], points)
+        
+        if route['exit']:
+            route_text = f"EVACUATION {route['exit']}"
+            distance_text = f"{route['feet']:.0f} FEET TO SAFETY"
+        else:
+            route_text = "NO SAFE ROUTE"
+            distance_text = "SHELTER IN PLACE"
         route_surf = self.font_large.render(route_text, True, self.colors['orange'])
-        route_rect = route_surf.get_rect(center=(self.width//2, 500))
+        route_rect = route_surf.get_rect(center=(self.width//2, 540))
         self.screen.blit(route_surf, route_rect)
         
-        distance_text = "150 FEET TO SAFETY"
         dist_surf = self.font_medium.render(distance_text, True, self.colors['white'])
-        dist_rect = dist_surf.get_rect(center=(self.width//2, 580))
+        dist_rect = dist_surf.get_rect(center=(self.width//2, 610))
         self.screen.blit(dist_surf, dist_rect)
         
         self.draw_footer("REMAIN CALM | FOLLOW PROJECTED PATH")
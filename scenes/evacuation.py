@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Evacuation Routes
+Distance-to-exit fields over a floor grid. The field is built with a
+vectorized breadth-first search: each wavefront is a numpy array of flat
+cell indices, expanded to its neighbours in one operation. When hazards
+block cells the field is repaired incrementally - only the cells whose
+shortest route ran through the blocked area are invalidated and re-filled
+from the surrounding valid distances - instead of searched again from the
+exits.
+
+Moves are 4-connected; distances are in cells (cell_feet converts).
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import math
+import time
+
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+class DistanceField:
+    """Steps from every walkable cell to the nearest open exit
+
+    walkable is a 2D bool array (rows = y); exits are (x, y) cells. The
+    grid is stored flat with a one-cell wall border, so neighbours are
+    fixed index offsets and never fall off the edge.
+    """
+
+    def __init__(self, walkable, exits, cell_feet=2.0):
+        height, width = walkable.shape
+        self.shape = (height, width)
+        self.stride = width + 2
+        self.cell_feet = cell_feet
+        self.open = np.zeros((height + 2) * self.stride, dtype=bool)
+        self.open.reshape(height + 2, self.stride)[1:-1, 1:-1] = walkable
+        self.exits = np.array([self.index(x, y) for x, y in exits], dtype=np.int64)
+        self.dist = np.full(self.open.size, UNREACHABLE, dtype=np.int32)
+        self.offsets = np.array([-1, 1, -self.stride, self.stride], dtype=np.int64)
+        self.version = 0
+        self.compute()
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + (x + 1)
+
+    def cell(self, index):
+        return (index % self.stride - 1, index // self.stride - 1)
+
+    def _neighbours(self, cells):
+        return np.unique((cells[:, None] + self.offsets).ravel())
+
+    def compute(self):
+        """Full breadth-first search from the exits"""
+        self.dist.fill(UNREACHABLE)
+        frontier = self.exits[self.open[self.exits]]
+        self.dist[frontier] = 0
+        self._expand(frontier, 0)
+        self.version += 1
+
+    def _expand(self, frontier, step, seeds=None, seed_dist=None):
+        """Grow wavefronts into unreached cells; seeds join when step reaches their distance"""
+        position = 0
+        while True:
+            if seeds is not None and position < len(seeds):
+                if not len(frontier):
+                    step = int(seed_dist[position])
+                joining = position + np.searchsorted(seed_dist[position:], step, side="right")
+                if joining > position:
+                    frontier = np.concatenate([frontier, seeds[position:joining]])
+                    position = joining
+            if not len(frontier):
+                return
+            reached = self._neighbours(frontier)
+            reached = reached[self.open[reached] & (self.dist[reached] == UNREACHABLE)]
+            step += 1
+            self.dist[reached] = step
+            frontier = reached
+
+    def block(self, cells):
+        """Mark (x, y) cells impassable and repair the field; returns cells re-routed"""
+        blocked = np.array([self.index(x, y) for x, y in cells], dtype=np.int64).reshape(-1)
+        blocked = np.unique(blocked[self.open[blocked]])
+        if not len(blocked):
+            return 0
+        self.open[blocked] = False
+        old = self.dist[blocked]
+        self.dist[blocked] = UNREACHABLE
+        order = np.argsort(old, kind="stable")
+        seeds, seed_dist = blocked[order], old[order]
+        finite = seed_dist != UNREACHABLE
+        seeds, seed_dist = seeds[finite], seed_dist[finite]
+
+        # 1. Invalidate, layer by layer, cells left with no neighbour one
+        # step closer to an exit. Everything at distance k that loses
+        # support is known once layer k - 1 has been processed.
+        lost = []
+        layer = np.zeros(0, dtype=np.int64)
+        step = int(seed_dist[0]) if len(seeds) else 0
+        position = 0
+        while len(layer) or position < len(seeds):
+            if not len(layer):
+                step = int(seed_dist[position])
+            joining = position + np.searchsorted(seed_dist[position:], step, side="right")
+            layer = np.concatenate([layer, seeds[position:joining]])
+            position = joining
+            candidates = self._neighbours(layer)
+            candidates = candidates[self.dist[candidates] == step + 1]
+            supported = (self.dist[candidates[:, None] + self.offsets] == step).any(axis=1)
+            layer = candidates[~supported]
+            self.dist[layer] = UNREACHABLE
+            lost.append(layer)
+            step += 1
+
+        # 2. Refill the invalidated cells from the valid cells around them
+        lost = np.concatenate(lost) if lost else np.zeros(0, dtype=np.int64)
+        if len(lost):
+            border = self._neighbours(lost)
+            border = border[self.dist[border] != UNREACHABLE]
+            order = np.argsort(self.dist[border], kind="stable")
+            self._expand(np.zeros(0, dtype=np.int64), 0, border[order], self.dist[border][order])
+        self.version += 1
+        return len(lost)
+
+    def distance(self, x, y):
+        """Steps to the nearest exit from (x, y), or None if cut off"""
+        steps = self.dist[self.index(x, y)]
+        return None if steps == UNREACHABLE else int(steps)
+
+    def feet(self, x, y):
+        steps = self.distance(x, y)
+        return None if steps is None else steps * self.cell_feet
+
+    def path(self, x, y, max_steps=None):
+        """Cells from (x, y) down the field to an exit (inclusive)"""
+        index = self.index(x, y)
+        if self.dist[index] == UNREACHABLE:
+            return []
+        path = [index]
+        while self.dist[index] and (max_steps is None or len(path) <= max_steps):
+            neighbours = index + self.offsets
+            index = int(neighbours[np.argmin(self.dist[neighbours])])
+            path.append(index)
+        return [self.cell(i) for i in path]
+
+    def direction(self, x, y, lookahead=8):
+        """Heading in radians (0 = +x, clockwise on screen) toward the exit
+
+        Looks several steps ahead so the 4-connected staircase reads as
+        a diagonal.
+        """
+        path = self.path(x, y, lookahead)
+        if len(path) < 2:
+            return None
+        (x0, y0), (x1, y1) = path[0], path[-1]
+        return math.atan2(y1 - y0, x1 - x0)
+
+    def grid(self):
+        """The field as a (height, width) array, UNREACHABLE where cut off"""
+        return self.dist.reshape(self.shape[0] + 2, self.stride)[1:-1, 1:-1]
+
+
+def building_plan(width, height, room=12, door=3, exits_per_side=2):
+    """Rooms in a lattice of walls with doorways and exits on the outer wall
+
+    Returns (walkable, exits, exit_names).
+    """
+    walkable = np.ones((height, width), dtype=bool)
+    walkable[::room, :] = False
+    walkable[:, ::room] = False
+    walkable[0, :] = walkable[-1, :] = False
+    walkable[:, 0] = walkable[:, -1] = False
+    # A doorway in the middle of every wall segment
+    for y in range(0, height, room):
+        for x in range(room // 2, width, room):
+            walkable[y, x - door // 2:x - door // 2 + door] = True
+    for x in range(0, width, room):
+        for y in range(room // 2, height, room):
+            walkable[y - door // 2:y - door // 2 + door, x] = True
+    walkable[0, :] = walkable[-1, :] = False
+    walkable[:, 0] = walkable[:, -1] = False
+
+    exits = []
+    for i in range(exits_per_side):
+        x = (2 * i + 1) * width // (2 * exits_per_side)
+        y = (2 * i + 1) * height // (2 * exits_per_side)
+        exits += [(x, 0), (x, height - 1), (0, y), (width - 1, y)]
+    for x, y in exits:
+        walkable[y, x] = True
+    names = [f"ROUTE {chr(65 + i)}" for i in range(len(exits))]
+    return walkable, exits, names
+
+
+def blob(x, y, radius):
+    """Square of cells around (x, y)"""
+    return [(x + dx, y + dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)]
+
+
+if __name__ == "__main__":
+    # Benchmark: python3 evacuation.py [hazards per size]
+    hazards = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = np.random.default_rng(3)
+
+    print("=" * 78)
+    print(f"{'plan':>11} {'cells':>9} {'full BFS ms':>12} {'incremental ms':>15} {'re-routed':>10} {'speedup':>8}")
+    for size in (200, 500, 1000, 2000):
+        walkable, exits, _ = building_plan(size, size)
+        field = DistanceField(walkable, exits)
+        start = time.perf_counter()
+        field.compute()
+        full_ms = (time.perf_counter() - start) * 1000
+
+        times, rerouted = [], []
+        for _ in range(hazards):
+            ys, xs = np.nonzero(walkable)
+            i = int(rng.integers(len(xs)))
+            cells = [(x, y) for x, y in blob(int(xs[i]), int(ys[i]), 2)
+                     if 0 <= x < size and 0 <= y < size]
+            start = time.perf_counter()
+            rerouted.append(field.block(cells))
+            times.append(time.perf_counter() - start)
+            for x, y in cells:
+                walkable[y, x] = False
+        check = DistanceField(walkable, exits)
+        assert np.array_equal(check.dist, field.dist), "incremental field differs from a full search"
+        inc_ms = sum(times) / len(times) * 1000
+        print(f"{size:5d}x{size:<5d} {size * size:9d} {full_ms:12.2f} {inc_ms:15.3f} "
+              f"{sum(rerouted) / len(rerouted):10.0f} {full_ms / inc_ms:7.0f}x")
+    print("=" * 78)
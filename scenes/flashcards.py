@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Flashcard Decks
+Decks of any size in an indexed SQLite store, reviewed with SM-2 spaced
+repetition. A worker thread owns the database: it fetches the next due
+cards and writes grades, so the render thread never waits on disk. Only
+a short look-ahead window of cards is ever held in memory.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+
+DECK_DB = os.path.expanduser("~/.motibeam/decks.sqlite")
+
+DAY = 86400.0
+RELEARN_SECONDS = 60.0  # "again" cards come back within the session
+MAX_WAIT = 60.0         # worker refreshes due counts at least this often
+
+# Grades, SM-2 style (0-5)
+AGAIN = 1
+GOOD = 4
+EASY = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    deck TEXT NOT NULL,
+    front TEXT NOT NULL,
+    back TEXT NOT NULL,
+    due REAL NOT NULL,
+    interval REAL NOT NULL DEFAULT 0,
+    ease REAL NOT NULL DEFAULT 2.5,
+    reps INTEGER NOT NULL DEFAULT 0,
+    lapses INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS cards_due ON cards (deck, due);
+"""
+
+
+class Card:
+    """One card and its scheduling state"""
+
+    __slots__ = ('id', 'front', 'back', 'due', 'interval', 'ease', 'reps', 'lapses')
+
+    def __init__(self, id, front, back, due, interval, ease, reps, lapses):
+        self.id = id
+        self.front = front
+        self.back = back
+        self.due = due
+        self.interval = interval  # days
+        self.ease = ease
+        self.reps = reps
+        self.lapses = lapses
+
+
+def schedule(card, grade, now):
+    """SM-2: update a card's interval, ease and due time for a grade"""
+    if grade < 3:
+        card.reps = 0
+        card.lapses += 1
+        card.interval = 0.0
+        card.due = now + RELEARN_SECONDS
+    else:
+        card.reps += 1
+        if card.reps == 1:
+            card.interval = 1.0
+        elif card.reps == 2:
+            card.interval = 6.0
+        else:
+            card.interval = card.interval * card.ease
+        card.due = now + card.interval * DAY
+    card.ease = max(1.3, card.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    return card
+
+
+class DeckStore:
+    """SQLite-backed cards; use from one thread only"""
+
+    COLUMNS = "id, front, back, due, interval, ease, reps, lapses"
+
+    def __init__(self, path=DECK_DB):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        # Small page cache: memory stays flat however big the deck is
+        self.db.execute("PRAGMA cache_size = -2048")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def add_cards(self, deck, pairs, now=None):
+        """Insert (front, back) pairs as new cards, due now"""
+        now = time.time() if now is None else now
+        with self.db:
+            self.db.executemany("INSERT INTO cards (deck, front, back, due) VALUES (?, ?, ?, ?)",
+                                ((deck, front, back, now) for front, back in pairs))
+
+    def import_file(self, deck, path):
+        """Tab-separated front<TAB>back lines"""
+        with open(path, encoding="utf-8") as f:
+            pairs = (line.rstrip("\n").split("\t", 1) for line in f if "\t" in line)
+            self.add_cards(deck, pairs)
+
+    def count(self, deck):
+        return self.db.execute("SELECT COUNT(*) FROM cards WHERE deck = ?", (deck,)).fetchone()[0]
+
+    def due_count(self, deck, now):
+        return self.db.execute("SELECT COUNT(*) FROM cards WHERE deck = ? AND due <= ?",
+                               (deck, now)).fetchone()[0]
+
+    def next_due(self, deck, now):
+        """Earliest due time still in the future, or None"""
+        return self.db.execute("SELECT MIN(due) FROM cards WHERE deck = ? AND due > ?",
+                               (deck, now)).fetchone()[0]
+
+    def due_cards(self, deck, now, limit, exclude=()):
+        """Up to limit due cards, most overdue first, skipping ids in exclude"""
+        rows = self.db.execute(
+            f"SELECT {self.COLUMNS} FROM cards WHERE deck = ? AND due <= ? "
+            f"ORDER BY due, id LIMIT ?", (deck, now, limit + len(exclude)))
+        cards = [Card(*row) for row in rows if row[0] not in exclude]
+        return cards[:limit]
+
+    def save(self, cards):
+        """Write back scheduling state for cards in one transaction"""
+        with self.db:
+            self.db.executemany("UPDATE cards SET due = ?, interval = ?, ease = ?, reps = ?, lapses = ? "
+                                "WHERE id = ?", ((card.due, card.interval, card.ease, card.reps,
+                                                  card.lapses, card.id) for card in cards))
+
+    def close(self):
+        self.db.close()
+
+
+class DeckSession:
+    """Review session with background prefetch and pre-rendering
+
+    A worker thread fetches due cards into a look-ahead queue, saves
+    grades and wakes to fetch again when the next card falls due.
+    poll() (a scene background task) pre-renders one queued card per
+    frame with render_card(card), so answer() never waits.
+    """
+
+    def __init__(self, deck, render_card, path=DECK_DB, lookahead=8):
+        self.deck = deck
+        self.render_card = render_card
+        self.path = path
+        self.lookahead = lookahead
+        self.fetched = deque()   # Cards from the worker, not yet rendered
+        self.rendered = deque()  # (card, rendered) ready to show
+        self.current = None
+        self.reviewed = 0
+        self.due = 0
+        self.total = 0
+        self.ready = False       # True once the worker has counted due cards
+        self.in_flight = set()   # ids queued, on screen or awaiting their save
+        self._lock = threading.Lock()
+        self._commands = queue.Queue()
+        self._thread = threading.Thread(target=self._work, name="deck", daemon=True)
+        self._thread.start()
+        self._commands.put(("fetch",))
+
+    def _work(self):
+        store = DeckStore(self.path)
+        self.total = store.count(self.deck)
+        running = True
+        timeout = None
+        while running:
+            try:
+                commands = [self._commands.get(timeout=timeout)]
+            except queue.Empty:
+                commands = []  # a card fell due: fetch it
+            # Grades that piled up are written in a single transaction
+            while not self._commands.empty():
+                commands.append(self._commands.get_nowait())
+            running = ("stop",) not in commands
+            graded = [command[1] for command in commands if command[0] == "grade"]
+            if graded:
+                store.save(graded)
+                # Only now can a graded card be fetched again (if still due)
+                with self._lock:
+                    self.in_flight.difference_update(card.id for card in graded)
+            now = time.time()
+            with self._lock:
+                wanted = self.lookahead - len(self.fetched) - len(self.rendered)
+                exclude = set(self.in_flight)
+            if wanted > 0:
+                cards = store.due_cards(self.deck, now, wanted, exclude)
+                with self._lock:
+                    for card in cards:
+                        if card.id not in self.in_flight:
+                            self.in_flight.add(card.id)
+                            self.fetched.append(card)
+            self.due = store.due_count(self.deck, now)
+            self.ready = True
+            # Wake when the next card falls due (e.g. one graded AGAIN),
+            # even if no further grade arrives
+            next_due = store.next_due(self.deck, now)
+            timeout = None if next_due is None else min(MAX_WAIT, max(0.05, next_due - now))
+        store.close()
+
+    def poll(self):
+        """Pre-render the next fetched card; call once per frame"""
+        with self._lock:
+            card = self.fetched.popleft() if self.fetched else None
+        if card is not None:
+            self.rendered.append((card, self.render_card(card)))
+        if self.current is None and self.rendered:
+            self.current = self.rendered.popleft()
+
+    def answer(self, grade):
+        """Grade the card on screen and advance to the next one"""
+        if self.current is None:
+            return
+        card, _ = self.current
+        schedule(card, grade, time.time())
+        self.reviewed += 1
+        self.current = None
+        if not self.rendered:
+            self.poll()  # nothing pre-rendered yet: render now
+        if self.rendered:
+            self.current = self.rendered.popleft()
+        self._commands.put(("grade", card))
+
+    def close(self):
+        self._commands.put(("stop",))
+        self._thread.join(timeout=2)
+
+
+def default_deck(store, deck="vocabulary"):
+    """Seed the built-in vocabulary deck if it is empty"""
+    if store.count(deck) == 0:
+        store.add_cards(deck, [
+            ("Photosynthesis", "Process by which plants convert light into energy"),
+            ("Theorem", "A mathematical statement proven using logic"),
+            ("Catalyst", "Substance that speeds up a chemical reaction"),
+        ])
+
+
+if __name__ == "__main__":
+    # python3 flashcards.py import <deck> <file.tsv>
+    # python3 flashcards.py bench [cards] [reviews]   (uses a temp database)
+    import tempfile
+    import tracemalloc
+
+    if len(sys.argv) >= 4 and sys.argv[1] == "import":
+        store = DeckStore()
+        store.import_file(sys.argv[2], sys.argv[3])
+        print(f"{sys.argv[2]}: {store.count(sys.argv[2])} cards")
+        sys.exit(0)
+
+    cards = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    reviews = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+    path = os.path.join(tempfile.mkdtemp(), "bench.sqlite")
+    store = DeckStore(path)
+    start = time.perf_counter()
+    store.add_cards("bench", ((f"term {i}", f"definition of term {i} " * 3) for i in range(cards)))
+    print(f"Inserted {cards} cards in {time.perf_counter() - start:.2f}s")
+    store.close()
+
+    tracemalloc.start()
+    session = DeckSession("bench", lambda card: (card.front.upper(), card.back.split()), path)
+    while session.current is None:
+        session.poll()
+        time.sleep(0.001)
+    waits = []
+    baseline = None
+    for i in range(reviews):
+        session.poll()
+        start = time.perf_counter()
+        session.answer(GOOD if i % 5 else AGAIN)
+        waits.append(time.perf_counter() - start)
+        if i == 100:
+            baseline = tracemalloc.get_traced_memory()[0]
+        time.sleep(0.0005)  # a frame's worth of breathing room for the worker
+    current, peak = tracemalloc.get_traced_memory()
+    session.close()
+    waits.sort()
+    print(f"{reviews} reviews: answer() p50 {waits[len(waits) // 2] * 1e6:.0f}us "
+          f"p99 {waits[int(len(waits) * 0.99)] * 1e6:.0f}us max {waits[-1] * 1e6:.0f}us")
+    print(f"Python heap after 100 reviews {baseline / 1024:.0f}KB, after {reviews} "
+          f"{current / 1024:.0f}KB (peak {peak / 1024:.0f}KB)")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Font Stack
+The default pygame font has no emoji and few symbols, so headers like
+"💊 MEDICATION SCHEDULE" drew boxes. A FontStack splits text into runs by
+glyph coverage, renders each run with the first font that has its
+glyphs, and caches the composed result, so mixed text costs one dict
+lookup per frame once it has been drawn. Plain single-font text is
+rendered directly as before: caching it would fill memory with every
+clock and counter value ever shown.
+
+Extra fonts come from MOTIBEAM_FONTS (colon-separated paths) and the
+usual Raspberry Pi OS / Debian locations; missing files are skipped.
+"""
+
+import os
+import unicodedata
+from collections import OrderedDict
+
+import pygame
+
+FALLBACK_FONTS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/truetype/noto/NotoEmoji-Regular.ttf",
+    "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSerif.ttf",
+]
+
+# Emoji presentation selectors; we pick fonts per glyph instead
+SELECTORS = {"\ufe0e", "\ufe0f"}
+
+# Unassigned code point: renders as the font's "missing glyph" box
+PROBE = "\u0378"
+
+RENDER_CACHE_SIZE = 512                   # entries, per FontStack
+RENDER_CACHE_BYTES = 8 * 1024 * 1024     # composed surfaces, per FontStack
+
+
+def fallback_paths():
+    extra = [p for p in os.environ.get("MOTIBEAM_FONTS", "").split(":") if p]
+    return [p for p in extra + FALLBACK_FONTS if os.path.exists(p)]
+
+
+_fallbacks = {}   # (path, size) -> Font, or None if it failed to load
+_coverage = {}    # (font, char) -> bool
+_missing_box = {}  # font -> bytes of its missing-glyph rendering
+_warned = set()
+
+
+def _fallback_font(path, size):
+    key = (path, size)
+    if key not in _fallbacks:
+        try:
+            _fallbacks[key] = pygame.font.Font(path, size)
+        except (OSError, pygame.error) as e:
+            print(f"⚠️  Could not load font {path}: {e}")
+            _fallbacks[key] = None
+    return _fallbacks[key]
+
+
+def _glyph_bytes(font, char):
+    image = font.render(char, False, (255, 255, 255), (0, 0, 0))
+    return image.get_size(), pygame.image.tobytes(image, "RGB")
+
+
+def covers(font, char):
+    """True if font has a real glyph for char (not its missing-glyph box)
+
+    Font.metrics() can't tell: it reports the box's metrics for missing
+    BMP characters and nothing at all above U+FFFF.
+    """
+    key = (font, char)
+    result = _coverage.get(key)
+    if result is None:
+        if char.isspace():
+            result = True
+        else:
+            box = _missing_box.get(font)
+            if box is None:
+                box = _missing_box[font] = _glyph_bytes(font, PROBE)
+            result = _glyph_bytes(font, char) != box
+        _coverage[key] = result
+    return result
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class FontStack:
+    """A pygame.font.Font look-alike that falls back per glyph
+
+    Supports render(), size(), get_linesize(), get_height() and
+    get_ascent(), so it works with text_layout and existing scene code.
+    """
+
+    def __init__(self, primary, size, paths=None):
+        self.primary = primary
+        self.size_px = size
+        self.paths = fallback_paths() if paths is None else paths
+        self.fonts = [primary]
+        self._loaded = False
+        self._runs = {}
+        self._rendered = OrderedDict()
+        self._rendered_bytes = 0
+
+    def _all_fonts(self):
+        # Fallbacks load on first non-ASCII text, not at startup
+        if not self._loaded:
+            self._loaded = True
+            for path in self.paths:
+                font = _fallback_font(path, self.size_px)
+                if font is not None:
+                    self.fonts.append(font)
+        return self.fonts
+
+    def runs(self, text):
+        """[(font, substring)] covering text, merging neighbours"""
+        runs = self._runs.get(text)
+        if runs is not None:
+            return runs
+        if text.isascii():
+            # Nothing to look up, so not worth a cache entry
+            return [(self.primary, text)] if text else []
+        runs = []
+        dropped = []
+        for char in text:
+            if char in SELECTORS:
+                continue
+            font = next((f for f in self._all_fonts() if covers(f, char)), None)
+            if font is None:
+                if unicodedata.combining(char) and runs:
+                    font = runs[-1][0]
+                else:
+                    dropped.append(char)
+                    continue
+            if runs and runs[-1][0] is font:
+                runs[-1] = (font, runs[-1][1] + char)
+            else:
+                runs.append((font, char))
+        if dropped:
+            self._warn(dropped)
+            # Don't leave a dangling space where an icon was
+            if runs and runs[0][1][:1].isspace():
+                runs[0] = (runs[0][0], runs[0][1].lstrip())
+            runs = [run for run in runs if run[1]]
+        if len(self._runs) > RENDER_CACHE_SIZE:
+            self._runs.clear()
+        self._runs[text] = runs
+        return runs
+
+    def _warn(self, chars):
+        new = [c for c in chars if c not in _warned]
+        if new:
+            _warned.update(new)
+            names = ", ".join(f"U+{ord(c):04X}" for c in new)
+            print(f"⚠️  No font has glyphs for {names}; install fonts-noto-color-emoji or set MOTIBEAM_FONTS")
+
+    def _render_run(self, font, text, antialias, color):
+        """Rendered run and its ascent (baseline offset from the top)"""
+        image = font.render(text, antialias, color)
+        ascent = font.get_ascent()
+        # Bitmap emoji fonts render at their fixed strike size
+        target = self.primary.get_height()
+        if font is not self.primary and abs(image.get_height() - target) > target // 4:
+            width = max(1, image.get_width() * target // image.get_height())
+            ascent = ascent * target // image.get_height()
+            if image.get_bitsize() >= 24:
+                image = pygame.transform.smoothscale(image, (width, target))
+            else:
+                image = pygame.transform.scale(image, (width, target))
+        return image, ascent
+
+    def render(self, text, antialias, color, background=None):
+        if background is not None:
+            background = tuple(background)
+        key = (text, antialias, tuple(color), background)
+        image = self._rendered.get(key)
+        if image is not None:
+            self._rendered.move_to_end(key)
+            return image
+        runs = self.runs(text)
+        if len(runs) <= 1 and (not runs or runs[0][0] is self.primary):
+            return self.primary.render(runs[0][1] if runs else "", antialias, color, background)
+        # Only composed fallback layouts are cached
+        images = [self._render_run(font, run, antialias, color) for font, run in runs]
+        # Line runs up on the baseline
+        ascent = max(run_ascent for _, run_ascent in images)
+        height = max(ascent - run_ascent + run.get_height() for run, run_ascent in images)
+        width = sum(run.get_width() for run, _ in images)
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        if background is not None:
+            image.fill(background)
+        x = 0
+        for run, run_ascent in images:
+            image.blit(run, (x, ascent - run_ascent))
+            x += run.get_width()
+        self._rendered[key] = image
+        self._rendered_bytes += _surface_bytes(image)
+        while len(self._rendered) > RENDER_CACHE_SIZE or \
+                (self._rendered_bytes > RENDER_CACHE_BYTES and len(self._rendered) > 1):
+            _, evicted = self._rendered.popitem(last=False)
+            self._rendered_bytes -= _surface_bytes(evicted)
+        return image
+
+    def size(self, text):
+        runs = self.runs(text)
+        if len(runs) <= 1 and (not runs or runs[0][0] is self.primary):
+            return self.primary.size(runs[0][1] if runs else "")
+        # Fallback runs may be rescaled, so measure what render() draws
+        return self.render(text, True, (255, 255, 255)).get_size()
+
+    def get_linesize(self):
+        return self.primary.get_linesize()
+
+    def get_height(self):
+        return self.primary.get_height()
+
+    def get_ascent(self):
+        return self.primary.get_ascent()
+
+    def get_descent(self):
+        return self.primary.get_descent()
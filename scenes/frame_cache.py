@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Frame Cache
+Pre-rendered raw frames (boot screen, main menu) in a memory-mapped file,
+keyed by resolution, content hash and engine version, so a cold start can
+put pixels on the projector before fonts or scenes are loaded.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+ENGINE_VERSION = "3.0"
+CACHE_DIR = os.path.expanduser("~/.cache/motibeam")
+
+MAGIC = b"MBFRAME1"
+PIXEL_FORMAT = "RGBX"
+ALIGN = 4096
+
+
+def content_hash(*paths, extra=""):
+    """Hash of the source files (and extra data) that determine the frames"""
+    digest = hashlib.sha1(extra.encode())
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode())
+    return digest.hexdigest()
+
+
+class FrameCache:
+    """Named full-screen frames stored in one mmap-able file
+
+    get() returns surfaces that read straight from the mapping; blit them
+    and drop them, don't keep them past close().
+    """
+
+    def __init__(self, size, content_key, cache_dir=CACHE_DIR):
+        self.size = tuple(size)
+        width, height = self.size
+        ident = f"{ENGINE_VERSION}|{pygame.version.ver}|{width}x{height}|{content_key}"
+        self.key = hashlib.sha1(ident.encode()).hexdigest()
+        self.cache_dir = cache_dir
+        self.prefix = f"frames-{width}x{height}-"
+        self.path = os.path.join(cache_dir, f"{self.prefix}{self.key[:16]}.bin")
+        self.frames = {}
+        self.rendered = {}  # frames put() this run; kept for later saves
+        self._file = None
+        self._map = None
+        self._saver = None
+
+    def open(self):
+        """Map the cache file; False if missing or built for other content"""
+        try:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError("bad magic")
+            (header_len,) = struct.unpack_from("<I", self._map, len(MAGIC))
+            start = len(MAGIC) + 4
+            header = json.loads(self._map[start:start + header_len])
+            if header["key"] != self.key or header["format"] != PIXEL_FORMAT:
+                raise ValueError("stale cache")
+            self.frames = {name: tuple(span) for name, span in header["frames"].items()}
+            return True
+        except (OSError, ValueError, KeyError, struct.error):
+            self.close()
+            return False
+
+    def get(self, name):
+        """Surface backed by the mapping, or None"""
+        span = self.frames.get(name)
+        if span is None or self._map is None:
+            return None
+        offset, length = span
+        view = memoryview(self._map)[offset:offset + length]
+        return pygame.image.frombuffer(view, self.size, PIXEL_FORMAT)
+
+    def has(self, name):
+        return name in self.frames or name in self.rendered
+
+    def put(self, name, surface):
+        """Add a frame to be written by save()"""
+        self.rendered[name] = pygame.image.tobytes(surface, PIXEL_FORMAT)
+
+    def save(self):
+        """Write mapped and newly rendered frames to a new file atomically"""
+        blobs = {}
+        for name in self.frames:
+            if name not in self.rendered:
+                surface = self.get(name)
+                if surface is not None:
+                    blobs[name] = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        blobs.update(self.rendered)
+        if not blobs:
+            return
+
+        # Lay out header then page-aligned frames so each maps cleanly
+        names = sorted(blobs)
+        frames = {}
+        header_len = 4096
+        offset = ALIGN * ((len(MAGIC) + 4 + header_len + ALIGN - 1) // ALIGN)
+        for name in names:
+            frames[name] = [offset, len(blobs[name])]
+            offset += ALIGN * ((len(blobs[name]) + ALIGN - 1) // ALIGN)
+        header = json.dumps({"key": self.key, "format": PIXEL_FORMAT,
+                             "size": list(self.size), "frames": frames}).encode()
+        if len(header) > header_len:
+            raise ValueError("frame cache header too large")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for name in names:
+                f.seek(frames[name][0])
+                f.write(blobs[name])
+        os.replace(tmp_path, self.path)
+        self._remove_stale()
+
+    def save_async(self):
+        """save() on a background thread; pixel data was copied by put()"""
+        previous = self._saver
+
+        def save_after_previous():
+            if previous:
+                previous.join()
+            self.save()
+
+        self._saver = threading.Thread(target=save_after_previous, name="frame-cache", daemon=True)
+        self._saver.start()
+
+    def _remove_stale(self):
+        # Older content hashes for this resolution are never read again
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(self.prefix) and name.endswith(".bin") and path != self.path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # a surface still references the mapping
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Frame Sources
+Camera-like frame sources (device, video file, image directory,
+procedural) with the cv2.VideoCapture read()/grab()/release() interface,
+so anything that takes a camera can run against a replay or synthetic
+feed instead. to_gray() and env_activity() are the per-frame environment
+sensing that motibeam_os and vision_bench share.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import math
+import os
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class FrameSource:
+    """Base class: subclasses implement _next() returning a BGR frame or None"""
+
+    def __init__(self, size=None):
+        self.size = tuple(size) if size else None  # (width, height) to deliver
+        self.frames = 0
+
+    def isOpened(self):
+        return True
+
+    def _next(self):
+        """Override in subclass"""
+        return None
+
+    def _fit(self, frame):
+        if self.size and (frame.shape[1], frame.shape[0]) != self.size:
+            frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        return frame
+
+    def read(self):
+        frame = self._next()
+        if frame is None:
+            return False, None
+        self.frames += 1
+        return True, self._fit(frame)
+
+    def grab(self):
+        return self.read()[0]
+
+    def release(self):
+        pass
+
+
+class DeviceSource(FrameSource):
+    """A live camera via cv2.VideoCapture"""
+
+    def __init__(self, device=0, size=(640, 480)):
+        super().__init__(size)
+        self.capture = cv2.VideoCapture(device)
+        if size:
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+
+    def isOpened(self):
+        return self.capture.isOpened()
+
+    def _next(self):
+        ret, frame = self.capture.read()
+        return frame if ret else None
+
+    def grab(self):
+        return self.capture.grab()
+
+    def release(self):
+        self.capture.release()
+
+
+class VideoFileSource(FrameSource):
+    """A recorded clip, optionally looping"""
+
+    def __init__(self, path, size=None, loop=True):
+        super().__init__(size)
+        self.path = path
+        self.loop = loop
+        self.capture = cv2.VideoCapture(path)
+
+    def isOpened(self):
+        return self.capture.isOpened()
+
+    def _next(self):
+        ret, frame = self.capture.read()
+        if not ret and self.loop and self.frames:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.capture.read()
+        return frame if ret else None
+
+    def release(self):
+        self.capture.release()
+
+
+class ImageDirSource(FrameSource):
+    """Still images from a directory in name order
+
+    Images are decoded once up front so a benchmark measures the
+    pipeline, not the disk.
+    """
+
+    def __init__(self, path, size=None, loop=True):
+        super().__init__(size)
+        self.loop = loop
+        names = sorted(n for n in os.listdir(path) if n.lower().endswith(IMAGE_EXTENSIONS))
+        images = (cv2.imread(os.path.join(path, n)) for n in names)
+        self.images = [self._fit(image) for image in images if image is not None]
+        self.index = 0
+
+    def isOpened(self):
+        return bool(self.images)
+
+    def _next(self):
+        if self.index >= len(self.images):
+            if not self.loop or not self.images:
+                return None
+            self.index = 0
+        frame = self.images[self.index]
+        self.index += 1
+        return frame
+
+
+class SyntheticSource(FrameSource):
+    """Procedural scene: textured background, a moving figure and sensor noise
+
+    Deterministic for a given seed, so runs are comparable.
+    """
+
+    def __init__(self, size=(640, 480), noise=8, seed=0, limit=None):
+        super().__init__(size)
+        self.noise = noise
+        self.limit = limit
+        self.rng = np.random.default_rng(seed)
+        width, height = self.size
+        yy, xx = np.mgrid[0:height, 0:width]
+        texture = 90 + 40 * np.sin(xx / 23.0) * np.cos(yy / 31.0)
+        self.background = cv2.cvtColor(texture.astype(np.uint8), cv2.COLOR_GRAY2BGR)
+        self.noise_frames = [self.rng.integers(-noise, noise + 1, (height, width, 1), dtype=np.int16)
+                             for _ in range(8)] if noise else None
+
+    def _next(self):
+        if self.limit is not None and self.frames >= self.limit:
+            return None
+        width, height = self.size
+        t = self.frames / 30.0
+        frame = self.background.copy()
+        # A figure walking across the frame, nodding its head
+        cx = int(width * (0.5 + 0.35 * math.sin(t * 0.7)))
+        cy = int(height * (0.45 + 0.03 * math.sin(t * 6.0)))
+        radius = max(4, height // 12)
+        cv2.rectangle(frame, (cx - radius, cy + radius), (cx + radius, cy + 4 * radius), (60, 60, 200), -1)
+        cv2.circle(frame, (cx, cy), radius, (170, 190, 220), -1)
+        if self.noise_frames:
+            noisy = frame.astype(np.int16) + self.noise_frames[self.frames % len(self.noise_frames)]
+            frame = np.clip(noisy, 0, 255).astype(np.uint8)
+        return frame
+
+
+def to_gray(frame):
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+def env_activity(gray):
+    """Scene activity of a grayscale frame: the spread of its pixel values"""
+    return float(np.std(gray))
+
+
+def open_source(spec, size=None):
+    """Frame source from a spec string
+
+    "synthetic", "device:0", "video:clip.mp4", "images:dir/", or a bare
+    path (directory -> images, file -> video) or camera index.
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "synthetic":
+        return SyntheticSource(size or (640, 480))
+    if kind == "device":
+        return DeviceSource(int(arg or 0), size or (640, 480))
+    if kind == "video":
+        return VideoFileSource(arg, size)
+    if kind == "images":
+        return ImageDirSource(arg, size)
+    if spec.isdigit():
+        return DeviceSource(int(spec), size or (640, 480))
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, size)
+    return VideoFileSource(spec, size)
+
+
+if __name__ == "__main__":
+    # Dump frames from a source: python3 frame_sources.py <spec> <outdir> [count]
+    if len(sys.argv) < 3:
+        sys.exit("Usage: frame_sources.py <spec> <outdir> [count]")
+    source = open_source(sys.argv[1])
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 30
+    os.makedirs(sys.argv[2], exist_ok=True)
+    for i in range(count):
+        ret, frame = source.read()
+        if not ret:
+            break
+        cv2.imwrite(os.path.join(sys.argv[2], f"frame{i:04d}.png"), frame)
+    source.release()
+    print(f"Wrote {source.frames} frames to {sys.argv[2]}")
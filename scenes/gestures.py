@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Gesture Recognition
+Sparse optical flow over a region of interest at reduced resolution.
+Classifies head nods and hand waves within a fixed CPU budget per frame.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import math
+import os
+import time
+
+import cv2
+import numpy as np
+import pygame
+
+from metrics import metrics
+from scene_base import GESTURE_EVENT
+
+
+class StrokeCounter:
+    """Counts direction reversals along one axis"""
+
+    def __init__(self, min_amplitude):
+        self.min_amplitude = min_amplitude
+        self.reset()
+
+    def reset(self):
+        self.direction = 0
+        self.extent = 0.0
+        self.strokes = 0
+        self.travel = 0.0
+
+    def add(self, delta):
+        self.travel += abs(delta)
+        direction = 1 if delta > 0 else -1 if delta < 0 else 0
+        if direction == 0:
+            return
+        if direction == self.direction:
+            self.extent += abs(delta)
+            return
+        # Direction flipped - the finished segment counts if it was big enough
+        if self.extent >= self.min_amplitude:
+            self.strokes += 1
+        self.direction = direction
+        self.extent = abs(delta)
+
+    def completed(self):
+        """Strokes including the one in progress"""
+        return self.strokes + (1 if self.extent >= self.min_amplitude else 0)
+
+
+class GesturePipeline:
+    """Tracks features in a region of interest and classifies gestures"""
+
+    def __init__(self, proc_width=160, roi=(0.3, 0.1, 0.4, 0.5),
+                 budget_ms=4.0, window=1.2, cooldown=1.0,
+                 min_amplitude=0.06, use_face=True):
+        self.proc_width = proc_width
+        self.default_roi = roi  # x, y, w, h as fractions of the frame
+        self.budget_ms = budget_ms
+        self.window = window
+        self.cooldown = cooldown
+
+        self.vertical = StrokeCounter(min_amplitude)
+        self.horizontal = StrokeCounter(min_amplitude)
+        self.window_start = None
+        self.last_event_time = -cooldown
+
+        self.prev_gray = None
+        self.points = None
+        self.roi_px = None
+        self.frames_since_seed = 0
+
+        # Adaptive frame skipping
+        self.stride = 1
+        self.frame_index = 0
+        self.avg_cost_ms = 0.0
+        self.processed = 0
+        self.skipped = 0
+
+        self.face_cascade = None
+        if use_face and hasattr(cv2, "data"):
+            path = os.path.join(cv2.data.haarcascades, "haarcascade_frontalface_default.xml")
+            if os.path.exists(path):
+                self.face_cascade = cv2.CascadeClassifier(path)
+
+    def should_process(self):
+        """True if this frame fits the CPU budget; otherwise it is skipped"""
+        self.frame_index += 1
+        if self.frame_index % self.stride == 0:
+            return True
+        self.skipped += 1
+        return False
+
+    def _prepare(self, frame):
+        h, w = frame.shape[:2]
+        scale = self.proc_width / float(w)
+        small = cv2.resize(frame, (self.proc_width, max(1, int(h * scale))),
+                           interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def _find_roi(self, gray):
+        h, w = gray.shape
+        if self.face_cascade is not None:
+            faces = self.face_cascade.detectMultiScale(gray, 1.2, 3, minSize=(16, 16))
+            if len(faces):
+                return tuple(max(faces, key=lambda f: f[2] * f[3]))
+        fx, fy, fw, fh = self.default_roi
+        return (int(fx * w), int(fy * h), int(fw * w), int(fh * h))
+
+    def _seed(self, gray):
+        self.roi_px = self._find_roi(gray)
+        x, y, w, h = self.roi_px
+        mask = np.zeros_like(gray)
+        mask[y:y + h, x:x + w] = 255
+        self.points = cv2.goodFeaturesToTrack(gray, maxCorners=30, qualityLevel=0.01,
+                                              minDistance=3, mask=mask)
+        self.frames_since_seed = 0
+
+    def _adapt(self, cost_ms):
+        # Exponential average so one slow frame doesn't thrash the stride
+        if self.processed == 0:
+            self.avg_cost_ms = cost_ms
+        else:
+            self.avg_cost_ms = 0.8 * self.avg_cost_ms + 0.2 * cost_ms
+        self.processed += 1
+        self.stride = max(1, min(8, int(math.ceil(self.avg_cost_ms / self.budget_ms))))
+
+    def process(self, frame, now=None):
+        """Process one camera frame; returns a gesture name or None"""
+        start = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        gesture = self._track(self._prepare(frame), now)
+        self._adapt((time.perf_counter() - start) * 1000)
+        return gesture
+
+    def _track(self, gray, now):
+        if self.prev_gray is None or self.points is None or len(self.points) < 6 \
+                or self.frames_since_seed > 90:
+            self._seed(gray)
+            self.prev_gray = gray
+            return None
+
+        new_points, status, _ = cv2.calcOpticalFlowPyrLK(
+            self.prev_gray, gray, self.points, None, winSize=(11, 11), maxLevel=2)
+        self.prev_gray = gray
+        self.frames_since_seed += 1
+        if new_points is None:
+            self.points = None
+            return None
+
+        good = status.reshape(-1) == 1
+        if not good.any():
+            self.points = None
+            return None
+        motion = (new_points[good] - self.points[good]).reshape(-1, 2)
+        self.points = new_points[good].reshape(-1, 1, 2)
+
+        # Median is robust to a few bad tracks; normalise by ROI size
+        dx, dy = np.median(motion, axis=0)
+        roi_h = max(1, self.roi_px[3])
+        return self._classify(dx / roi_h, dy / roi_h, now)
+
+    def _classify(self, dx, dy, now):
+        if self.window_start is None or now - self.window_start > self.window:
+            self.vertical.reset()
+            self.horizontal.reset()
+            self.window_start = now
+        self.vertical.add(dy)
+        self.horizontal.add(dx)
+
+        if now - self.last_event_time < self.cooldown:
+            return None
+
+        gesture = None
+        if self.vertical.completed() >= 2 and self.vertical.travel > 2 * self.horizontal.travel:
+            gesture = "nod"
+        elif self.horizontal.completed() >= 3 and self.horizontal.travel > 2 * self.vertical.travel:
+            gesture = "wave"
+
+        if gesture:
+            self.last_event_time = now
+            self.window_start = None
+        return gesture
+
+
+class GestureInput:
+    """Reads a capture source and posts GESTURE_EVENTs for scenes
+
+    Call poll() once per frame. Frames over the CPU budget are grabbed
+    but not decoded, so the capture buffer never backs up.
+    """
+
+    def __init__(self, capture, pipeline=None):
+        self.capture = capture
+        self.pipeline = pipeline or GesturePipeline()
+
+    def poll(self):
+        if not self.pipeline.should_process():
+            if self.capture.grab():
+                metrics.camera_frame()
+            return None
+        ret, frame = self.capture.read()
+        if not ret:
+            return None
+        metrics.camera_frame()
+        gesture = self.pipeline.process(frame)
+        if gesture:
+            pygame.event.post(pygame.event.Event(GESTURE_EVENT, gesture=gesture))
+        return gesture
+
+
+def attach_camera(scene, device=0):
+    """Feed camera gestures into a scene; returns the capture or None"""
+    capture = cv2.VideoCapture(device)
+    if not capture.isOpened():
+        print("⚠️  Camera not available, gestures disabled")
+        return None
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    scene.input_sources.append(GestureInput(capture))
+    return capture
+
+
+if __name__ == "__main__":
+    # Replay a recorded video: python3 gestures.py clip.mp4
+    if len(sys.argv) < 2:
+        sys.exit("Usage: gestures.py <video file>")
+
+    capture = cv2.VideoCapture(sys.argv[1])
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30
+    pipeline = GesturePipeline()
+    frame_number = 0
+    while True:
+        if not pipeline.should_process():
+            if not capture.grab():
+                break
+            frame_number += 1
+            continue
+        ret, frame = capture.read()
+        if not ret:
+            break
+        # Use video time so results don't depend on decode speed
+        gesture = pipeline.process(frame, now=frame_number / fps)
+        if gesture:
+            print(f"{frame_number / fps:7.2f}s  {gesture}")
+        frame_number += 1
+    capture.release()
+    print(f"Processed {pipeline.processed} frames, skipped {pipeline.skipped}, "
+          f"avg cost {pipeline.avg_cost_ms:.2f}ms, stride {pipeline.stride}")
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Guardian Engine
+Motion events from home sensors arrive as datagrams on a local UDP or
+Unix socket, each datagram a packed batch of fixed-size records. A batch
+is decoded with one numpy.frombuffer and folded into per-room and
+per-resident last-activity arrays with vectorized max-updates, so the
+cost per event is constant however many rooms and residents there are.
+
+Inactivity alerts come from a hashed timer wheel. Activity never touches
+the wheel: each resident has at most one timer, and when it expires the
+wheel checks the resident's current last-activity and either re-arms at
+the real deadline or raises the alert. Nothing scans all residents.
+
+Resident 0 is the household: every event counts as activity for it.
+Sensor address: MOTIBEAM_GUARDIAN=udp:127.0.0.1:9109 or unix:/path.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from metrics import metrics
+
+# One motion event on the wire: little-endian, 14 bytes
+RECORD = np.dtype([("t", "<f8"), ("sensor", "<u2"), ("room", "<u2"), ("resident", "<u2")])
+
+# Rooms and residents are u2 indexes on the wire
+MAX_INDEXED = np.iinfo(RECORD["room"]).max + 1
+
+HOUSEHOLD = 0
+INACTIVITY_SECONDS = 2 * 3600
+MAX_DATAGRAM = 65536
+
+# Default home layout; sensors send room and resident indexes into these
+HOME_ROOMS = ["Kitchen", "Living Room", "Bedroom", "Bathroom", "Hallway", "Entrance"]
+HOME_RESIDENTS = ["Household", "Resident"]
+
+
+def encode(events):
+    """Pack (time, sensor, room, resident) tuples into one datagram"""
+    return np.array(events, dtype=RECORD).tobytes()
+
+
+def parse_address(address):
+    """("udp", (host, port)) or ("unix", path) from "udp:host:port" / "unix:/path" """
+    kind, _, rest = address.partition(":")
+    if kind == "unix":
+        return socket.AF_UNIX, rest
+    if kind == "udp":
+        host, _, port = rest.rpartition(":")
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    raise ValueError(f"Address must be udp:host:port or unix:/path, not {address!r}")
+
+
+def open_socket(address):
+    """Non-blocking datagram socket bound to address"""
+    family, target = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    if family == socket.AF_UNIX and os.path.exists(target):
+        os.unlink(target)
+    # Room for bursts while the render thread is busy
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    sock.bind(target)
+    sock.setblocking(False)
+    return sock
+
+
+class GuardianSender:
+    """Sends event batches to a Guardian; for sensor bridges and tests"""
+
+    def __init__(self, address):
+        self.family, self.target = parse_address(address)
+        self.sock = socket.socket(self.family, socket.SOCK_DGRAM)
+
+    def send(self, events):
+        self.sock.sendto(encode(events), self.target)
+
+    def send_records(self, records):
+        self.sock.sendto(records.tobytes(), self.target)
+
+    def close(self):
+        self.sock.close()
+
+
+class TimerWheel:
+    """Hashed timing wheel: O(1) schedule, advance cost ~ elapsed ticks
+
+    Timers further out than one revolution stay in their slot and are
+    passed over until their round comes up.
+    """
+
+    def __init__(self, tick=1.0, slots=4096, now=None):
+        self.tick = tick
+        self.slots = [[] for _ in range(slots)]
+        self.current = int((time.time() if now is None else now) // tick)
+
+    def schedule(self, key, deadline):
+        index = max(int(deadline // self.tick), self.current)
+        self.slots[index % len(self.slots)].append((deadline, key))
+
+    def advance(self, now):
+        """[(deadline, key)] of timers due by now, removed from the wheel"""
+        target = int(now // self.tick)
+        due = []
+        ticks = range(self.current, target + 1)
+        if len(ticks) > len(self.slots):
+            ticks = range(target - len(self.slots) + 1, target + 1)
+        for index in ticks:
+            slot = self.slots[index % len(self.slots)]
+            if not slot:
+                continue
+            pending = [timer for timer in slot if timer[0] > now]
+            if len(pending) < len(slot):
+                due.extend(timer for timer in slot if timer[0] <= now)
+                slot[:] = pending
+        self.current = target
+        return due
+
+
+class GuardianAlert:
+    __slots__ = ('resident', 'since', 'room', 'raised')
+
+    def __init__(self, resident, since, room, raised):
+        self.resident = resident  # index into Guardian.residents
+        self.since = since        # time of last activity
+        self.room = room          # index into Guardian.rooms
+        self.raised = raised
+
+
+class Guardian:
+    """Last activity per room and resident, with inactivity alerts"""
+
+    def __init__(self, rooms, residents, threshold=INACTIVITY_SECONDS, address=None, tick=1.0, now=None):
+        now = time.time() if now is None else now
+        self.rooms = list(rooms)
+        self.residents = list(residents)  # residents[0] is the household
+        if len(self.rooms) > MAX_INDEXED or len(self.residents) > MAX_INDEXED:
+            raise ValueError(f"At most {MAX_INDEXED} rooms and {MAX_INDEXED} residents fit the wire format, "
+                             f"not {len(self.rooms)} and {len(self.residents)}")
+        self.room_last = np.zeros(len(self.rooms))
+        self.resident_last = np.full(len(self.residents), now)
+        self.resident_room = np.zeros(len(self.residents), dtype=np.int64)
+        self.thresholds = np.full(len(self.residents), float(threshold))
+        self.wheel = TimerWheel(tick, now=now)
+        self.armed = np.ones(len(self.residents), dtype=bool)
+        for resident in range(len(self.residents)):
+            self.wheel.schedule(resident, now + threshold)
+        self.alerts = {}  # resident -> active GuardianAlert
+        self.raised = deque(maxlen=32)  # every alert raised, newest last
+        # alerts/raised change on the guardian thread; the render thread
+        # reads the published _active snapshot instead of iterating them
+        self._lock = threading.Lock()
+        self._active = None
+        self.events = 0
+        self.batches = 0
+        self.malformed = 0
+        self.rate = 0.0
+        self._rate_start = now
+        self._rate_count = 0
+        self.sock = open_socket(address) if address else None
+        self.address = address
+        self._buffer = bytearray(MAX_DATAGRAM)
+        self._thread = None
+        self._stop = threading.Event()
+
+    def ingest(self, records):
+        """Fold a batch of RECORD rows into the last-activity state"""
+        valid = (records["room"] < len(self.rooms)) & (records["resident"] < len(self.residents))
+        if not valid.all():
+            self.malformed += int((~valid).sum())
+            records = records[valid]
+        if not len(records):
+            return
+        times, rooms, residents = records["t"], records["room"].astype(np.int64), records["resident"].astype(np.int64)
+        np.maximum.at(self.room_last, rooms, times)
+        np.maximum.at(self.resident_last, residents, times)
+        latest = times >= self.resident_last[residents]
+        self.resident_room[residents[latest]] = rooms[latest]
+        newest = int(np.argmax(times))
+        if times[newest] >= self.resident_last[HOUSEHOLD]:
+            self.resident_last[HOUSEHOLD] = times[newest]
+            self.resident_room[HOUSEHOLD] = rooms[newest]
+
+        # Only residents without a timer (alerted, or new) touch the wheel
+        seen = np.unique(np.append(residents, HOUSEHOLD))
+        for resident in seen[~self.armed[seen]].tolist():
+            self.armed[resident] = True
+            self.wheel.schedule(resident, self.resident_last[resident] + self.thresholds[resident])
+        if self.alerts:
+            with self._lock:
+                for resident in seen.tolist():
+                    self.alerts.pop(resident, None)
+                self._publish()
+
+        self.events += len(records)
+        self.batches += 1
+        self._rate_count += len(records)
+
+    def ingest_bytes(self, data):
+        usable = len(data) - len(data) % RECORD.itemsize
+        if usable != len(data):
+            self.malformed += 1
+        self.ingest(np.frombuffer(data, dtype=RECORD, count=usable // RECORD.itemsize))
+
+    def receive(self, max_batches=256):
+        """Drain queued datagrams without blocking; returns batches read"""
+        if self.sock is None:
+            return 0
+        view = memoryview(self._buffer)
+        for count in range(max_batches):
+            try:
+                size = self.sock.recv_into(self._buffer)
+            except BlockingIOError:
+                return count
+            self.ingest_bytes(view[:size])
+        return max_batches
+
+    def check(self, now=None):
+        """Expire due timers: re-arm residents who moved since, alert the rest"""
+        now = time.time() if now is None else now
+        raised = []
+        for _, resident in self.wheel.advance(now):
+            deadline = self.resident_last[resident] + self.thresholds[resident]
+            if deadline > now:
+                self.wheel.schedule(resident, deadline)
+                continue
+            self.armed[resident] = False
+            alert = GuardianAlert(resident, float(self.resident_last[resident]),
+                                  int(self.resident_room[resident]), now)
+            with self._lock:
+                self.alerts[resident] = alert
+                self.raised.append(alert)
+                self._publish()
+            raised.append(alert)
+            metrics.inc("motibeam_guardian_alerts_total")
+        if now - self._rate_start >= 1.0:
+            self.rate = self._rate_count / (now - self._rate_start)
+            metrics.inc("motibeam_guardian_events_total", self._rate_count)
+            self._rate_start = now
+            self._rate_count = 0
+        return raised
+
+    def poll(self, now=None):
+        """Receive and check; call once per frame, or let start() do it"""
+        self.receive()
+        return self.check(now)
+
+    def start(self):
+        """Run poll() on a daemon thread, waking for data or the next tick"""
+        def loop():
+            while not self._stop.is_set():
+                if self.sock is not None:
+                    select.select([self.sock], [], [], self.wheel.tick)
+                else:
+                    self._stop.wait(self.wheel.tick)
+                self.poll()
+        self._thread = threading.Thread(target=loop, name="guardian", daemon=True)
+        self._thread.start()
+        print(f"Guardian listening on {self.address}")
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self.sock is not None:
+            self.sock.close()
+            if self.address.startswith("unix:"):
+                try:
+                    os.unlink(self.address[5:])
+                except OSError:
+                    pass
+
+    def bound_address(self):
+        """The address senders should use (resolves udp port 0)"""
+        if self.sock is not None and self.sock.family == socket.AF_INET:
+            host, port = self.sock.getsockname()
+            return f"udp:{host}:{port}"
+        return self.address
+
+    def last_activity(self, resident=HOUSEHOLD):
+        """(time, room name) of a resident's latest activity"""
+        return float(self.resident_last[resident]), self.rooms[self.resident_room[resident]]
+
+    def _publish(self):
+        # Caller holds _lock
+        self._active = next((alert for alert in reversed(self.raised)
+                             if self.alerts.get(alert.resident) is alert), None)
+
+    def active_alert(self):
+        """The most recently raised alert still unresolved, if any; any thread"""
+        return self._active
+
+
+class SimulatedHome:
+    """Sends motion like a resident moving around, with quiet spells"""
+
+    def __init__(self, address, rooms, active_seconds=15, quiet_seconds=35, rate=40, seed=5):
+        self.sender = GuardianSender(address)
+        self.rooms = rooms
+        self.active_seconds = active_seconds
+        self.quiet_seconds = quiet_seconds
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="guardian-sim", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        room = 0
+        cycle_start = time.time()
+        while not self._stop.wait(0.1):
+            now = time.time()
+            phase = (now - cycle_start) % (self.active_seconds + self.quiet_seconds)
+            if phase >= self.active_seconds:
+                continue
+            if self.rng.random() < 0.05:
+                room = int(self.rng.integers(len(self.rooms)))
+            count = int(self.rng.poisson(self.rate / 10))
+            if count:
+                self.sender.send([(now, room * 4 + i % 4, room, 1) for i in range(count)])
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self.sender.close()
+
+
+def _flood(address, total, batch, seed):
+    """Benchmark sender (runs in a child process)"""
+    rng = np.random.default_rng(seed)
+    records = np.zeros(batch, dtype=RECORD)
+    records["sensor"] = rng.integers(0, 200, batch)
+    records["room"] = records["sensor"] % 40
+    records["resident"] = rng.integers(0, 4, batch)
+    sender = GuardianSender(address)
+    for _ in range(total // batch):
+        records["t"] = time.time()
+        sender.send_records(records)
+    sender.close()
+
+
+if __name__ == "__main__":
+    # Benchmark: python3 guardian.py [events]
+    import multiprocessing
+    import tempfile
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rooms = [f"Room {i}" for i in range(40)]
+    residents = ["Household", "A", "B", "C"]
+
+    print("=" * 72)
+    print(f"{'transport':10} {'batch':>6} {'events/s':>12} {'received':>10} {'lost':>7} {'us/batch':>9}")
+    for kind in ("udp", "unix"):
+        for batch in (1, 16, 256, 2048):
+            events = min(total, 20000 * batch)
+            if kind == "udp":
+                address = "udp:127.0.0.1:0"
+            else:
+                address = "unix:" + os.path.join(tempfile.mkdtemp(), "guardian.sock")
+            guardian = Guardian(rooms, residents, address=address)
+            sender = multiprocessing.Process(target=_flood, args=(guardian.bound_address(), events, batch, 1))
+            start = time.perf_counter()
+            sender.start()
+            busy = 0.0
+            while sender.is_alive() or select.select([guardian.sock], [], [], 0)[0]:
+                select.select([guardian.sock], [], [], 0.05)
+                work = time.perf_counter()
+                guardian.poll()
+                busy += time.perf_counter() - work
+            elapsed = time.perf_counter() - start
+            sender.join()
+            sent = events // batch * batch
+            print(f"{kind:10} {batch:6d} {guardian.events / elapsed:12.0f} {guardian.events:10d} "
+                  f"{sent - guardian.events:7d} {busy / max(1, guardian.batches) * 1e6:9.1f}")
+            guardian.stop()
+
+    # Inactivity checks: timer wheel vs scanning every resident each tick
+    count = MAX_INDEXED
+    now = 1000000.0
+    guardian = Guardian(rooms, [f"R{i}" for i in range(count)], threshold=3600, now=now)
+    rng = np.random.default_rng(2)
+    records = np.zeros(count, dtype=RECORD)
+    records["t"] = now + rng.random(count) * 600
+    records["resident"] = np.arange(count)
+    guardian.ingest(records)
+    start = time.perf_counter()
+    seconds = 600
+    alerts = 0
+    for step in range(seconds):
+        alerts += len(guardian.check(now + 3600 + step))
+    wheel_us = (time.perf_counter() - start) / seconds * 1e6
+    last = {i: t for i, t in enumerate(guardian.resident_last.tolist())}
+    start = time.perf_counter()
+    for step in range(10):
+        due = [r for r, t in last.items() if t + 3600 <= now + 3600 + step]
+    scan_us = (time.perf_counter() - start) / 10 * 1e6
+    print(f"inactivity, {count} residents: timer wheel {wheel_us:.0f} us/tick "
+          f"({alerts} alerts), full scan {scan_us:.0f} us/tick")
+    print("=" * 72)
@@ -6,52 +6,102 @@ VERTICAL 4: Enterprise / Industrial Demo
 import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
-from scene_base import MotiBeamScene
+from scene_base import MotiBeamScene, load_font
+from zones import FORKLIFT, RESTRICTED, DOCK, SimulatedTracks, ZoneIndex, ZoneTracker, warehouse_zones
 import pygame
 
+FLOOR_SIZE = (60.0, 30.0)  # metres
+FORKLIFTS = 4              # tracks 0-3 are forklifts, the rest people
+
 class IndustrialDemo(MotiBeamScene):
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Industrial Safety", standalone=standalone)
+        self.zone_index = ZoneIndex(warehouse_zones(FLOOR_SIZE), FLOOR_SIZE)
+        self.zone_tracker = ZoneTracker(self.zone_index)
+        self.tracks = SimulatedTracks(20, FLOOR_SIZE)
+        self.last_update = pygame.time.get_ticks()
+        self.floor_layer = None
         
+        self.zone_colors = {
+            FORKLIFT: self.colors['orange'],
+            RESTRICTED: self.colors['red'],
+            DOCK: self.colors['blue'],
+        }
+    
+    def floor_rect(self):
+        return pygame.Rect(50, 230, self.width - 100, 300)
+    
+    def to_screen(self, x, y):
+        rect = self.floor_rect()
+        return (rect.left + int(x * rect.width / FLOOR_SIZE[0]),
+                rect.top + int(y * rect.height / FLOOR_SIZE[1]))
+    
+    def track_name(self, track):
+        return f"FL-{track + 1}" if track < FORKLIFTS else f"W-{track - FORKLIFTS + 1:02d}"
+    
+    def draw_floor_layer(self):
+        """Zones never move: draw them once"""
+        rect = self.floor_rect()
+        layer = pygame.Surface(rect.size)
+        label_font = load_font(24)
+        for zone in self.zone_index.zones:
+            color = self.zone_colors.get(zone.kind, self.colors['green'])
+            points = [(x - rect.left, y - rect.top) for x, y in (self.to_screen(*p) for p in zone.polygon)]
+            pygame.draw.polygon(layer, tuple(c // 6 for c in color), points)
+            pygame.draw.polygon(layer, color, points, 2)
+            label = label_font.render(zone.name, True, color)
+            left, top, right, bottom = zone.bbox
+            center = self.to_screen((left + right) / 2, (top + bottom) / 2)
+            if bottom - top > right - left:
+                label = pygame.transform.rotate(label, 90)
+            layer.blit(label, label.get_rect(center=(center[0] - rect.left, center[1] - rect.top)))
+        return layer.convert() if pygame.display.get_surface() else layer
+    
+    def update(self):
+        now = pygame.time.get_ticks()
+        dt = min(0.1, max(0, now - self.last_update) / 1000)
+        self.last_update = now
+        self.tracks.step(dt)
+        self.zone_tracker.update(self.tracks.ids, self.tracks.positions)
+    
+    def people_at_risk(self):
+        """People inside forklift lanes or restricted zones"""
+        at_risk = set()
+        for i, zone in enumerate(self.zone_index.zones):
+            if zone.kind in (FORKLIFT, RESTRICTED) and self.zone_tracker.occupancy[i]:
+                at_risk.update(t for t in self.zone_tracker.tracks_in(i) if t >= FORKLIFTS)
+        return at_risk
+    
     def render(self):
         self.screen.fill(self.colors['black'])
-        self.draw_header("🏭 INDUSTRIAL SAFETY", "Smart Warehouse Zone Management")
-        
-        zone_height = 200
-        zone_y_start = 250
-        
-        safe_zone = pygame.Rect(50, zone_y_start, (self.width - 100) // 2 - 20, zone_height)
-        pygame.draw.rect(self.screen, self.colors['green'], safe_zone, 5)
-        pygame.draw.rect(self.screen, (0, 40, 20), safe_zone)
-        
-        safe_text = self.font_large.render("SAFE ZONE", True, self.colors['green'])
-        safe_rect = safe_text.get_rect(center=(safe_zone.centerx, safe_zone.centery - 30))
-        self.screen.blit(safe_text, safe_rect)
-        
-        safe_info = self.font_small.render("Personnel Allowed", True, self.colors['white'])
-        safe_info_rect = safe_info.get_rect(center=(safe_zone.centerx, safe_zone.centery + 30))
-        self.screen.blit(safe_info, safe_info_rect)
-        
-        active_zone = pygame.Rect(self.width//2 + 20, zone_y_start, (self.width - 100) // 2 - 20, zone_height)
-        pygame.draw.rect(self.screen, self.colors['orange'], active_zone, 5)
-        pygame.draw.rect(self.screen, (40, 30, 0), active_zone)
-        
-        active_text = self.font_large.render("FORKLIFT ACTIVE", True, self.colors['orange'])
-        active_rect = active_text.get_rect(center=(active_zone.centerx, active_zone.centery - 30))
-        self.screen.blit(active_text, active_rect)
+        at_risk = self.people_at_risk()
+        if at_risk:
+            subtitle = f"⚠ {len(at_risk)} personnel in vehicle or restricted zones"
+        else:
+            subtitle = "Smart Warehouse Zone Management"
+        self.draw_header("🏭 INDUSTRIAL SAFETY", subtitle)
         
-        active_info = self.font_small.render("⚠ Caution Required", True, self.colors['white'])
-        active_info_rect = active_info.get_rect(center=(active_zone.centerx, active_zone.centery + 30))
-        self.screen.blit(active_info, active_info_rect)
+        if self.floor_layer is None:
+            self.floor_layer = self.draw_floor_layer()
+        self.screen.blit(self.floor_layer, self.floor_rect())
         
-        task_y = 500
-        task_title = self.font_medium.render("CURRENT TASK", True, self.colors['cyan'])
-        task_rect = task_title.get_rect(centerx=self.width//2, top=task_y)
-        self.screen.blit(task_title, task_rect)
+        for track, (x, y) in zip(self.tracks.ids.tolist(), self.tracks.positions.tolist()):
+            center = self.to_screen(x, y)
+            if track < FORKLIFTS:
+                pygame.draw.rect(self.screen, self.colors['yellow'], (center[0] - 8, center[1] - 8, 16, 16))
+            else:
+                color = self.colors['red'] if track in at_risk else self.colors['white']
+                pygame.draw.circle(self.screen, color, center, 6)
         
-        task_desc = self.font_small.render("Inventory Check: Aisle 7, Rack B-14", True, self.colors['white'])
-        task_desc_rect = task_desc.get_rect(centerx=self.width//2, top=task_y + 60)
-        self.screen.blit(task_desc, task_desc_rect)
+        # Latest zone entries and exits
+        y_pos = 540
+        for event in list(self.zone_tracker.events)[-3:][::-1]:
+            verb = "entered" if event.kind == "enter" else "left"
+            color = self.zone_colors.get(event.zone.kind, self.colors['green'])
+            text = f"{self.track_name(event.track)} {verb} {event.zone.name}"
+            event_surf = self.font_small.render(text, True, color if event.kind == "enter" else self.colors['gray'])
+            self.screen.blit(event_surf, event_surf.get_rect(centerx=self.width//2, top=y_pos))
+            y_pos += 36
         
         self.draw_footer("Real-time zone monitoring | Task guidance overlay")
         self.draw_corner_markers(self.colors['cyan'])
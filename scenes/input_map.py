@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Input Map
+Table-driven key bindings: (event type, key) -> action in one dict lookup.
+Bindings can be overridden per deployment from a JSON file.
+"""
+
+import json
+import os
+
+import pygame
+
+KEYMAP_FILE = os.environ.get('MOTIBEAM_KEYMAP',
+                             os.path.expanduser("~/.motibeam/keymap.json"))
+
+# Input event types that are dropped by SDL unless a key map uses them
+FILTERABLE_EVENTS = [
+    'KEYUP', 'TEXTINPUT', 'TEXTEDITING',
+    'MOUSEMOTION', 'MOUSEBUTTONDOWN', 'MOUSEBUTTONUP', 'MOUSEWHEEL',
+    'FINGERDOWN', 'FINGERUP', 'FINGERMOTION', 'MULTIGESTURE',
+    'JOYAXISMOTION', 'JOYBALLMOTION', 'JOYHATMOTION', 'JOYBUTTONDOWN', 'JOYBUTTONUP',
+    'CONTROLLERAXISMOTION', 'CONTROLLERBUTTONDOWN', 'CONTROLLERBUTTONUP',
+]
+
+_overrides = None
+
+# Event types other components need whatever the key maps use
+_required = set()
+
+
+def load_overrides(path=KEYMAP_FILE):
+    """Deployment key map overrides, read once per process
+
+    File format: {"MainMenu": {"clinical": ["1", "c"]}, "*": {"exit": ["q"]}}
+    "*" applies to every key map.
+    """
+    global _overrides
+    if _overrides is None:
+        try:
+            with open(path) as f:
+                _overrides = json.load(f)
+            print(f"Key map overrides loaded from {path}")
+        except OSError:
+            _overrides = {}
+        except ValueError as e:
+            print(f"Ignoring invalid key map {path}: {e}")
+            _overrides = {}
+    return _overrides
+
+
+def parse_binding(name):
+    """Turn a binding name into an (event type, key) pair
+
+    "escape", "1", "a", "up" -> KEYDOWN with that key
+    "mouse:1"                -> MOUSEBUTTONDOWN button 1
+    "joy:0"                  -> JOYBUTTONDOWN button 0
+    """
+    if name.startswith("mouse:"):
+        return (pygame.MOUSEBUTTONDOWN, int(name[6:]))
+    if name.startswith("joy:"):
+        return (pygame.JOYBUTTONDOWN, int(name[4:]))
+    for attr in ("K_" + name, "K_" + name.upper(), "K_" + name.lower()):
+        if hasattr(pygame, attr):
+            return (pygame.KEYDOWN, getattr(pygame, attr))
+    raise ValueError(f"Unknown key binding: {name}")
+
+
+def event_key(event):
+    """Lookup key for an event, matching parse_binding()"""
+    if event.type == pygame.KEYDOWN:
+        return (event.type, event.key)
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN):
+        return (event.type, event.button)
+    return (event.type, None)
+
+
+class KeyMap:
+    """Maps input events to action names"""
+
+    def __init__(self, bindings):
+        self.bindings = dict(bindings)
+        self.table = {}
+        for action, names in self.bindings.items():
+            for name in names:
+                self.table[parse_binding(name)] = action
+
+    @classmethod
+    def load(cls, section, defaults):
+        """Defaults for a scene, with deployment overrides applied"""
+        overrides = load_overrides()
+        bindings = dict(defaults)
+        for key in ("*", section):
+            for action, names in overrides.get(key, {}).items():
+                if action in bindings:
+                    bindings[action] = names
+        try:
+            return cls(bindings)
+        except ValueError as e:
+            print(f"{e} - using default keys for {section}")
+            return cls(defaults)
+
+    def lookup(self, event):
+        """Action bound to this event, or None"""
+        return self.table.get(event_key(event))
+
+    def event_types(self):
+        return {event_type for event_type, _ in self.table}
+
+
+def require_event_types(types):
+    """Keep these event types out of the filter for the rest of the process"""
+    _required.update(types)
+
+
+def apply_event_filter(*keymaps):
+    """Keep input event types no key map uses out of the event queue"""
+    used = set(_required)
+    for keymap in keymaps:
+        used |= keymap.event_types()
+    filterable = [getattr(pygame, name) for name in FILTERABLE_EVENTS
+                  if hasattr(pygame, name)]
+    pygame.event.set_allowed(None)
+    blocked = [t for t in filterable if t not in used]
+    if blocked:
+        pygame.event.set_blocked(blocked)
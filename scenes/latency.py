@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Input-to-Photon Latency
+Timestamps input events when they are pulled from the queue, follows them
+through update/render and records when the frame showing them is flipped.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import random
+import time
+
+import pygame
+
+from scene_base import GESTURE_EVENT
+
+# Histogram bucket upper bounds in milliseconds
+BUCKETS_MS = [1, 2, 4, 8, 16, 33, 50, 67, 100, 150, 250, 500, 1000, float('inf')]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # Summed stage times: queue, update, render, present
+        self.stages = [0.0, 0.0, 0.0, 0.0]
+
+    def add(self, latency_ms, stages):
+        for i, bound in enumerate(BUCKETS_MS):
+            if latency_ms <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += latency_ms
+        self.max = max(self.max, latency_ms)
+        for i, value in enumerate(stages):
+            self.stages[i] += value
+
+    def percentile(self, pct):
+        """Upper bucket bound containing the given percentile"""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+def event_source(event):
+    """Name of the input device an event came from"""
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return "keyboard"
+    if event.type == GESTURE_EVENT:
+        return "gesture"
+    return pygame.event.event_name(event.type).lower()
+
+
+class LatencyTracker:
+    """Per-scene, per-source input-to-present latency
+
+    "Present" is when pygame.display.flip() returns; projector scan-out
+    adds a roughly constant delay on top that this cannot see.
+    """
+
+    # Only discrete user input; window and motion events are not tracked
+    TRACKED = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN, GESTURE_EVENT)
+
+    def __init__(self):
+        self.histograms = {}
+        self.pending = []
+        self.update_done = None
+        self.render_done = None
+
+    def ingest(self, events, now=None):
+        """Timestamp events as the scene pulls them off the queue"""
+        now = time.perf_counter() if now is None else now
+        for event in events:
+            if event.type not in self.TRACKED:
+                continue
+            # Synthetic events carry the time they were posted
+            posted = getattr(event, 'injected_at', now)
+            self.pending.append((event_source(event), posted, now))
+        return events
+
+    def mark_update(self):
+        self.update_done = time.perf_counter()
+
+    def mark_render(self):
+        self.render_done = time.perf_counter()
+
+    def frame_presented(self, scene):
+        """Call right after display.flip()"""
+        update_done, render_done = self.update_done, self.render_done
+        # Marks belong to this frame only; never reuse another loop's
+        self.update_done = self.render_done = None
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        render_done = render_done or now
+        update_done = update_done or render_done
+        for source, posted, ingested in self.pending:
+            stages = [
+                (ingested - posted) * 1000,
+                (update_done - ingested) * 1000,
+                (render_done - update_done) * 1000,
+                (now - render_done) * 1000,
+            ]
+            key = (scene, source)
+            if key not in self.histograms:
+                self.histograms[key] = LatencyHistogram()
+            self.histograms[key].add((now - posted) * 1000, stages)
+        self.pending = []
+
+    def report(self):
+        """Print latency summary per scene and input source"""
+        print("=" * 60)
+        print("Input-to-photon latency (ms)")
+        print(f"{'scene':28} {'source':10} {'n':>5} {'mean':>6} {'p50':>6} {'p95':>6} {'max':>6}")
+        for (scene, source), hist in sorted(self.histograms.items()):
+            print(f"{scene:28} {source:10} {hist.count:5d} {hist.mean():6.1f} "
+                  f"{hist.percentile(50):6.1f} {hist.percentile(95):6.1f} {hist.max:6.1f}")
+            if hist.count:
+                q, u, r, p = (s / hist.count for s in hist.stages)
+                print(f"{'':28} stages: queue {q:.1f} update {u:.1f} render {r:.1f} present {p:.1f}")
+        print("=" * 60)
+
+
+class EventInjector:
+    """Input source that posts synthetic key presses for benchmarking
+
+    Add to a scene's input_sources; posts one key every interval seconds.
+    """
+
+    def __init__(self, keys, interval=0.25, jitter=0.1, seed=0):
+        self.keys = list(keys)
+        self.interval = interval
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.index = 0
+        self.next_time = time.perf_counter() + interval
+        self.injected = 0
+
+    def poll(self):
+        now = time.perf_counter()
+        if now < self.next_time:
+            return
+        key = self.keys[self.index % len(self.keys)]
+        self.index += 1
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0,
+                                             unicode='', scancode=0,
+                                             injected_at=now))
+        self.injected += 1
+        self.next_time = now + self.interval + self.random.uniform(0, self.jitter)
+
+
+if __name__ == "__main__":
+    # Headless benchmark: SDL_VIDEODRIVER=dummy python3 latency.py [seconds]
+    from clinical_demo_enhanced import ClinicalWellnessEnhanced
+
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    demo = ClinicalWellnessEnhanced(standalone=True)
+    demo.latency = LatencyTracker()
+    keys = [pygame.K_1, pygame.K_ESCAPE, pygame.K_2, pygame.K_ESCAPE,
+            pygame.K_3, pygame.K_ESCAPE, pygame.K_4, pygame.K_ESCAPE]
+    injector = EventInjector(keys)
+    demo.input_sources.append(injector)
+    demo.run(duration=duration)
+    print(f"Injected {injector.injected} events")
+    demo.latency.report()
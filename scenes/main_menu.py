@@ -10,6 +10,17 @@ from scene_base import MotiBeamScene
 import pygame
 
 class MainMenu(MotiBeamScene):
+    key_bindings = {
+        "exit": ["escape"],
+        "clinical": ["1"],
+        "automotive": ["2"],
+        "emergency": ["3"],
+        "industrial": ["4"],
+        "security": ["5"],
+        "education": ["6"],
+        "all": ["a"],
+    }
+    
     def __init__(self):
         super().__init__(title="MotiBeam OS - Main Menu")
         self.verticals = [
@@ -22,35 +33,11 @@ class MainMenu(MotiBeamScene):
         ]
         self.selected = None
         
-    def handle_events(self):
-        """Handle menu selection"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_1:
-                    self.selected = "clinical"
-                    self.running = False
-                elif event.key == pygame.K_2:
-                    self.selected = "automotive"
-                    self.running = False
-                elif event.key == pygame.K_3:
-                    self.selected = "emergency"
-                    self.running = False
-                elif event.key == pygame.K_4:
-                    self.selected = "industrial"
-                    self.running = False
-                elif event.key == pygame.K_5:
-                    self.selected = "security"
-                    self.running = False
-                elif event.key == pygame.K_6:
-                    self.selected = "education"
-                    self.running = False
-                elif event.key == pygame.K_a:
-                    self.selected = "all"
-                    self.running = False
+    def on_action(self, action):
+        """Any bound vertical (or "all") ends the menu with that selection"""
+        if action != "exit":
+            self.selected = action
+        self.running = False
         
     def render(self):
         self.screen.fill(self.colors['black'])
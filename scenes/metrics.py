@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Runtime Metrics
+Frame times, achieved FPS, camera capture rate, cache hit ratios and RSS,
+served in Prometheus text format on localhost or a Unix socket.
+
+Frame and camera stats each have a single writer (the render thread and
+the power sampler) and are recorded without locks. Counters and gauges
+are written from several threads - scene builders loading fonts, the
+guardian and alert listeners - so inc() and set() take a lock. The
+server thread only reads snapshots.
+"""
+
+import os
+import resource
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Frame time histogram bucket upper bounds (seconds)
+FRAME_BUCKETS = [0.005, 0.010, 0.020, 0.033, 0.050, 0.100, 0.250, float('inf')]
+
+
+class RateMeter:
+    """Events per second over roughly one-second windows"""
+
+    __slots__ = ('rate', 'total', '_window_start', '_window_count')
+
+    def __init__(self):
+        self.rate = 0.0
+        self.total = 0
+        self._window_start = None
+        self._window_count = 0
+
+    def tick(self, now):
+        self.total += 1
+        if self._window_start is None:
+            self._window_start = now
+            return
+        self._window_count += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+
+
+class FrameStats:
+    """Frame-time histogram and FPS for one scene"""
+
+    __slots__ = ('buckets', 'sum', 'count', 'fps')
+
+    def __init__(self):
+        self.buckets = [0] * len(FRAME_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+        self.fps = RateMeter()
+
+    def observe(self, seconds, now):
+        for i, bound in enumerate(FRAME_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        self.sum += seconds
+        self.count += 1
+        self.fps.tick(now)
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+def rss_bytes():
+    """Current resident set size"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Peak RSS (kilobytes on Linux) is the best we can do elsewhere
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Metrics:
+    """Process-wide metric registry"""
+
+    def __init__(self):
+        self.scenes = {}
+        self.counters = {}
+        self.gauges = {}
+        self._lock = threading.Lock()  # counters and gauges
+        self.camera = RateMeter()
+        self.start_time = time.time()
+
+    def frame(self, scene, seconds, now=None):
+        """Record one frame's work time for a scene"""
+        stats = self.scenes.get(scene)
+        if stats is None:
+            stats = self.scenes[scene] = FrameStats()
+        stats.observe(seconds, time.perf_counter() if now is None else now)
+
+    def camera_frame(self):
+        self.camera.tick(time.perf_counter())
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.gauges[key] = value
+
+    def cache_hit(self, cache):
+        self.inc("motibeam_cache_hits_total", cache=cache)
+
+    def cache_miss(self, cache):
+        self.inc("motibeam_cache_misses_total", cache=cache)
+
+    def render(self):
+        """Prometheus text exposition of all metrics"""
+        lines = []
+        # list() snapshots each dict in one step under the GIL
+        scenes = list(self.scenes.items())
+
+        lines.append("# TYPE motibeam_frame_seconds histogram")
+        for scene, stats in scenes:
+            cumulative = 0
+            for bound, n in zip(FRAME_BUCKETS, list(stats.buckets)):
+                cumulative += n
+                le = "+Inf" if bound == float('inf') else repr(bound)
+                lines.append(f'motibeam_frame_seconds_bucket{{scene="{scene}",le="{le}"}} {cumulative}')
+            lines.append(f'motibeam_frame_seconds_sum{{scene="{scene}"}} {stats.sum:.6f}')
+            lines.append(f'motibeam_frame_seconds_count{{scene="{scene}"}} {stats.count}')
+
+        lines.append("# TYPE motibeam_fps gauge")
+        for scene, stats in scenes:
+            lines.append(f'motibeam_fps{{scene="{scene}"}} {stats.fps.rate:.2f}')
+
+        lines.append("# TYPE motibeam_camera_frames_total counter")
+        lines.append(f"motibeam_camera_frames_total {self.camera.total}")
+        lines.append("# TYPE motibeam_camera_fps gauge")
+        lines.append(f"motibeam_camera_fps {self.camera.rate:.2f}")
+
+        with self._lock:
+            counters = list(self.counters.items())
+            gauges = list(self.gauges.items())
+        for (name, labels), value in sorted(counters):
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        # Hit ratios derived from the cache counters
+        hits = {labels: v for (name, labels), v in counters if name == "motibeam_cache_hits_total"}
+        misses = {labels: v for (name, labels), v in counters if name == "motibeam_cache_misses_total"}
+        if hits or misses:
+            lines.append("# TYPE motibeam_cache_hit_ratio gauge")
+        for labels in sorted(set(hits) | set(misses)):
+            total = hits.get(labels, 0) + misses.get(labels, 0)
+            ratio = hits.get(labels, 0) / total if total else 0.0
+            lines.append(f"motibeam_cache_hit_ratio{_labels(labels)} {ratio:.4f}")
+
+        for (name, labels), value in sorted(gauges):
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        lines.append("# TYPE process_resident_memory_bytes gauge")
+        lines.append(f"process_resident_memory_bytes {rss_bytes()}")
+        lines.append("# TYPE process_uptime_seconds gauge")
+        lines.append(f"process_uptime_seconds {time.time() - self.start_time:.1f}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared registry; recording is always on, serving is optional
+metrics = Metrics()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket peers have no address tuple
+        return "local"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixMetricsServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def start_server(address=None):
+    """Serve /metrics on a daemon thread
+
+    address is "9108" / "127.0.0.1:9108" for TCP or "unix:/path" for a
+    Unix socket; defaults to the MOTIBEAM_METRICS environment variable.
+    Returns the server, or None if metrics serving is not configured.
+    """
+    address = address or os.environ.get("MOTIBEAM_METRICS")
+    if not address:
+        return None
+    if address.startswith("unix:"):
+        path = address[5:]
+        if os.path.exists(path):
+            os.unlink(path)
+        server = UnixMetricsServer(path, MetricsHandler)
+    else:
+        host, _, port = address.rpartition(":")
+        server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), MetricsHandler)
+        server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"Metrics available at {address}")
+    return server
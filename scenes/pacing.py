@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Frame Pacing
+pygame's Clock.tick(fps) sleeps from "now" with millisecond SDL_Delay
+resolution, so frame intervals wander by a few milliseconds and any
+late frame pushes every later frame back. FramePacer instead schedules
+against absolute deadlines (start + n * period): it sleeps until just
+before the deadline, spins the last stretch on perf_counter, and
+releases the frame for presentation exactly on time. The sleep margin
+adapts to how badly the OS oversleeps.
+
+Safety-critical scenes (scene.safety_critical = True) are paced this
+way; every frame interval is recorded for jitter statistics.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import time
+from collections import deque
+
+from metrics import metrics
+
+MIN_MARGIN = 0.0002  # always spin at least this long before a deadline
+MAX_MARGIN = 0.004
+
+
+class FramePacer:
+    """Deadline-based frame release: sleep most of the way, spin the rest"""
+
+    def __init__(self, fps=60, history=1800):
+        self.fps = fps
+        self.deadline = None
+        self.last_release = None
+        self.margin = 0.001
+        self.oversleep = 0.0  # running mean of how late sleep() wakes
+        self.intervals = deque(maxlen=history)
+        self.missed = 0
+        self.spin_time = 0.0
+        self.frames = 0
+
+    def reset(self):
+        """Start a fresh schedule (e.g. when a scene starts)"""
+        self.deadline = None
+        self.last_release = None
+
+    def wait(self, fps=None):
+        """Block until this frame's deadline; call right before flip()
+
+        Returns the time released (perf_counter seconds).
+        """
+        if fps:
+            self.fps = fps
+        period = 1.0 / self.fps
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now
+        elif now > self.deadline:
+            # The frame's work overran its slot: release it now (the
+            # schedule is shifted below) rather than rushing the next one
+            pass
+        else:
+            remaining = self.deadline - now - self.margin
+            if remaining > 0:
+                before = time.perf_counter()
+                time.sleep(remaining)
+                late = time.perf_counter() - before - remaining
+                self.oversleep += (max(0.0, late) - self.oversleep) * 0.1
+                self.margin = min(MAX_MARGIN, max(MIN_MARGIN, 2 * self.oversleep + MIN_MARGIN))
+            spin_start = time.perf_counter()
+            while time.perf_counter() < self.deadline:
+                pass
+            self.spin_time += time.perf_counter() - spin_start
+
+        released = time.perf_counter()
+        if self.last_release is not None:
+            self.intervals.append(released - self.last_release)
+        self.last_release = released
+        if released - self.deadline > period / 4:
+            # Overslept badly: a short catch-up frame next would just be
+            # a second glitch, so keep the period and shift the schedule
+            self.missed += 1
+            self.deadline = released
+        self.deadline += period
+        self.frames += 1
+        return released
+
+    def stats(self):
+        """Frame interval statistics in milliseconds, or None before two frames"""
+        if not self.intervals:
+            return None
+        period = 1000.0 / self.fps
+        intervals = sorted(i * 1000 for i in self.intervals)
+        jitter = sorted(abs(i - period) for i in intervals)
+        count = len(intervals)
+        mean = sum(intervals) / count
+        return {
+            "target": period,
+            "mean": mean,
+            "stdev": (sum((i - mean) ** 2 for i in intervals) / count) ** 0.5,
+            "min": intervals[0],
+            "max": intervals[-1],
+            "jitter_p50": jitter[count // 2],
+            "jitter_p99": jitter[min(count - 1, int(count * 0.99))],
+            "missed": self.missed,
+            "spin_ms_per_frame": self.spin_time * 1000 / max(1, self.frames),
+        }
+
+    def publish(self, scene):
+        stats = self.stats()
+        if stats:
+            metrics.set("motibeam_frame_jitter_p99_ms", round(stats["jitter_p99"], 3), scene=scene)
+            metrics.set("motibeam_frame_deadline_misses", stats["missed"], scene=scene)
+
+    def report(self, label="Frame pacing"):
+        stats = self.stats()
+        if not stats:
+            return
+        print(f"{label}: target {stats['target']:.2f} ms, mean {stats['mean']:.2f} ms "
+              f"(sd {stats['stdev']:.3f}, {stats['min']:.2f}-{stats['max']:.2f}), "
+              f"jitter p50 {stats['jitter_p50']:.3f} ms p99 {stats['jitter_p99']:.3f} ms, "
+              f"{stats['missed']} missed, spin {stats['spin_ms_per_frame']:.2f} ms/frame")
+
+
+def clock_stats(intervals, fps):
+    """Same statistics for intervals measured around pygame's Clock.tick"""
+    pacer = FramePacer(fps, history=len(intervals))
+    pacer.intervals.extend(intervals)
+    return pacer.stats()
+
+
+if __name__ == "__main__":
+    # Benchmark: python3 pacing.py [fps] [seconds] [load ms]
+    # Simulates a frame of varying work (load +/- 50%) then paces it
+    import random
+
+    import pygame
+
+    fps = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    load = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.006
+    frames = int(fps * seconds)
+    rng = random.Random(1)
+
+    def work():
+        end = time.perf_counter() + load * rng.uniform(0.5, 1.5)
+        while time.perf_counter() < end:
+            pass
+
+    pygame.init()
+    clock = pygame.time.Clock()
+    intervals = []
+    last = None
+    for _ in range(frames):
+        work()
+        clock.tick(fps)
+        now = time.perf_counter()
+        if last is not None:
+            intervals.append(now - last)
+        last = now
+    busy_clock = clock_stats(intervals, fps)
+
+    pacer = FramePacer(fps, history=frames)
+    for _ in range(frames):
+        work()
+        pacer.wait()
+
+    print("=" * 72)
+    print(f"{fps} fps, {load * 1000:.1f} ms +/- 50% work per frame, {frames} frames")
+    for name, stats in (("Clock.tick", busy_clock), ("FramePacer", pacer.stats())):
+        print(f"{name:12} mean {stats['mean']:6.2f} ms  sd {stats['stdev']:6.3f}  "
+              f"range {stats['min']:6.2f}-{stats['max']:6.2f}  "
+              f"jitter p50 {stats['jitter_p50']:6.3f} p99 {stats['jitter_p99']:6.3f} ms")
+    print(f"FramePacer spins {pacer.stats()['spin_ms_per_frame']:.2f} ms/frame, "
+          f"sleep margin {pacer.margin * 1000:.2f} ms")
+    print("=" * 72)
+    pygame.quit()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Kiosk Playlist
+Schedules verticals with per-item durations, time-of-day windows and
+priorities. The next item is built and pre-rendered while the current
+one is still playing so handoffs land on an exact frame.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from transitions import SceneBuilder, render_offscreen
+
+PLAYLIST_FILE = os.path.expanduser("~/.motibeam/playlist.json")
+
+IDLE_SECONDS = 60  # with nothing scheduled, check again this often
+
+DEFAULT_ORDER = ["clinical", "education", "automotive", "emergency", "industrial", "security"]
+
+
+def parse_time(text):
+    """'HH:MM' -> minutes after midnight"""
+    hours, minutes = text.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+class PlaylistItem:
+    """One vertical in the playlist"""
+
+    def __init__(self, demo, duration=300, priority=0, window=None):
+        self.demo = demo
+        self.duration = duration  # seconds
+        self.priority = priority
+        # (start, end) minutes after midnight; end < start wraps past midnight
+        self.window = tuple(parse_time(t) for t in window) if window else None
+
+    def active_at(self, when):
+        if self.window is None:
+            return True
+        minute = when.hour * 60 + when.minute
+        start, end = self.window
+        if start <= end:
+            return start <= minute < end
+        return minute >= start or minute < end
+
+    def frames(self, fps):
+        return max(1, int(round(self.duration * fps)))
+
+
+class Playlist:
+    """Ordered playlist items plus the scheduling rules between them"""
+
+    def __init__(self, items, fps=30):
+        self.items = items
+        self.fps = fps
+        self.position = -1
+
+    @classmethod
+    def default(cls, duration=300):
+        """Every vertical in preferred order, as run_all_demos does"""
+        return cls([PlaylistItem(demo, duration) for demo in DEFAULT_ORDER])
+
+    @classmethod
+    def load(cls, path=PLAYLIST_FILE):
+        """Load a playlist file, falling back to the default playlist
+
+        {"fps": 30, "items": [{"demo": "clinical", "duration": 120,
+                               "priority": 1, "window": ["08:00", "18:00"]}]}
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            items = [PlaylistItem(entry["demo"], entry.get("duration", 300),
+                                  entry.get("priority", 0), entry.get("window"))
+                     for entry in data["items"]]
+            return cls(items, data.get("fps", 30))
+        except OSError:
+            return cls.default()
+        except (ValueError, KeyError) as e:
+            print(f"Invalid playlist {path}: {e} - using default")
+            return cls.default()
+
+    def next_item(self, when):
+        """Highest-priority item active now, rotating among equals
+
+        Returns None if no item's window covers the given time.
+        """
+        active = [i for i, item in enumerate(self.items) if item.active_at(when)]
+        if not active:
+            return None
+        top = max(self.items[i].priority for i in active)
+        candidates = [i for i in active if self.items[i].priority == top]
+        # First candidate after the last one played, wrapping around
+        after = [i for i in candidates if i > self.position]
+        self.position = after[0] if after else candidates[0]
+        return self.items[self.position]
+
+    def simulate(self, start, hours=24, idle_seconds=IDLE_SECONDS):
+        """Dry run: the schedule for a period without rendering anything
+
+        Returns (start time, demo or None, seconds) entries; None means
+        nothing was scheduled and the kiosk idles for idle_seconds.
+        """
+        self.position = -1
+        when = start
+        end = start + timedelta(hours=hours)
+        schedule = []
+        while when < end:
+            item = self.next_item(when)
+            if item is None:
+                schedule.append((when, None, idle_seconds))
+                when += timedelta(seconds=idle_seconds)
+                continue
+            # Frame-exact: the item lasts a whole number of frames
+            seconds = item.frames(self.fps) / self.fps
+            schedule.append((when, item.demo, seconds))
+            when += timedelta(seconds=seconds)
+        self.position = -1
+        return schedule
+
+
+class Preloader:
+    """Background task that readies the next scene during the current one
+
+    Construction starts immediately on a worker thread; the first frame
+    is rendered offscreen lead_frames before the current item ends, or
+    lead_seconds before its deadline if the frame rate is capped.
+    """
+
+    def __init__(self, factory, screen, remaining_frames, seconds=None,
+                 lead_frames=15, lead_seconds=0.5):
+        self.builder = SceneBuilder(factory)
+        self.screen = screen
+        self.remaining = remaining_frames
+        self.lead_frames = lead_frames
+        self.render_at = None if seconds is None else time.perf_counter() + seconds - lead_seconds
+        self.first_frame = None
+
+    def poll(self):
+        self.remaining -= 1
+        due = self.remaining <= self.lead_frames or \
+            (self.render_at is not None and time.perf_counter() >= self.render_at)
+        if self.first_frame is None and due and self.builder.ready():
+            self.first_frame = render_offscreen(self.builder.scene(), self.screen)
+
+    def take(self):
+        """Built scene and its pre-rendered first frame (may be None)"""
+        return self.builder.scene(), self.first_frame
+
+
+def print_schedule(schedule):
+    totals = {}
+    for when, demo, seconds in schedule:
+        totals[demo or "(idle)"] = totals.get(demo or "(idle)", 0) + seconds
+    print(f"{len(schedule)} scheduled items")
+    for demo, seconds in sorted(totals.items(), key=lambda kv: -kv[1]):
+        print(f"  {demo:12} {seconds / 3600:6.2f} h")
+
+
+if __name__ == "__main__":
+    # Dry run: python3 playlist.py [playlist.json] [hours]
+    path = sys.argv[1] if len(sys.argv) > 1 else PLAYLIST_FILE
+    hours = float(sys.argv[2]) if len(sys.argv) > 2 else 24
+    playlist = Playlist.load(path)
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    schedule = playlist.simulate(midnight, hours)
+    previous = None
+    for when, demo, seconds in schedule:
+        if demo != previous:
+            print(f"{when:%H:%M:%S}  {demo or '(idle)'}")
+            previous = demo
+    print_schedule(schedule)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Presence Power Governor
+Uses camera activity (and any input) to tell when the room is empty,
+then caps the frame rate to a minimum with a dimmed output. The camera
+is sampled on its own thread at a low fixed rate, so a blocking read()
+never stalls rendering. Motion wakes it back to full rendering within
+one sample period plus one idle frame. Time and CPU spent in each power
+state are recorded.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import threading
+import time
+
+import cv2
+import numpy as np
+import pygame
+
+from input_map import require_event_types
+from metrics import metrics
+
+ACTIVE = "active"
+IDLE = "idle"
+
+# Any of these counts as presence; the governor exempts them from the
+# key map event filter, which would otherwise drop all but KEYDOWN
+INPUT_EVENTS = [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.JOYBUTTONDOWN]
+
+
+class PresenceDetector:
+    """Motion score from a slowly updated background model
+
+    Works at proc_width pixels wide so a sample costs well under 1ms.
+    """
+
+    def __init__(self, proc_width=80, threshold=25, min_fraction=0.01, learn_rate=0.05):
+        self.proc_width = proc_width
+        self.threshold = threshold
+        self.min_fraction = min_fraction
+        self.learn_rate = learn_rate
+        self.background = None
+        self.score = 0.0
+
+    def update(self, frame):
+        """Feed a BGR frame; True if it shows motion"""
+        h, w = frame.shape[:2]
+        size = (self.proc_width, max(1, h * self.proc_width // w))
+        gray = cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        gray = cv2.GaussianBlur(gray, (5, 5), 0).astype(np.float32)
+        if self.background is None:
+            self.background = gray
+            return False
+        diff = cv2.absdiff(gray, self.background)
+        self.score = float(np.count_nonzero(diff > self.threshold)) / diff.size
+        cv2.accumulateWeighted(gray, self.background, self.learn_rate)
+        return self.score >= self.min_fraction
+
+
+class PowerGovernor:
+    """Switches a scene between full-speed and low-power rendering
+
+    Assign to scene.power and start(); the scene calls poll() and
+    cap(fps) at the top of each frame and apply(screen) just before
+    presenting it. The scene's own fps is never changed, so playlist
+    timing doesn't depend on the power state.
+    """
+
+    def __init__(self, capture, detector=None, absence_timeout=120.0,
+                 idle_fps=4, dim=0.25, fade_seconds=2.0, sample_fps=10):
+        self.capture = capture
+        require_event_types(INPUT_EVENTS)
+        # learn_rate is per sample: at 10 Hz the background settles about
+        # as fast as the default does when sampled every 30 fps frame
+        self.detector = detector or PresenceDetector(learn_rate=0.15)
+        self.absence_timeout = absence_timeout
+        self.idle_fps = idle_fps
+        self.dim = dim
+        self.fade_seconds = fade_seconds
+        self.sample_fps = sample_fps
+        self.motion_at = None  # monotonic time of the latest motion, from the sampler
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.state = ACTIVE
+        self.state_since = time.monotonic()
+        self.last_presence = self.state_since
+        self.time_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+        self.cpu_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+        self.cpu_since = time.process_time()
+        self.wakes = 0
+        self.wake_latencies = []
+        self.wake_detected = None
+
+    @property
+    def max_wake_latency(self):
+        """Worst case from motion to a full-brightness frame (seconds)"""
+        return 1.0 / self.sample_fps + 1.0 / self.idle_fps
+
+    def start(self):
+        """Sample the camera on a daemon thread"""
+        def loop():
+            period = 1.0 / self.sample_fps
+            while not self._stop.wait(period):
+                ret, frame = self.capture.read()
+                if not ret:
+                    continue
+                metrics.camera_frame()
+                if self.detector.update(frame):
+                    self.motion_at = time.monotonic()
+        self._thread = threading.Thread(target=loop, name="power-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        self.capture.release()
+
+    def _account(self, now):
+        cpu = time.process_time()
+        self.time_in_state[self.state] += now - self.state_since
+        self.cpu_in_state[self.state] += cpu - self.cpu_since
+        self.state_since = now
+        self.cpu_since = cpu
+        metrics.set("motibeam_power_state_seconds", round(self.time_in_state[self.state], 1), state=self.state)
+
+    def _enter(self, state, now):
+        self._account(now)
+        print(f"💡 Power: {self.state} -> {state}")
+        metrics.inc("motibeam_power_transitions_total", state=state)
+        self.state = state
+
+    def poll(self):
+        """Update the power state; cheap, call once per frame"""
+        now = time.monotonic()
+        # Any local input counts as presence, even with the camera covered
+        motion_at = self.motion_at
+        present = pygame.event.peek(INPUT_EVENTS) or \
+            (motion_at is not None and motion_at > self.last_presence)
+        if present:
+            self.last_presence = max(now, motion_at or now)
+            if self.state == IDLE:
+                self.wakes += 1
+                self.wake_detected = time.perf_counter()
+                self._enter(ACTIVE, now)
+        elif self.state == ACTIVE and now - self.last_presence > self.absence_timeout:
+            self._enter(IDLE, now)
+
+    def cap(self, fps):
+        """Frame rate to render at: fps, or idle_fps while the room is empty"""
+        return min(fps, self.idle_fps) if self.state == IDLE else fps
+
+    def apply(self, screen):
+        """Dim the finished frame when idle; call just before flip()"""
+        if self.wake_detected is not None:
+            # This is the first full-brightness frame since waking
+            self.wake_latencies.append(time.perf_counter() - self.wake_detected)
+            self.wake_detected = None
+        if self.state != IDLE:
+            return
+        # Fade down rather than snapping to dark
+        fade = min(1.0, (time.monotonic() - self.state_since) / self.fade_seconds)
+        level = int(255 * (1.0 - fade * (1.0 - self.dim)))
+        if level < 255:
+            screen.fill((level, level, level), special_flags=pygame.BLEND_MULT)
+
+    def report(self):
+        self._account(time.monotonic())
+        total = sum(self.time_in_state.values()) or 1.0
+        print("=" * 60)
+        print("Power states")
+        for state in (ACTIVE, IDLE):
+            seconds = self.time_in_state[state]
+            cpu = self.cpu_in_state[state]
+            load = 100.0 * cpu / seconds if seconds else 0.0
+            print(f"  {state:8} {seconds:9.1f}s ({100 * seconds / total:5.1f}%)  "
+                  f"cpu {cpu:7.1f}s ({load:5.1f}% of a core)")
+        if self.wake_latencies:
+            worst = max(self.wake_latencies) * 1000
+            print(f"  wakes {self.wakes}, detect-to-frame max {worst:.1f} ms "
+                  f"(+ up to {self.max_wake_latency * 1000:.0f} ms sampling)")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Simulated room: SDL_VIDEODRIVER=dummy python3 power.py [seconds]
+    from frame_sources import SyntheticSource
+    from industrial_demo import IndustrialDemo
+
+    class ScriptedRoom(SyntheticSource):
+        """Someone present for the first and last few seconds only"""
+
+        def __init__(self, empty_from, empty_until):
+            super().__init__((320, 240), noise=4)
+            self.empty = (empty_from, empty_until)
+            self.start = time.monotonic()
+
+        def _next(self):
+            frame = super()._next()
+            t = time.monotonic() - self.start
+            if self.empty[0] <= t < self.empty[1]:
+                return self.background.copy()
+            return frame
+
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    governor = PowerGovernor(ScriptedRoom(2, seconds - 2), absence_timeout=1.0)
+    demo = IndustrialDemo(standalone=True)
+    demo.power = governor.start()
+    demo.run(duration=seconds)
+    governor.stop()
+    governor.report()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Render Quality Governor
+Watches CPU temperature and load and steps render quality down (frame
+rate, effect detail, render scale) before the board throttles,
+and back up once it has cooled, with hysteresis so it doesn't oscillate.
+"""
+
+import os
+import time
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+STAT_PATH = "/proc/stat"
+
+
+class QualityLevel:
+    """One rung of the quality ladder"""
+
+    __slots__ = ('fps', 'detail', 'scale')
+
+    def __init__(self, fps, detail, scale):
+        self.fps = fps
+        self.detail = detail  # 2 = full effects, 1 = reduced, 0 = none
+        self.scale = scale    # drawing resolution relative to the screen
+
+    def __repr__(self):
+        return f"{self.fps}fps detail {self.detail} scale {self.scale}"
+
+
+# Best first: frame rate goes first, then effects. A render scale below
+# 1.0 only pays off when drawing costs more than the software upscale
+# (about 1ms at 720p); the main menu measured cheaper at full size, so
+# the default ladder keeps it at 1.0. Pass custom levels to use it.
+QUALITY_LEVELS = [
+    QualityLevel(30, 2, 1.0),
+    QualityLevel(24, 2, 1.0),
+    QualityLevel(20, 1, 1.0),
+    QualityLevel(15, 1, 1.0),
+    QualityLevel(10, 0, 1.0),
+]
+
+
+class SystemSensors:
+    """CPU temperature (°C) and utilisation (0-1) from sysfs and procfs
+
+    Paths are parameters so tests can point them at fake files. Missing
+    files read as None and never trigger a step down.
+    """
+
+    def __init__(self, thermal_path=THERMAL_PATH, stat_path=STAT_PATH):
+        self.thermal_path = thermal_path
+        self.stat_path = stat_path
+        self._last_times = None
+
+    def temperature(self):
+        try:
+            with open(self.thermal_path) as f:
+                value = float(f.read().strip())
+        except (OSError, ValueError):
+            return None
+        # sysfs reports millidegrees
+        return value / 1000.0 if value > 1000 else value
+
+    def load(self):
+        """Busy fraction of all CPUs since the previous call"""
+        try:
+            with open(self.stat_path) as f:
+                fields = [int(v) for v in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        total = sum(fields)
+        last, self._last_times = self._last_times, (idle, total)
+        if last is None or total <= last[1]:
+            return None
+        return 1.0 - (idle - last[0]) / (total - last[1])
+
+
+class QualityGovernor:
+    """Chooses a QualityLevel from temperature and load
+
+    A step down needs down_after consecutive hot samples; a step up needs
+    up_after consecutive cool ones, and cool thresholds sit well below hot
+    ones. Between the two bands the level holds.
+    """
+
+    def __init__(self, sensors=None, levels=QUALITY_LEVELS, hot_temp=75.0, cool_temp=65.0,
+                 high_load=0.9, low_load=0.6, interval=2.0, down_after=2, up_after=5):
+        self.sensors = sensors or SystemSensors()
+        self.levels = levels
+        self.hot_temp = hot_temp
+        self.cool_temp = cool_temp
+        self.high_load = high_load
+        self.low_load = low_load
+        self.interval = interval
+        self.down_after = down_after
+        self.up_after = up_after
+
+        self.index = 0
+        self.hot_samples = 0
+        self.cool_samples = 0
+        self.last_sample = None
+        self.temperature = None
+        self.cpu_load = None
+        self.changes = []  # (time, temperature, load, new level index)
+
+    @property
+    def level(self):
+        return self.levels[self.index]
+
+    def _is_hot(self):
+        return ((self.temperature is not None and self.temperature >= self.hot_temp) or
+                (self.cpu_load is not None and self.cpu_load >= self.high_load))
+
+    def _is_cool(self):
+        return ((self.temperature is None or self.temperature <= self.cool_temp) and
+                (self.cpu_load is None or self.cpu_load <= self.low_load))
+
+    def sample(self):
+        """Read the sensors and step the level if warranted"""
+        self.temperature = self.sensors.temperature()
+        self.cpu_load = self.sensors.load()
+        if self._is_hot():
+            self.hot_samples += 1
+            self.cool_samples = 0
+        elif self._is_cool():
+            self.cool_samples += 1
+            self.hot_samples = 0
+        else:
+            self.hot_samples = self.cool_samples = 0
+
+        if self.hot_samples >= self.down_after and self.index < len(self.levels) - 1:
+            self._step(1)
+        elif self.cool_samples >= self.up_after and self.index > 0:
+            self._step(-1)
+
+    def _step(self, direction):
+        self.index += direction
+        self.hot_samples = self.cool_samples = 0
+        self.changes.append((time.monotonic(), self.temperature, self.cpu_load, self.index))
+        temp = "?" if self.temperature is None else f"{self.temperature:.1f}°C"
+        load = "?" if self.cpu_load is None else f"{self.cpu_load * 100:.0f}%"
+        arrow = "down" if direction > 0 else "up"
+        print(f"🌡️  Quality {arrow} to {self.level} ({temp}, load {load})")
+
+    def poll(self):
+        """Current level, sampling at most once per interval"""
+        now = time.monotonic()
+        if self.last_sample is None or now - self.last_sample >= self.interval:
+            self.last_sample = now
+            self.sample()
+        return self.level
+
+
+def enabled():
+    """On by default; MOTIBEAM_QUALITY=0 turns the governor off"""
+    return os.environ.get('MOTIBEAM_QUALITY', '1') != '0'
+
+
+if __name__ == "__main__":
+    # Replay a heat-up and cool-down against fake sensor files
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    thermal = os.path.join(directory, "temp")
+    stat = os.path.join(directory, "stat")
+    governor = QualityGovernor(SystemSensors(thermal, stat), interval=0)
+
+    busy = idle = 0
+    profile = [55] * 5 + list(range(60, 86, 2)) + [85] * 6 + list(range(84, 58, -2)) + [58] * 30
+    for step, temp in enumerate(profile):
+        with open(thermal, "w") as f:
+            f.write(str(temp * 1000))
+        # Load tracks the temperature: busy while hot
+        busy += 90 if temp >= 75 else 40
+        idle += 10 if temp >= 75 else 60
+        with open(stat, "w") as f:
+            f.write(f"cpu {busy} 0 0 {idle} 0 0 0 0\n")
+        level = governor.poll()
+        print(f"{step:3d} {temp:3d}°C  level {governor.index}: {level}")
+    print(f"{len(governor.changes)} level changes")
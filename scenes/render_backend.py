@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Render Backends
+Two ways to put a frame together: the software path (Surface blits onto
+the display surface) and an SDL2 Renderer path where cached text and
+static layers live as GPU textures and each frame is a set of texture
+copies. Both share one small API, so drawing code is written once.
+
+pygame._sdl2 is pygame's experimental SDL2 binding; the texture backend
+is only used when it imports and an accelerated renderer is available.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import time
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256
+
+
+class SurfaceBackend:
+    """Software path: everything is a Surface blitted onto the display"""
+
+    name = "surface"
+
+    def __init__(self, size, fullscreen=False, title="MotiBeam OS"):
+        flags = pygame.FULLSCREEN if fullscreen else 0
+        self.screen = pygame.display.set_mode(size, flags)
+        pygame.display.set_caption(title)
+        self.size = self.screen.get_size()
+        self.texts = OrderedDict()
+        self.layers = {}
+
+    def _image(self, surface):
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def text(self, font, text, color):
+        """Rendered text, cached by (font, text, color)"""
+        key = (id(font), text, color)
+        image = self.texts.get(key)
+        if image is None:
+            image = self._image(font.render(text, True, color))
+            self.texts[key] = image
+            if len(self.texts) > TEXT_CACHE_SIZE:
+                self.texts.popitem(last=False)
+        else:
+            self.texts.move_to_end(key)
+        return image
+
+    def layer(self, key, size, draw):
+        """Static layer drawn once by draw(surface) onto a transparent surface"""
+        image = self.layers.get(key)
+        if image is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            draw(surface)
+            image = self.layers[key] = self._image(surface)
+        return image
+
+    def image_size(self, image):
+        return image.get_size()
+
+    def clear(self, color=(0, 0, 0)):
+        self.screen.fill(color)
+
+    def draw(self, image, dest, alpha=255):
+        if alpha != 255:
+            image.set_alpha(alpha)
+            self.screen.blit(image, dest)
+            image.set_alpha(255)
+        else:
+            self.screen.blit(image, dest)
+
+    def fill_rect(self, color, rect):
+        self.screen.fill(color, rect)
+
+    def present(self):
+        pygame.display.flip()
+
+
+class TextureBackend(SurfaceBackend):
+    """SDL2 Renderer path: cached images are Textures, frames are copies"""
+
+    name = "texture"
+
+    def __init__(self, size, fullscreen=False, title="MotiBeam OS", accelerated=True):
+        from pygame._sdl2.video import Renderer, Texture, Window
+        self.Texture = Texture
+        self.window = Window(title, size, fullscreen=fullscreen)
+        try:
+            # accelerated=1 raises if there is no GPU render driver
+            self.renderer = Renderer(self.window, accelerated=1 if accelerated else 0, vsync=accelerated)
+        except Exception:
+            self.window.destroy()
+            raise
+        self.size = tuple(size)
+        self.texts = OrderedDict()
+        self.layers = {}
+
+    def _image(self, surface):
+        return self.Texture.from_surface(self.renderer, surface)
+
+    def image_size(self, image):
+        return (image.width, image.height)
+
+    def clear(self, color=(0, 0, 0)):
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.clear()
+
+    def draw(self, image, dest, alpha=255):
+        if len(dest) == 2:
+            dest = (dest[0], dest[1], image.width, image.height)
+        image.alpha = alpha
+        image.draw(dstrect=dest)
+
+    def fill_rect(self, color, rect):
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.fill_rect(rect)
+
+    def present(self):
+        self.renderer.present()
+
+
+def create_backend(size, fullscreen=False, prefer="texture", title="MotiBeam OS"):
+    """Texture backend if asked for and accelerated, else the software one"""
+    if prefer == "texture":
+        try:
+            return TextureBackend(size, fullscreen, title)
+        except Exception as e:
+            print(f"Texture renderer unavailable ({e}), using software rendering")
+    return SurfaceBackend(size, fullscreen, title)
+
+
+def draw_test_frame(backend, fonts, t):
+    """A representative frame: title, status lines, a static layer and motion"""
+    width, height = backend.size
+    large, medium, small = fonts
+    backend.clear((0, 0, 0))
+
+    def markers(surface):
+        w, h = surface.get_size()
+        for x, y in ((50, 50), (w - 50, 50), (50, h - 50), (w - 50, h - 50)):
+            pygame.draw.circle(surface, (0, 255, 180), (x, y), 20)
+        for i in range(4):
+            pygame.draw.circle(surface, (0, 255, 180, 40), (200 + i * 300, 360), 150, 2)
+
+    backend.draw(backend.layer("markers", (width, height), markers), (0, 0))
+
+    lines = [(large, "MotiBeam OS", (0, 255, 180), 150),
+             (medium, "Display Test - Full Screen Active", (255, 255, 255), 300),
+             (small, f"Resolution: {width}x{height}", (80, 255, 120), 400),
+             (small, "Press ESC to exit", (255, 255, 255), height - 100)]
+    for font, text, color, y in lines:
+        image = backend.text(font, text, color)
+        w, h = backend.image_size(image)
+        backend.draw(image, (width // 2 - w // 2, y - h // 2))
+
+    # Moving bar and a counter that changes every frame
+    x = int((t * 300) % width)
+    backend.fill_rect((255, 180, 0), (x, height - 40, 120, 12))
+    counter = backend.text(small, f"{int(t * 30) % 1000:03d}", (150, 150, 150))
+    backend.draw(counter, (width - 160, height - 150), alpha=200)
+
+
+def benchmark(backend, frames=300):
+    """Mean ms per composed and presented frame"""
+    fonts = (pygame.font.Font(None, 120), pygame.font.Font(None, 60), pygame.font.Font(None, 40))
+    draw_test_frame(backend, fonts, 0.0)  # warm the caches
+    start = time.perf_counter()
+    for i in range(frames):
+        pygame.event.pump()
+        draw_test_frame(backend, fonts, i / 30.0)
+        backend.present()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+if __name__ == "__main__":
+    # python3 render_backend.py [frames]; headless: SDL_VIDEODRIVER=dummy
+    # (no GPU there, so the texture run uses SDL's software renderer)
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    size = (1280, 720)
+
+    results = []
+    surface = SurfaceBackend(size)
+    results.append(("surface", benchmark(surface, frames)))
+    pygame.display.quit()
+    pygame.display.init()
+
+    try:
+        texture = TextureBackend(size)
+        label = "texture"
+    except Exception as e:
+        print(f"No accelerated renderer ({e}); timing SDL's software renderer")
+        texture = TextureBackend(size, accelerated=False)
+        label = "texture (software)"
+    results.append((label, benchmark(texture, frames)))
+
+    print("=" * 50)
+    for label, ms in results:
+        print(f"{label:20} {ms:7.3f} ms/frame  ({1000 / ms:7.1f} fps)")
+    print("=" * 50)
+    pygame.quit()
@@ -6,11 +6,47 @@ Foundation for all vertical demo scenes
 
 import pygame
 import sys
+import time
 from datetime import datetime
 
+from input_map import KeyMap, apply_event_filter
+from metrics import metrics
+from font_stack import FontStack
+from pacing import FramePacer
+import text_layout
+
+# Custom event posted by gesture recognition; event.gesture is "nod" or "wave"
+GESTURE_EVENT = pygame.USEREVENT + 1
+
+# Fonts shared by all scenes so switching verticals doesn't reload them
+_fonts = {}
+
+def load_font(size):
+    """Default font at a size, loaded once per process
+    
+    Returned as a FontStack so emoji and symbols fall back to fonts that
+    have them instead of drawing boxes.
+    """
+    font = _fonts.get(size)
+    if font is None:
+        metrics.cache_miss("font")
+        font = _fonts[size] = FontStack(pygame.font.Font(None, size), size)
+    else:
+        metrics.cache_hit("font")
+    return font
+
 class MotiBeamScene:
     """Base class for MotiBeam demo scenes"""
     
+    # Action -> key names; subclasses extend, deployments override (input_map)
+    key_bindings = {
+        "exit": ["escape"],
+    }
+    
+    # Safety signals (crossing arrows, evacuation flashes) are paced on
+    # precise deadlines at 60 fps and exempt from quality/power throttling
+    safety_critical = False
+    
     def __init__(self, width=1280, height=720, title="MotiBeam Demo", fullscreen=True, standalone=True):
         if standalone:
             pygame.init()
@@ -37,9 +73,42 @@ class MotiBeamScene:
             self.screen = None
         
         self.clock = pygame.time.Clock()
+        self.fps = 30
+        self.pacer = None
+        if self.safety_critical:
+            self.fps = 60
+            self.pacer = FramePacer(self.fps)
         self.running = True
         self.start_time = pygame.time.get_ticks()
         
+        # Polled once per frame before events (e.g. gestures.GestureInput)
+        self.input_sources = []
+        
+        # Polled once per frame after the frame is presented (e.g. preloading)
+        self.background_tasks = []
+        
+        # Optional latency.LatencyTracker, assigned by parent app
+        self.latency = None
+        
+        # Optional alloc_diag.AllocationTracker, assigned by parent app
+        self.allocations = None
+        
+        # Optional power.PowerGovernor, assigned by parent app
+        self.power = None
+        
+        # Optional quality.QualityGovernor, assigned by parent app; its
+        # level caps the frame rate below self.fps when the board runs hot
+        self.quality = None
+        
+        # Optional guardian.Guardian (running), assigned by parent app
+        self.guardian = None
+        
+        # Optional alerts.AlertChannel, assigned by parent app; checked
+        # every frame so an alert can take over the screen
+        self.alerts = None
+        
+        self.keymap = KeyMap.load(self.__class__.__name__, self.key_bindings)
+        
         # Common colors
         self.colors = {
             'black': (0, 0, 0),
@@ -55,39 +124,82 @@ class MotiBeamScene:
         }
         
         # Common fonts
-        self.font_huge = pygame.font.Font(None, 140)
-        self.font_large = pygame.font.Font(None, 100)
-        self.font_medium = pygame.font.Font(None, 60)
-        self.font_small = pygame.font.Font(None, 40)
+        self.font_huge = load_font(140)
+        self.font_large = load_font(100)
+        self.font_medium = load_font(60)
+        self.font_small = load_font(40)
+        
+    def get_events(self):
+        """Pull queued events, timestamping them for latency tracking"""
+        events = pygame.event.get()
+        if self.latency:
+            self.latency.ingest(events)
+        return events
         
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
+        for event in self.get_events():
+            self.handle_event(event)
+                    
+    def handle_event(self, event):
+        """Handle one event; the compositor feeds events in through here"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == GESTURE_EVENT:
+            self.on_gesture(event.gesture)
+        else:
+            action = self.keymap.lookup(event)
+            if action:
+                self.on_action(action)
+                    
+    def on_action(self, action):
+        """Handle a key map action; override in subclass to add more"""
+        if action == "exit":
+            self.running = False
+                
+    def on_gesture(self, gesture):
+        """Override in subclass to react to gestures ("nod" or "wave")"""
+        pass
                     
     def draw_header(self, title, subtitle=""):
         """Draw scene header"""
         # Title
+        title = text_layout.ellipsize(self.font_large, title, self.width - 80)
         title_surf = self.font_large.render(title, True, self.colors['cyan'])
         title_rect = title_surf.get_rect(centerx=self.width//2, top=50)
         self.screen.blit(title_surf, title_rect)
         
         # Subtitle
         if subtitle:
+            subtitle = text_layout.ellipsize(self.font_small, subtitle, self.width - 80)
             sub_surf = self.font_small.render(subtitle, True, self.colors['white'])
             sub_rect = sub_surf.get_rect(centerx=self.width//2, top=170)
             self.screen.blit(sub_surf, sub_rect)
             
     def draw_footer(self, text="Press ESC to exit"):
         """Draw scene footer"""
+        text = text_layout.ellipsize(self.font_small, text, self.width - 80)
         footer_surf = self.font_small.render(text, True, self.colors['gray'])
         footer_rect = footer_surf.get_rect(centerx=self.width//2, bottom=self.height-30)
         self.screen.blit(footer_surf, footer_rect)
         
+    def draw_text(self, text, rect, color=None, font=None, max_size=60, min_size=24,
+                  align="center", valign="top", max_lines=None, spacing=1.0):
+        """Draw wrapped text inside rect; returns the area covered
+        
+        With a font the text is wrapped (and ellipsized past max_lines);
+        without one the largest size from max_size down to min_size that
+        fits the box is used. Layout is memoized (text_layout).
+        """
+        rect = pygame.Rect(rect)
+        if color is None:
+            color = self.colors['white']
+        if font is None:
+            font, lines = text_layout.fit(text, rect.size, load_font, max_size, min_size, spacing)
+        else:
+            lines = text_layout.wrap(font, text, rect.width, max_lines)
+        return text_layout.draw_lines(self.screen, font, lines, rect, color, align, valign, spacing)
+        
     def draw_corner_markers(self, color=None):
         """Draw corner markers to verify display bounds"""
         if color is None:
@@ -102,28 +214,94 @@ class MotiBeamScene:
         """Override in subclass"""
         pass
         
+    def close(self):
+        """Release what __init__ started (threads, files); override in subclass
+        
+        For scenes that were built but never run, e.g. a preloaded
+        playlist item when the playlist ends early.
+        """
+        pass
+        
     def render(self):
         """Override in subclass"""
         self.screen.fill(self.colors['black'])
         
-    def run(self, duration=30):
-        """Main loop - runs for specified duration (seconds)"""
+    def run(self, duration=30, frames=None):
+        """Main loop - runs for specified duration (seconds)
+        
+        If frames is given the scene also ends after exactly that many
+        presented frames, for frame-exact playlist handoffs; duration still
+        bounds it when the frame rate is capped below self.fps.
+        """
         print(f"Starting {self.__class__.__name__}...")
+        apply_event_filter(self.keymap)
+        self.frames_presented = 0
+        self.timed_out = False
+        scene_name = self.__class__.__name__
+        if self.pacer:
+            self.pacer.reset()
         
         while self.running:
+            if self.alerts and self.alerts.pending():
+                paused = pygame.time.get_ticks()
+                self.alerts.preempt(self.screen, scene_name)
+                # Pick up where we left off; time under the alert doesn't count
+                self.start_time += pygame.time.get_ticks() - paused
+                apply_event_filter(self.keymap)
+                if self.pacer:
+                    self.pacer.reset()
+                self.clock.tick()
+            frame_start = time.perf_counter()
+            if self.allocations:
+                self.allocations.begin_frame(scene_name)
             # Auto-exit after duration
             elapsed = (pygame.time.get_ticks() - self.start_time) / 1000
             if elapsed > duration:
                 print(f"{duration} seconds elapsed, exiting...")
                 self.running = False
+                self.timed_out = True
                 
+            fps = self.fps
+            if self.quality and not self.safety_critical:
+                fps = min(fps, self.quality.poll().fps)
+            if self.power and not self.safety_critical:
+                self.power.poll()
+                fps = self.power.cap(fps)
+            for source in self.input_sources:
+                source.poll()
             self.handle_events()
             self.update()
+            if self.latency:
+                self.latency.mark_update()
             self.render()
+            if self.latency:
+                self.latency.mark_render()
+            if self.power and not self.safety_critical:
+                self.power.apply(self.screen)
+            waited = 0.0
+            if self.pacer:
+                wait_start = time.perf_counter()
+                waited = self.pacer.wait(self.fps) - wait_start
             pygame.display.flip()
-            self.clock.tick(30)
+            if self.latency:
+                self.latency.frame_presented(scene_name)
+            frame_end = time.perf_counter()
+            metrics.frame(scene_name, frame_end - frame_start - waited, frame_end)
+            if self.allocations:
+                self.allocations.end_frame()
+            self.frames_presented += 1
+            if frames is not None and self.frames_presented >= frames:
+                self.running = False
+            for task in self.background_tasks:
+                task.poll()
+            if not self.pacer:
+                self.clock.tick(fps)
         
+        if self.pacer:
+            self.pacer.publish(scene_name)
+            self.pacer.report(f"{scene_name} frame pacing")
         # Only quit pygame if standalone
         if self.standalone:
+            _fonts.clear()
             pygame.quit()
         print("Scene complete.")
@@ -7,13 +7,47 @@ import sys
 sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
 
 from scene_base import MotiBeamScene
+from guardian import HOME_RESIDENTS, HOME_ROOMS, HOUSEHOLD, Guardian, SimulatedHome
+from datetime import datetime
 import pygame
 import math
+import time
+
+# Without a configured guardian the scene runs its own against simulated
+# sensors, with a short threshold so the alert shows during the demo
+DEMO_THRESHOLD = 20
+
+def describe_duration(seconds):
+    """'25 seconds', '12 minutes', '2 hours'"""
+    for unit, size in (("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''}"
+    count = int(seconds)
+    return f"{count} second{'s' if count != 1 else ''}"
+
+def clock_time(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime("%I:%M %p").lstrip("0")
 
 class SecurityDemo(MotiBeamScene):
     def __init__(self, standalone=True):
         super().__init__(title="MotiBeam - Security & Guardian", standalone=standalone)
         self.pulse = 0
+        self.simulation = None
+        
+    def run(self, duration=30, frames=None):
+        if self.guardian is None:
+            # Real datagrams over loopback, from a simulated home
+            self.guardian = Guardian(HOME_ROOMS, HOME_RESIDENTS, threshold=DEMO_THRESHOLD,
+                                     address="udp:127.0.0.1:0")
+            self.background_tasks.append(self.guardian)
+            self.simulation = SimulatedHome(self.guardian.bound_address(), HOME_ROOMS).start()
+        try:
+            super().run(duration=duration, frames=frames)
+        finally:
+            if self.simulation:
+                self.simulation.stop()
+                self.guardian.stop()
         
     def update(self):
         self.pulse = (self.pulse + 0.1) % (2 * 3.14159)
@@ -22,34 +56,57 @@ class SecurityDemo(MotiBeamScene):
         self.screen.fill(self.colors['black'])
         self.draw_header("🛡️ GUARDIAN MODE ACTIVE", "Wellness & Safety Monitoring")
         
+        alert = self.guardian.active_alert() if self.guardian else None
+        if alert:
+            self.render_alert(alert)
+        else:
+            self.render_all_clear()
+        
+        self.draw_footer("Monitoring: Motion | Activity | Wellness patterns")
+        self.draw_corner_markers(self.colors['orange'] if alert else self.colors['green'])
+        
+    def render_status(self, color, symbol, headline, detail1, detail2, action, action_color):
         pulse_size = 80 + int(20 * abs(math.sin(self.pulse)))
         alert_center = (self.width // 2, 280)
-        pygame.draw.circle(self.screen, self.colors['orange'], alert_center, pulse_size, 8)
+        pygame.draw.circle(self.screen, color, alert_center, pulse_size, 8)
         
-        alert_symbol = self.font_huge.render("!", True, self.colors['orange'])
+        alert_symbol = self.font_huge.render(symbol, True, color)
         alert_rect = alert_symbol.get_rect(center=alert_center)
         self.screen.blit(alert_symbol, alert_rect)
         
-        alert_text = "INACTIVITY DETECTED"
-        alert_surf = self.font_large.render(alert_text, True, self.colors['orange'])
+        alert_surf = self.font_large.render(headline, True, color)
         alert_text_rect = alert_surf.get_rect(center=(self.width//2, 420))
         self.screen.blit(alert_surf, alert_text_rect)
         
-        detail1 = self.font_medium.render("No movement for 2 hours", True, self.colors['white'])
-        detail1_rect = detail1.get_rect(center=(self.width//2, 500))
-        self.screen.blit(detail1, detail1_rect)
+        detail1_surf = self.font_medium.render(detail1, True, self.colors['white'])
+        detail1_rect = detail1_surf.get_rect(center=(self.width//2, 500))
+        self.screen.blit(detail1_surf, detail1_rect)
         
-        detail2 = self.font_small.render("Last activity: 3:45 PM (Kitchen)", True, self.colors['gray'])
-        detail2_rect = detail2.get_rect(center=(self.width//2, 560))
-        self.screen.blit(detail2, detail2_rect)
+        detail2_surf = self.font_small.render(detail2, True, self.colors['gray'])
+        detail2_rect = detail2_surf.get_rect(center=(self.width//2, 560))
+        self.screen.blit(detail2_surf, detail2_rect)
         
-        action_text = "Guardian notified - Check on resident"
-        action_surf = self.font_medium.render(action_text, True, self.colors['cyan'])
+        action_surf = self.font_medium.render(action, True, action_color)
         action_rect = action_surf.get_rect(center=(self.width//2, 620))
         self.screen.blit(action_surf, action_rect)
         
-        self.draw_footer("Monitoring: Motion | Activity | Wellness patterns")
-        self.draw_corner_markers(self.colors['orange'])
+    def render_alert(self, alert):
+        who = "resident" if alert.resident == HOUSEHOLD else self.guardian.residents[alert.resident]
+        room = self.guardian.rooms[alert.room]
+        self.render_status(self.colors['orange'], "!", "INACTIVITY DETECTED",
+                           f"No movement for {describe_duration(time.time() - alert.since)}",
+                           f"Last activity: {clock_time(alert.since)} ({room})",
+                           f"Guardian notified - Check on {who}", self.colors['cyan'])
+        
+    def render_all_clear(self):
+        if self.guardian:
+            since, room = self.guardian.last_activity()
+            detail1 = f"Last movement {describe_duration(max(0, time.time() - since))} ago"
+            detail2 = f"Last activity: {clock_time(since)} ({room})"
+            action = f"{len(self.guardian.rooms)} rooms monitored | {self.guardian.rate:.0f} events/s"
+        else:
+            detail1, detail2, action = "Waiting for sensors", "", "Guardian offline"
+        self.render_status(self.colors['green'], "✓", "ALL CLEAR", detail1, detail2, action, self.colors['gray'])
 
 if __name__ == "__main__":
     demo = SecurityDemo(standalone=True)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Startup Timeline
+Records when each startup phase (imports, display, fonts, camera, first
+frame) starts and ends, on any thread, relative to process start.
+Stdlib only so it can be imported before pygame to time that import too.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+def process_age():
+    """Seconds since this process was exec'd (Linux), else 0"""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 is start time in clock ticks after boot; the command
+            # name (field 2) may contain spaces so split after its ')'
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+class StartupTimeline:
+    """Phases of startup as (name, thread, start, end) in seconds"""
+
+    def __init__(self):
+        self.origin = time.perf_counter() - process_age()
+        self.phases = []
+        self.marks = []
+
+    def now(self):
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def phase(self, name):
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.phases.append((name, threading.current_thread().name, start, self.now()))
+
+    def mark(self, name):
+        """Record an instant, e.g. "first frame" """
+        self.marks.append((name, self.now()))
+
+    def report(self, width=40):
+        """Print the timeline as a text Gantt chart"""
+        events = sorted(self.phases, key=lambda p: p[2])
+        end = max([p[3] for p in events] + [m[1] for m in self.marks] + [0.001])
+        scale = width / end
+        print("=" * 60)
+        print(f"Startup timeline ({end * 1000:.0f} ms since process start)")
+        for name, thread, start, stop in events:
+            offset = int(start * scale)
+            bar = "#" * max(1, int((stop - start) * scale))
+            label = name if thread == "MainThread" else f"{name} [{thread}]"
+            print(f"{start * 1000:7.0f} {(stop - start) * 1000:6.0f}ms  "
+                  f"{' ' * offset}{bar:<{width - offset}}  {label}")
+        for name, at in sorted(self.marks, key=lambda m: m[1]):
+            print(f"{at * 1000:7.0f}     --  {' ' * int(at * scale)}|  {name}")
+        print("=" * 60)
+
+
+# Shared timeline for the running process
+timeline = StartupTimeline()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Text Layout
+Word-wrapping, alignment, ellipsis and auto-fit for text on the 1280px
+projection. Measurements (font.size) and line breaks are memoized, so
+laying out unchanged text again costs dictionary lookups per frame.
+"""
+
+import pygame
+
+ELLIPSIS = "..."
+
+# Bounded memo tables; cleared wholesale when full (text on screen
+# changes slowly, so a full table means stale entries, not a hot set)
+MAX_ENTRIES = 4096
+_sizes = {}
+_layouts = {}
+_fits = {}
+
+
+def _remember(table, key, value):
+    if len(table) >= MAX_ENTRIES:
+        table.clear()
+    table[key] = value
+    return value
+
+
+def text_size(font, text):
+    """font.size(text), memoized per font"""
+    key = (font, text)
+    size = _sizes.get(key)
+    if size is None:
+        size = _remember(_sizes, key, font.size(text))
+    return size
+
+
+def text_width(font, text):
+    return text_size(font, text)[0]
+
+
+def _longest_prefix(font, text, width, suffix=""):
+    """Length of the longest prefix of text that fits with suffix appended"""
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if text_width(font, text[:mid] + suffix) <= width:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def ellipsize(font, text, width, ellipsis=ELLIPSIS):
+    """text, cut short with an ellipsis if it is wider than width"""
+    if text_width(font, text) <= width:
+        return text
+    keep = _longest_prefix(font, text, width, ellipsis)
+    return text[:keep].rstrip() + ellipsis
+
+
+def _wrap_paragraph(font, paragraph, width):
+    lines = []
+    line = ""
+    for word in paragraph.split(" "):
+        candidate = f"{line} {word}" if line else word
+        if text_width(font, candidate) <= width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        # A single word wider than the box is broken between characters
+        while text_width(font, word) > width:
+            cut = max(1, _longest_prefix(font, word, width))
+            lines.append(word[:cut])
+            word = word[cut:]
+        line = word
+    lines.append(line)
+    return lines
+
+
+def wrap(font, text, width, max_lines=None):
+    """Lines of text word-wrapped to width (memoized)
+
+    Explicit newlines start new lines. With max_lines, the last line kept
+    ends in an ellipsis if text was cut.
+    """
+    key = (font, text, width, max_lines)
+    lines = _layouts.get(key)
+    if lines is not None:
+        return lines
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(_wrap_paragraph(font, paragraph, width))
+    if max_lines is not None and len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        keep = _longest_prefix(font, last, width, ELLIPSIS)
+        lines[-1] = last[:keep].rstrip() + ELLIPSIS
+    return _remember(_layouts, key, tuple(lines))
+
+
+def line_height(font, spacing=1.0):
+    return int(font.get_linesize() * spacing)
+
+
+def fit(text, size, font_for, max_size, min_size=16, spacing=1.0, step=2):
+    """Largest font (and its lines) that fits text in a box (memoized)
+
+    font_for(size) returns a font, e.g. scene_base.load_font. If even
+    min_size doesn't fit, the text is wrapped at min_size and ellipsized
+    to as many lines as fit.
+    """
+    width, height = size
+    key = (text, width, height, font_for, max_size, min_size, spacing, step)
+    result = _fits.get(key)
+    if result is not None:
+        return result
+    for font_size in range(max_size, min_size - 1, -step):
+        font = font_for(font_size)
+        lines = wrap(font, text, width)
+        if len(lines) * line_height(font, spacing) <= height:
+            return _remember(_fits, key, (font, lines))
+    font = font_for(min_size)
+    max_lines = max(1, height // line_height(font, spacing))
+    return _remember(_fits, key, (font, wrap(font, text, width, max_lines)))
+
+
+def draw_lines(surface, font, lines, rect, color, align="center", valign="top", spacing=1.0):
+    """Render laid-out lines into rect; returns the rect actually covered"""
+    rect = pygame.Rect(rect)
+    step = line_height(font, spacing)
+    total = step * len(lines)
+    if valign == "middle":
+        y = rect.top + (rect.height - total) // 2
+    elif valign == "bottom":
+        y = rect.bottom - total
+    else:
+        y = rect.top
+    covered = None
+    for line in lines:
+        if line:
+            image = font.render(line, True, color)
+            line_rect = image.get_rect(top=y)
+            if align == "left":
+                line_rect.left = rect.left
+            elif align == "right":
+                line_rect.right = rect.right
+            else:
+                line_rect.centerx = rect.centerx
+            surface.blit(image, line_rect)
+            covered = line_rect if covered is None else covered.union(line_rect)
+        y += step
+    return covered or pygame.Rect(rect.left, y, 0, 0)
+
+
+def cache_info():
+    return {"sizes": len(_sizes), "layouts": len(_layouts), "fits": len(_fits)}
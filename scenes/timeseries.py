@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Time Series
+Compact, array-backed storage for clinical readings: each series is a
+pair of preallocated numpy ring buffers (float64 timestamps, float32
+values), so months of per-minute vitals cost 12 bytes a sample and
+appending never allocates. Charts read through vectorized downsampling
+instead of walking samples in Python.
+
+Discrete happenings (medication taken, a walk, a blood pressure reading)
+go in an EventLog: a ring of (time, kind, two values, label id) rows
+that is formatted into text only when a row is actually displayed.
+
+Real readings come in through ClinicalStore.record_*. A store filled by
+demo_history() is synthetic: only what was recorded on top of it is
+ever saved, so demo data never comes back as a patient's history.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import os
+import threading
+import time
+
+import numpy as np
+
+CLINICAL_DATA = os.path.expanduser("~/.motibeam/clinical.npz")
+CLINICAL_FORMAT = 2  # saves without it predate synthetic tracking and may hold demo data
+
+DAY = 86400.0
+
+
+class Series:
+    """Fixed-capacity ring of (timestamp, value) samples in time order
+
+    Samples must be appended in non-decreasing time; once full, the
+    oldest samples are overwritten.
+    """
+
+    def __init__(self, capacity, dtype=np.float32):
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=dtype)
+        self.start = 0  # index of the oldest sample
+        self.count = 0
+        self.version = 0  # bumped on every change, for caching derived data
+
+    def __len__(self):
+        return self.count
+
+    def append(self, t, value):
+        end = (self.start + self.count) % self.capacity
+        self.times[end] = t
+        self.values[end] = value
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+        self.version += 1
+
+    def extend(self, times, values):
+        """Append many samples at once (vectorized)"""
+        times = np.asarray(times, dtype=np.float64)[-self.capacity:]
+        values = np.asarray(values)[-self.capacity:]
+        n = len(times)
+        if n == 0:
+            return
+        end = (self.start + self.count) % self.capacity
+        first = min(n, self.capacity - end)
+        self.times[end:end + first] = times[:first]
+        self.values[end:end + first] = values[:first]
+        self.times[:n - first] = times[first:]
+        self.values[:n - first] = values[first:]
+        overflow = max(0, self.count + n - self.capacity)
+        self.count = min(self.capacity, self.count + n)
+        self.start = (self.start + overflow) % self.capacity
+        self.version += 1
+
+    def _segments(self):
+        """The ring as up to two (times, values) views, oldest first"""
+        end = self.start + self.count
+        if end <= self.capacity:
+            return [(self.times[self.start:end], self.values[self.start:end])]
+        end -= self.capacity
+        return [(self.times[self.start:], self.values[self.start:]),
+                (self.times[:end], self.values[:end])]
+
+    def window(self, start, end):
+        """(times, values) of samples with start <= t < end"""
+        parts = []
+        for times, values in self._segments():
+            lo, hi = np.searchsorted(times, (start, end))
+            if hi > lo:
+                parts.append((times[lo:hi], values[lo:hi]))
+        if not parts:
+            return self.times[:0], self.values[:0]
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def last(self, default=None):
+        if not self.count:
+            return default
+        return self.values[(self.start + self.count - 1) % self.capacity].item()
+
+    def total(self, start, end):
+        return float(self.window(start, end)[1].sum(dtype=np.float64))
+
+    def downsample(self, start, end, buckets, how="mean"):
+        """One value per equal-width time bucket, NaN where a bucket is empty
+
+        how is "mean", "max", "min" or "sum".
+        """
+        times, values = self.window(start, end)
+        out = np.full(buckets, np.nan, dtype=np.float32)
+        if not len(times):
+            return out
+        edges = np.linspace(start, end, buckets + 1)
+        cuts = np.searchsorted(times, edges)
+        counts = np.diff(cuts)
+        filled = counts > 0
+        # Samples are sorted, so each filled bucket is a contiguous slice
+        # and reduceat does the whole chart in one pass
+        first = cuts[:-1][filled]
+        if how == "mean":
+            out[filled] = np.add.reduceat(values, first, dtype=np.float64) / counts[filled]
+        elif how == "sum":
+            out[filled] = np.add.reduceat(values, first, dtype=np.float64)
+        elif how == "max":
+            out[filled] = np.maximum.reduceat(values, first)
+        elif how == "min":
+            out[filled] = np.minimum.reduceat(values, first)
+        else:
+            raise ValueError(f"Unknown downsample: {how}")
+        return out
+
+    def state(self, prefix):
+        """Arrays for np.savez, oldest first"""
+        times, values = self.window(-np.inf, np.inf)
+        return {f"{prefix}.t": times, f"{prefix}.v": values}
+
+
+class EventLog:
+    """Ring of discrete events; text is built only for rows on screen"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.rows = np.zeros(capacity, dtype=[("t", "f8"), ("kind", "u1"), ("a", "f4"),
+                                               ("b", "f4"), ("label", "u2")])
+        self.labels = []  # label id -> string, interned
+        self._label_ids = {}
+        self.start = 0
+        self.count = 0
+        self.added = 0  # events ever added; gives rows a stable sequence number
+        self.version = 0
+
+    def __len__(self):
+        return self.count
+
+    def label_id(self, text):
+        label = self._label_ids.get(text)
+        if label is None:
+            label = self._label_ids[text] = len(self.labels)
+            self.labels.append(text)
+        return label
+
+    def add(self, t, kind, a=0.0, b=0.0, label=""):
+        end = (self.start + self.count) % self.capacity
+        self.rows[end] = (t, kind, a, b, self.label_id(label))
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+        self.added += 1
+        self.version += 1
+
+    def recent(self, index):
+        """The index-th most recent event (0 = newest) as a numpy record"""
+        return self.rows[(self.start + self.count - 1 - index) % self.capacity]
+
+    def sequence(self, index):
+        """Stable id of the index-th most recent event, for caching its row"""
+        return self.added - 1 - index
+
+    def state(self, prefix):
+        order = (self.start + np.arange(self.count)) % self.capacity
+        return {f"{prefix}.rows": self.rows[order], f"{prefix}.labels": np.array(self.labels, dtype=str)}
+
+
+# Event kinds
+MEDICATION, WALK, BLOOD_PRESSURE, HYDRATION = range(4)
+
+
+class ClinicalStore:
+    """Vitals, activity series and the event log for the clinical vertical"""
+
+    def __init__(self, days=90):
+        minutes = int(days * 24 * 60)
+        self.heart_rate = Series(minutes)   # bpm, one reading a minute
+        self.steps = Series(minutes)        # steps per minute
+        self.hydration = Series(days * 24)  # glasses, one sample per drink
+        self.events = EventLog(days * 48)
+        self.days = days
+        self.recorded = None  # real readings alone, once demo_history() has run
+        self._saver = None
+
+    def series(self):
+        return {"heart_rate": self.heart_rate, "steps": self.steps, "hydration": self.hydration}
+
+    @property
+    def synthetic(self):
+        return self.recorded is not None
+
+    def empty(self):
+        return not len(self.events) and not any(len(s) for s in self.series().values())
+
+    def record_heart_rate(self, bpm, t=None):
+        t = time.time() if t is None else t
+        self.heart_rate.append(t, bpm)
+        if self.recorded:
+            self.recorded.record_heart_rate(bpm, t)
+
+    def record_steps(self, steps, t=None):
+        """Steps taken in the minute ending at t"""
+        t = time.time() if t is None else t
+        self.steps.append(t, steps)
+        if self.recorded:
+            self.recorded.record_steps(steps, t)
+
+    def record_medication(self, name, t=None):
+        t = time.time() if t is None else t
+        self.events.add(t, MEDICATION, label=name)
+        if self.recorded:
+            self.recorded.record_medication(name, t)
+
+    def record_drink(self, glasses=1, t=None):
+        t = time.time() if t is None else t
+        self.hydration.append(t, glasses)
+        self.events.add(t, HYDRATION, glasses)
+        if self.recorded:
+            self.recorded.record_drink(glasses, t)
+
+    def nbytes(self):
+        arrays = [s.times for s in self.series().values()] + [s.values for s in self.series().values()]
+        return sum(a.nbytes for a in arrays) + self.events.rows.nbytes
+
+    def snapshot(self):
+        """Copies of every array save() writes; None if there is nothing real"""
+        if self.recorded:
+            return self.recorded.snapshot()
+        if self.empty():
+            return None
+        arrays = self.events.state("events")
+        arrays["format"] = np.array(CLINICAL_FORMAT)
+        for name, series in self.series().items():
+            arrays.update(series.state(name))
+        return {name: np.array(array, copy=True) for name, array in arrays.items()}
+
+    def save(self, path=CLINICAL_DATA):
+        """Write everything to path, after any save_async() still running"""
+        if self._saver:
+            self._saver.join()
+        self._write(path, self.snapshot())
+
+    def _write(self, path, arrays):
+        if arrays is None:
+            return
+        # Replace atomically: a crash mid-write keeps the previous save
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp, path)
+
+    def save_async(self, path=CLINICAL_DATA):
+        """save() a snapshot taken now on a background thread"""
+        arrays = self.snapshot()
+        previous = self._saver
+
+        def save_after_previous():
+            if previous:
+                previous.join()
+            self._write(path, arrays)
+
+        self._saver = threading.Thread(target=save_after_previous, name="clinical-save", daemon=True)
+        self._saver.start()
+
+    def load(self, path=CLINICAL_DATA):
+        """Replace contents with a save(); False if there is none"""
+        try:
+            data = np.load(path)
+        except (OSError, ValueError):
+            return False
+        if "format" not in data.files or data["format"] < CLINICAL_FORMAT:
+            print(f"⚠️  Ignoring {path}: saved before demo data was kept out of it")
+            return False
+        for name, series in self.series().items():
+            series.extend(data[f"{name}.t"], data[f"{name}.v"])
+        labels = [str(label) for label in data["events.labels"]]
+        for row in data["events.rows"]:
+            self.events.add(row["t"], row["kind"], row["a"], row["b"], labels[row["label"]])
+        return True
+
+
+def demo_history(store, days=90, now=None, seed=1):
+    """Fill a store with plausible synthetic history (vectorized)
+
+    The store becomes synthetic: from here on save() writes only what is
+    recorded through its record_* methods.
+    """
+    store.recorded = ClinicalStore(store.days)
+    now = time.time() if now is None else now
+    rng = np.random.default_rng(seed)
+    minutes = int(days * 24 * 60)
+    times = now - DAY * days + 60.0 * np.arange(minutes)
+    hour = (times % DAY) / 3600.0
+    awake = (hour > 7) & (hour < 22)
+    store.heart_rate.extend(times, np.where(awake, 72, 58) + rng.normal(0, 4, minutes))
+    walking = awake & (rng.random(minutes) < 0.08)
+    store.steps.extend(times, np.where(walking, rng.integers(60, 120, minutes), 0))
+
+    today = now - now % DAY
+    for day in range(days, -1, -1):
+        midnight = today - day * DAY
+        events = [(midnight + hour * 3600 + rng.integers(0, 1800), MEDICATION, 0, 0, name)
+                  for hour, name in ((8, "Morning Vitamins"), (12, "Blood Pressure Med"),
+                                     (18, "Evening Supplement"))]
+        events.append((midnight + 10.5 * 3600, WALK, int(rng.integers(10, 40)), 0, ""))
+        events.append((midnight + 12.2 * 3600, BLOOD_PRESSURE,
+                       int(rng.normal(118, 5)), int(rng.normal(76, 4)), ""))
+        events += [(midnight + hour * 3600, HYDRATION, 1, 0, "")
+                   for hour in rng.uniform(7, 21, int(rng.integers(5, 9)))]
+        for t, kind, a, b, label in sorted(events):
+            if t > now:
+                break
+            if kind == HYDRATION:
+                store.hydration.append(t, a)
+            store.events.add(t, kind, a, b, label)
+    return store
+
+
+if __name__ == "__main__":
+    # Benchmark: python3 timeseries.py [days]
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    now = time.time()
+    start = time.perf_counter()
+    store = demo_history(ClinicalStore(days), days, now)
+    print(f"{days} days generated in {time.perf_counter() - start:.2f}s: "
+          f"{len(store.heart_rate)} heart rate samples, {len(store.events)} events, "
+          f"{store.nbytes() / 1e6:.1f}MB")
+
+    def bench(name, fn, n=200):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn()
+        print(f"{name:36} {(time.perf_counter() - start) / n * 1e6:8.1f} us")
+
+    hr = store.heart_rate
+    bench("append", lambda: hr.append(now, 70), n=10000)
+    bench("downsample 24h -> 96 (mean)", lambda: hr.downsample(now - DAY, now, 96))
+    bench("downsample 30d -> 120 (max)", lambda: hr.downsample(now - 30 * DAY, now, 120, "max"))
+    def python_loop():
+        times, values = hr.window(now - 30 * DAY, now)
+        times, values = times.tolist(), values.tolist()
+        width = 30 * DAY / 120
+        out = [None] * 120
+        for t, v in zip(times, values):
+            i = int((t - (now - 30 * DAY)) / width)
+            out[i] = v if out[i] is None else max(out[i], v)
+        return out
+    bench("downsample 30d -> 120, Python loop", python_loop, n=5)
+    bench("steps today (sum)", lambda: store.steps.total(now - now % DAY, now))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Scene Transitions
+Cross-fades from a snapshot of the outgoing frame to the incoming scene's
+first frame. The incoming scene is built in the background while the
+snapshot stays on screen, so no frame is blank or blocks on setup.
+"""
+
+import threading
+
+import pygame
+
+
+def snapshot(screen):
+    """Copy of the current display contents"""
+    return screen.copy()
+
+
+def render_offscreen(scene, screen):
+    """Render one frame of a scene into a display-format surface"""
+    surface = pygame.Surface(screen.get_size()).convert(screen)
+    scene.screen = surface
+    scene.render()
+    scene.screen = screen
+    return surface
+
+
+class SceneBuilder:
+    """Constructs a scene on a worker thread
+
+    factory() must not touch the display; scenes built with
+    standalone=False only load fonts and data.
+    """
+
+    def __init__(self, factory):
+        self._result = {}
+        self._thread = threading.Thread(target=self._build, args=(factory,), daemon=True)
+        self._thread.start()
+
+    def _build(self, factory):
+        try:
+            self._result['scene'] = factory()
+        except Exception as e:
+            self._result['error'] = e
+
+    def ready(self):
+        return not self._thread.is_alive()
+
+    def scene(self):
+        """Wait for and return the built scene"""
+        self._thread.join()
+        if 'error' in self._result:
+            raise self._result['error']
+        return self._result['scene']
+
+
+class SceneTransition:
+    """Builds the next scene behind a cross-fade"""
+
+    def __init__(self, screen, clock, duration=0.4, fps=30, dim=0.6):
+        self.screen = screen
+        self.clock = clock
+        self.duration = duration
+        self.fps = fps
+        self.dim = dim  # brightness of the held frame while loading
+        self.last_setup_ms = 0
+        self.last_frames = 0
+
+    def frames(self):
+        """Number of frames a cross-fade takes"""
+        return max(1, int(self.duration * self.fps)) if self.duration > 0 else 0
+
+    def _present(self):
+        pygame.display.flip()
+        self.clock.tick(self.fps)
+        # Keep the OS from flagging the window while we hold the frame
+        pygame.event.pump()
+        self.last_frames += 1
+
+    def _held_frame(self, outgoing):
+        # Dimmed copy of the outgoing frame shown while the scene loads
+        held = outgoing.copy()
+        shade = pygame.Surface(held.get_size())
+        shade.set_alpha(int(255 * (1 - self.dim)))
+        held.blit(shade, (0, 0))
+        return held
+
+    def run(self, factory, outgoing=None):
+        """Transition to the scene returned by factory(); returns the scene"""
+        self.last_frames = 0
+        start = pygame.time.get_ticks()
+        if outgoing is None:
+            outgoing = snapshot(self.screen)
+        held = self._held_frame(outgoing)
+
+        builder = SceneBuilder(factory)
+        while not builder.ready():
+            self.screen.blit(held, (0, 0))
+            self._present()
+        scene = builder.scene()
+        self.last_setup_ms = pygame.time.get_ticks() - start
+
+        return self.crossfade(scene, outgoing=held)
+
+    def crossfade(self, scene, incoming=None, outgoing=None):
+        """Blend from outgoing to a built scene's first frame
+
+        incoming may be a frame pre-rendered earlier with render_offscreen().
+        """
+        if outgoing is None:
+            outgoing = snapshot(self.screen)
+        if incoming is None:
+            incoming = render_offscreen(scene, self.screen)
+        scene.screen = self.screen
+
+        # Surface alpha on an opaque surface is a cheap per-frame blend
+        steps = self.frames()
+        for i in range(1, steps + 1):
+            self.screen.blit(outgoing, (0, 0))
+            incoming.set_alpha(int(255 * i / steps))
+            self.screen.blit(incoming, (0, 0))
+            self._present()
+
+        # Scene timers start when it is actually on screen
+        scene.start_time = pygame.time.get_ticks()
+        return scene
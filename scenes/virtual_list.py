@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Virtual List
+A scrollable list that only lays out and renders the rows in view. Rows
+are rendered on demand by a callback and cached under a stable key, so a
+log with months of history costs the same per frame as one with four
+entries.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+from collections import OrderedDict
+
+import pygame
+
+from metrics import metrics
+
+ROW_CACHE_SIZE = 64
+
+
+class VirtualList:
+    """Scroll state plus a cache of rendered rows
+
+    draw() asks row_key(index) for a stable id (rows can shift when
+    new entries arrive at the top) and render_row(index) for a Surface
+    only for rows that are visible and not cached.
+    """
+
+    def __init__(self, row_height, cache_size=ROW_CACHE_SIZE):
+        self.row_height = row_height
+        self.cache_size = cache_size
+        self.top = 0  # index of the first visible row
+        self.rows = OrderedDict()
+
+    def page_rows(self, height):
+        return max(1, height // self.row_height)
+
+    def scroll(self, rows, count, height):
+        """Move by rows (negative = up), clamped to the list"""
+        last_top = max(0, count - self.page_rows(height))
+        self.top = min(max(0, self.top + rows), last_top)
+
+    def visible(self, count, height):
+        self.top = min(self.top, max(0, count - self.page_rows(height)))
+        return range(self.top, min(count, self.top + self.page_rows(height)))
+
+    def _row(self, index, row_key, render_row):
+        key = row_key(index)
+        image = self.rows.get(key)
+        if image is not None:
+            self.rows.move_to_end(key)
+            metrics.cache_hit("rows")
+            return image
+        metrics.cache_miss("rows")
+        image = self.rows[key] = render_row(index)
+        if len(self.rows) > self.cache_size:
+            self.rows.popitem(last=False)
+        return image
+
+    def draw(self, surface, rect, count, row_key, render_row, bar_color=(150, 150, 150)):
+        """Blit the visible rows into rect, with a scroll bar if it overflows"""
+        rect = pygame.Rect(rect)
+        rows = self.visible(count, rect.height)
+        y = rect.top
+        for index in rows:
+            surface.blit(self._row(index, row_key, render_row), (rect.left, y))
+            y += self.row_height
+        page = self.page_rows(rect.height)
+        if count > page:
+            bar_height = max(20, rect.height * page // count)
+            bar_top = rect.top + (rect.height - bar_height) * self.top // (count - page)
+            surface.fill(bar_color, (rect.right - 6, bar_top, 6, bar_height))
+        return rows
+
+    def clear(self):
+        self.rows.clear()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Vision Benchmark
+Runs the sensing pipeline against a frame source at several resolutions
+and reports frames/sec, per-stage latency and CPU use, so vision changes
+can be judged without a camera attached.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import time
+
+import cv2
+
+from frame_sources import env_activity, open_source, to_gray
+
+RESOLUTIONS = [(320, 240), (640, 480), (1280, 720)]
+
+
+def sensing_stages(with_gestures=True):
+    """[(name, fn(outputs, now))] run on every frame in order
+
+    outputs maps "frame" and each earlier stage's name to its result, so
+    gray and activity together are motibeam_os.get_sensor_data's work.
+    """
+    stages = [
+        ("gray", lambda outputs, now: to_gray(outputs["frame"])),
+        ("activity", lambda outputs, now: env_activity(outputs["gray"])),
+    ]
+    if with_gestures:
+        from gestures import GesturePipeline
+        pipeline = GesturePipeline()
+        stages.append(("gestures", lambda outputs, now: pipeline.process(outputs["frame"], now)))
+    return stages
+
+
+class StageTimes:
+    """Latency samples for one stage"""
+
+    def __init__(self):
+        self.samples = []
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def mean_ms(self):
+        return sum(self.samples) / len(self.samples) * 1000 if self.samples else 0.0
+
+    def percentile_ms(self, fraction):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000
+
+
+def run_benchmark(spec, size, frames=300, with_gestures=True):
+    """Run the pipeline over a source; returns a result dict"""
+    source = open_source(spec, size)
+    if not source.isOpened():
+        raise RuntimeError(f"Cannot open frame source {spec}")
+    stages = sensing_stages(with_gestures)
+    times = {"capture": StageTimes()}
+    times.update((name, StageTimes()) for name, _ in stages)
+
+    processed = 0
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    while processed < frames:
+        start = time.perf_counter()
+        ret, frame = source.read()
+        times["capture"].add(time.perf_counter() - start)
+        if not ret:
+            break
+        # Source time, so results don't depend on how fast we run
+        now = processed / 30.0
+        outputs = {"frame": frame}
+        for name, stage in stages:
+            start = time.perf_counter()
+            outputs[name] = stage(outputs, now)
+            times[name].add(time.perf_counter() - start)
+        processed += 1
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    source.release()
+
+    return {
+        "source": spec,
+        "size": size,
+        "frames": processed,
+        "fps": processed / wall if wall else 0.0,
+        "cpu_percent": 100.0 * cpu / wall if wall else 0.0,
+        "stages": times,
+    }
+
+
+def print_results(results):
+    print("=" * 72)
+    print(f"{'source':14} {'size':>9} {'frames':>6} {'fps':>8} {'cpu%':>6}")
+    for result in results:
+        size = "x".join(map(str, result["size"]))
+        print(f"{result['source'][:14]:14} {size:>9} {result['frames']:6d} "
+              f"{result['fps']:8.1f} {result['cpu_percent']:6.1f}")
+        for name, stage in result["stages"].items():
+            print(f"{'':16}{name:10} mean {stage.mean_ms():7.3f} ms  "
+                  f"p95 {stage.percentile_ms(0.95):7.3f} ms")
+    print("=" * 72)
+    print("cpu% is process CPU time over wall time (100% = one core busy)")
+
+
+if __name__ == "__main__":
+    # python3 vision_bench.py [source spec] [frames] [--no-gestures]
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    spec = args[0] if args else "synthetic"
+    frames = int(args[1]) if len(args) > 1 else 300
+    with_gestures = "--no-gestures" not in sys.argv
+
+    cv2.setNumThreads(1)  # match the single core the Pi can spare
+    results = [run_benchmark(spec, size, frames, with_gestures) for size in RESOLUTIONS]
+    print_results(results)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+MotiBeam Zone Engine
+Polygonal floor zones and the people and vehicles moving through them.
+Zones are bucketed into a uniform grid, so each tracked point is only
+tested against the few zones whose bounding boxes share its cell. The
+whole frame's points are tested at once with numpy: candidate
+(point, zone) pairs come from the grid, every pair is expanded to its
+zone's edges, and a crossing-number parity gives containment.
+
+ZoneTracker turns successive frames of positions into entry and exit
+events. Coordinates are floor metres.
+"""
+
+import sys
+sys.path.insert(0, '/home/motibeam/MotiBeam-OS/scenes')
+
+import time
+from collections import deque
+
+import numpy as np
+
+# Zone kinds
+SAFE, FORKLIFT, RESTRICTED, DOCK = "safe", "forklift", "restricted", "dock"
+
+
+class Zone:
+    """A named simple polygon on the floor"""
+
+    def __init__(self, name, polygon, kind=SAFE):
+        self.name = name
+        self.kind = kind
+        self.polygon = [(float(x), float(y)) for x, y in polygon]
+        xs, ys = zip(*self.polygon)
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+
+def _ranges(starts, counts):
+    """Concatenated arange(start, start + count) for each pair (vectorized)"""
+    total = int(counts.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total)
+
+
+class ZoneIndex:
+    """Zones bucketed into a uniform grid over the floor"""
+
+    def __init__(self, zones, size, cell=2.0):
+        self.zones = list(zones)
+        self.size = size
+        self.cell = cell
+        self.cols = max(1, int(np.ceil(size[0] / cell)))
+        self.rows = max(1, int(np.ceil(size[1] / cell)))
+
+        # Every polygon's edges in flat arrays; zone i owns
+        # edges[edge_start[i]:edge_start[i] + edge_count[i]]
+        polygons = [np.array(zone.polygon).reshape(-1, 2) for zone in self.zones]
+        self.edge_count = np.array([len(p) for p in polygons], dtype=np.int64)
+        self.edge_start = np.cumsum(self.edge_count) - self.edge_count
+        starts = np.concatenate(polygons or [np.zeros((0, 2))])
+        ends = np.concatenate([np.roll(p, -1, axis=0) for p in polygons] or [np.zeros((0, 2))])
+        self.x1, self.y1 = starts[:, 0], starts[:, 1]
+        self.x2, self.y2 = ends[:, 0], ends[:, 1]
+        self.bboxes = np.array([zone.bbox for zone in self.zones]).reshape(-1, 4)
+
+        # Grid as CSR: cell c holds cell_zones[cell_start[c]:cell_start[c + 1]]
+        buckets = [[] for _ in range(self.cols * self.rows)]
+        for i, (left, top, right, bottom) in enumerate(self.bboxes):
+            c0, r0 = self._cell(left, top)
+            c1, r1 = self._cell(right, bottom)
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    buckets[row * self.cols + col].append(i)
+        self.cell_start = np.zeros(len(buckets) + 1, dtype=np.int64)
+        self.cell_start[1:] = np.cumsum([len(b) for b in buckets])
+        self.cell_zones = np.array([i for b in buckets for i in b], dtype=np.int64)
+
+    def _cell(self, x, y):
+        col = min(self.cols - 1, max(0, int(x // self.cell)))
+        row = min(self.rows - 1, max(0, int(y // self.cell)))
+        return col, row
+
+    def candidates(self, points):
+        """(point index, zone index) pairs whose cell and bbox match"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        px, py = points[:, 0], points[:, 1]
+        on_floor = (px >= 0) & (py >= 0) & (px < self.size[0]) & (py < self.size[1])
+        index = np.flatnonzero(on_floor)
+        cells = ((py[index] // self.cell).astype(np.int64) * self.cols
+                 + (px[index] // self.cell).astype(np.int64))
+        counts = self.cell_start[cells + 1] - self.cell_start[cells]
+        pair_point = np.repeat(index, counts)
+        pair_zone = self.cell_zones[_ranges(self.cell_start[cells], counts)]
+        box = self.bboxes[pair_zone]
+        x, y = px[pair_point], py[pair_point]
+        keep = (x >= box[:, 0]) & (x <= box[:, 2]) & (y >= box[:, 1]) & (y <= box[:, 3])
+        return pair_point[keep], pair_zone[keep]
+
+    def contains(self, points, pair_point, pair_zone):
+        """Mask of the pairs whose point is inside the zone's polygon"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        counts = self.edge_count[pair_zone]
+        edge = _ranges(self.edge_start[pair_zone], counts)
+        owner = np.repeat(np.arange(len(pair_zone)), counts)
+        px, py = points[pair_point[owner], 0], points[pair_point[owner], 1]
+        x1, y1, x2, y2 = self.x1[edge], self.y1[edge], self.x2[edge], self.y2[edge]
+        spans = (y1 > py) != (y2 > py)
+        # Where the edge crosses the point's row (only used where spans)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross_x = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        crossings = np.bincount(owner, weights=spans & (px < cross_x), minlength=len(pair_zone))
+        return crossings % 2 == 1
+
+    def locate(self, points):
+        """(point index, zone index) for every point inside every zone"""
+        pair_point, pair_zone = self.candidates(points)
+        inside = self.contains(points, pair_point, pair_zone)
+        return pair_point[inside], pair_zone[inside]
+
+    def locate_all(self, points):
+        """locate() without the grid: every point against every zone"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        pair_point = np.repeat(np.arange(len(points)), len(self.zones))
+        pair_zone = np.tile(np.arange(len(self.zones)), len(points))
+        inside = self.contains(points, pair_point, pair_zone)
+        return pair_point[inside], pair_zone[inside]
+
+    def zones_at(self, x, y):
+        _, zones = self.locate([(x, y)])
+        return [self.zones[i] for i in zones]
+
+
+class ZoneEvent:
+    __slots__ = ('kind', 'track', 'zone', 'time')
+
+    def __init__(self, kind, track, zone, time):
+        self.kind = kind  # "enter" or "exit"
+        self.track = track
+        self.zone = zone
+        self.time = time
+
+
+class ZoneTracker:
+    """Per-frame zone membership of tracks, reported as entry/exit events"""
+
+    def __init__(self, index, history=64):
+        self.index = index
+        self.inside = np.zeros(0, dtype=np.int64)  # sorted track * Z + zone keys
+        self.occupancy = np.zeros(len(index.zones), dtype=np.int64)
+        self.events = deque(maxlen=history)  # most recent last
+
+    def update(self, track_ids, points, now=None):
+        """Locate tracks; returns this frame's new ZoneEvents"""
+        now = time.time() if now is None else now
+        track_ids = np.asarray(track_ids, dtype=np.int64)
+        pair_point, pair_zone = self.index.locate(points)
+        zone_count = len(self.index.zones)
+        inside = np.unique(track_ids[pair_point] * zone_count + pair_zone)
+        self.occupancy = np.bincount(pair_zone, minlength=zone_count)
+        events = []
+        for kind, keys in (("exit", np.setdiff1d(self.inside, inside, assume_unique=True)),
+                           ("enter", np.setdiff1d(inside, self.inside, assume_unique=True))):
+            for key in keys.tolist():
+                events.append(ZoneEvent(kind, key // zone_count, self.index.zones[key % zone_count], now))
+        self.inside = inside
+        self.events.extend(events)
+        return events
+
+    def tracks_in(self, zone_index):
+        zone_count = len(self.index.zones)
+        return (self.inside[self.inside % zone_count == zone_index] // zone_count).tolist()
+
+
+class SimulatedTracks:
+    """People and forklifts wandering the floor, for the demo and benchmark"""
+
+    def __init__(self, count, size, speed=1.4, seed=1):
+        self.size = np.array(size, dtype=np.float64)
+        self.rng = np.random.default_rng(seed)
+        self.ids = np.arange(count)
+        self.positions = self.rng.random((count, 2)) * self.size
+        angles = self.rng.random(count) * 2 * np.pi
+        speeds = speed * (0.5 + self.rng.random(count))
+        self.velocities = np.stack([np.cos(angles), np.sin(angles)], axis=1) * speeds[:, None]
+
+    def step(self, dt):
+        # Wander: small random turns, bounce off the walls
+        turn = self.rng.normal(0, 0.3 * dt, len(self.ids))
+        cos, sin = np.cos(turn), np.sin(turn)
+        vx, vy = self.velocities[:, 0].copy(), self.velocities[:, 1]
+        self.velocities[:, 0] = vx * cos - vy * sin
+        self.velocities[:, 1] = vx * sin + vy * cos
+        self.positions += self.velocities * dt
+        low, high = self.positions < 0, self.positions > self.size
+        self.velocities[low | high] *= -1
+        np.clip(self.positions, 0, self.size - 1e-6, out=self.positions)
+        return self.positions
+
+
+def warehouse_zones(size=(60.0, 30.0)):
+    """A warehouse floor: rack rows, forklift lanes, walkways and docks"""
+    width, height = size
+    zones = [
+        Zone("LOADING DOCK", [(0, 0), (14, 0), (12, 6), (2, 6)], DOCK),
+        Zone("SAFE WALKWAY", [(0, height - 4), (width, height - 4), (width, height), (0, height)], SAFE),
+        Zone("BREAK AREA", [(width - 10, 0), (width, 0), (width, 8), (width - 4, 8), (width - 4, 4),
+                            (width - 10, 4)], SAFE),
+        Zone("CHARGING", [(16, 0), (24, 0), (20, 5)], RESTRICTED),
+    ]
+    for i in range(5):
+        x = 6 + i * 10
+        zones.append(Zone(f"FORKLIFT LANE {i + 1}", [(x, 8), (x + 4, 8), (x + 4, height - 5), (x, height - 5)],
+                          FORKLIFT))
+        zones.append(Zone(f"RACK {chr(65 + i)}", [(x + 5, 9), (x + 9, 9), (x + 9, height - 6), (x + 5, height - 6)],
+                          RESTRICTED))
+    return zones
+
+
+def random_zones(count, size, rng, radius=(1.0, 4.0)):
+    """count random star-shaped polygons (5-9 vertices) scattered on the floor"""
+    zones = []
+    for i in range(count):
+        center = rng.random(2) * size
+        sides = int(rng.integers(5, 10))
+        angles = np.sort(rng.random(sides)) * 2 * np.pi
+        radii = rng.uniform(*radius, sides)
+        points = center + np.stack([np.cos(angles), np.sin(angles)], axis=1) * radii[:, None]
+        zones.append(Zone(f"Z{i}", np.clip(points, 0, np.array(size) - 1e-6), FORKLIFT))
+    return zones
+
+
+if __name__ == "__main__":
+    # Benchmark: python3 zones.py [frames]
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    size = (200.0, 100.0)
+    rng = np.random.default_rng(7)
+
+    print("=" * 72)
+    print(f"{'zones':>6} {'tracks':>7} {'grid ms':>9} {'all-pairs ms':>13} {'pairs tested':>13} {'events/frame':>13}")
+    for zone_count in (50, 200, 800):
+        index = ZoneIndex(random_zones(zone_count, size, rng), size, cell=4.0)
+        for track_count in (100, 1000, 5000):
+            tracks = SimulatedTracks(track_count, size)
+            tracker = ZoneTracker(index)
+            tracker.update(tracks.ids, tracks.positions)
+            start = time.perf_counter()
+            events = 0
+            for _ in range(frames):
+                events += len(tracker.update(tracks.ids, tracks.step(1 / 30)))
+            grid_ms = (time.perf_counter() - start) / frames * 1000
+            pairs = len(index.candidates(tracks.positions)[0])
+
+            # Same kernel without the index, on a bounded sample of frames
+            brute_frames = max(1, min(frames, 2_000_000 // (zone_count * track_count)))
+            start = time.perf_counter()
+            for _ in range(brute_frames):
+                found = index.locate_all(tracks.positions)
+            all_ms = (time.perf_counter() - start) / brute_frames * 1000
+            assert sorted(zip(*map(np.ndarray.tolist, found))) == \
+                sorted(zip(*map(np.ndarray.tolist, index.locate(tracks.positions))))
+            print(f"{zone_count:6d} {track_count:7d} {grid_ms:9.2f} {all_ms:13.2f} "
+                  f"{pairs:13d} {events / frames:13.1f}")
+    print("=" * 72)